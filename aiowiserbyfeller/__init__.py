@@ -2,13 +2,21 @@
 
 from .api import WiserByFellerAPI
 from .auth import Auth
-from .button import Button
-from .device import Device
+from .button import Button, ButtonLedRenderer, LedState
+from .codec import JsonCodec
+from .device import (
+    Device,
+    DeviceInventory,
+    InventoryStats,
+    StatusUpdateResult,
+    status_data,
+)
 from .errors import (
     AiowiserbyfellerException,
     AuthorizationFailed,
     InvalidArgument,
     NoButtonPressed,
+    StateNotReached,
     TokenMissing,
     UnauthorizedUser,
     UnsuccessfulRequest,
@@ -16,8 +24,22 @@ from .errors import (
 )
 from .group_ctrl import GroupCtrl
 from .hvac import HvacGroup
-from .job import Job
-from .load import Dali, DaliRgbw, DaliTw, Dim, Hvac, Load, Motor, OnOff
+from .identity_map import IdentityMap
+from .job import Job, JobCompiler
+from .load import (
+    Dali,
+    DaliRgbw,
+    DaliTw,
+    Dim,
+    Hvac,
+    Load,
+    Motor,
+    OnOff,
+    TargetStatesResult,
+)
+from .model_registry import MODEL_REGISTRY, ModelRegistry
+from .request_scheduler import RequestPriority, RequestScheduler
+from .response_cache import ResponseCache
 from .scene import Scene
 from .scheduler import Scheduler
 from .sensor import (
@@ -32,43 +54,76 @@ from .sensor import (
     Window,
 )
 from .smart_button import SmartButton
+from .snapshot import (
+    ReconcileResult,
+    SiteModel,
+    SiteSnapshot,
+    SyncOrchestrator,
+    SyncPhase,
+    SyncResult,
+)
+from .state import StateStore
 from .system import SystemCondition, SystemFlag
 from .time import NtpConfig
 from .timer import Timer
-from .websocket import Websocket, WebsocketWatchdog
+from .websocket import StateResync, Websocket, WebsocketWatchdog
 from .westgroup import WestGroup
+from .write_coalescer import WriteCoalescer
 
 __all__ = [
+    "MODEL_REGISTRY",
     "AiowiserbyfellerException",
     "Auth",
     "AuthorizationFailed",
     "Brightness",
     "Button",
+    "ButtonLedRenderer",
     "Co2",
     "Dali",
     "DaliRgbw",
     "DaliTw",
     "Device",
+    "DeviceInventory",
     "Dim",
     "GroupCtrl",
     "Hail",
     "Humidity",
     "Hvac",
     "HvacGroup",
+    "IdentityMap",
     "InvalidArgument",
+    "InventoryStats",
     "Job",
+    "JobCompiler",
+    "JsonCodec",
+    "LedState",
     "Load",
+    "ModelRegistry",
     "Motor",
     "NoButtonPressed",
     "NtpConfig",
     "OnOff",
     "Rain",
+    "ReconcileResult",
+    "RequestPriority",
+    "RequestScheduler",
+    "ResponseCache",
     "Scene",
     "Scheduler",
     "Sensor",
+    "SiteModel",
+    "SiteSnapshot",
     "SmartButton",
+    "StateNotReached",
+    "StateResync",
+    "StateStore",
+    "StatusUpdateResult",
+    "SyncOrchestrator",
+    "SyncPhase",
+    "SyncResult",
     "SystemCondition",
     "SystemFlag",
+    "TargetStatesResult",
     "Temperature",
     "Timer",
     "TokenMissing",
@@ -81,4 +136,6 @@ __all__ = [
     "Wind",
     "Window",
     "WiserByFellerAPI",
+    "WriteCoalescer",
+    "status_data",
 ]
@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+
+from aiohttp import ClientError
+
 from .auth import Auth
 from .button import Button
 from .const import (
@@ -10,43 +15,28 @@ from .const import (
     HTTP_METHOD_PATCH,
     HTTP_METHOD_POST,
     HTTP_METHOD_PUT,
-    LOAD_SUBTYPE_DALI_RGB,
-    LOAD_SUBTYPE_DALI_TW,
-    LOAD_SUBTYPE_NONE,
-    LOAD_TYPE_DALI,
-    LOAD_TYPE_DIM,
-    LOAD_TYPE_HVAC,
-    LOAD_TYPE_MOTOR,
-    LOAD_TYPE_ONOFF,
-    SENSOR_TYPE_BRIGHTNESS,
-    SENSOR_TYPE_CO2,
-    SENSOR_TYPE_HAIL,
-    SENSOR_TYPE_HUMIDITY,
-    SENSOR_TYPE_RAIN,
-    SENSOR_TYPE_TEMPERATURE,
-    SENSOR_TYPE_WIND,
-    SENSOR_TYPE_WINDOW,
 )
 from .device import Device
+from .device.status import DEFAULT_STATUS_CONCURRENCY, StatusUpdateResult
 from .enum import BlinkPattern
-from .errors import NoButtonPressed, UnsuccessfulRequest
+from .errors import AiowiserbyfellerException, NoButtonPressed, UnsuccessfulRequest
 from .group_ctrl import GroupCtrl
 from .hvac import HvacGroup
+from .identity_map import ENTITY_DEVICE, ENTITY_LOAD, ENTITY_SENSOR, IdentityMap
 from .job import Job
-from .load import Dali, DaliRgbw, DaliTw, Dim, Hvac, Load, Motor, OnOff
+from .load import Load
+from .load.bulk import (
+    BULK_ERRORS,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_BULK_RETRIES,
+    DEFAULT_BULK_RETRY_DELAY,
+    TargetStatesResult,
+    is_retryable,
+)
+from .model_registry import MODEL_REGISTRY, ModelRegistry
 from .scene import Scene
 from .scheduler import Scheduler
-from .sensor import (
-    Brightness,
-    Co2,
-    Hail,
-    Humidity,
-    Rain,
-    Sensor,
-    Temperature,
-    Wind,
-    Window,
-)
+from .sensor import Sensor
 from .smart_button import SmartButton
 from .system import SystemCondition, SystemFlag
 from .time import NtpConfig
@@ -63,9 +53,25 @@ class WiserByFellerAPI:
 
     # pylint: disable=too-many-public-methods
 
-    def __init__(self, auth: Auth):
-        """Initialize an api object."""
+    def __init__(
+        self,
+        auth: Auth,
+        identity_map: IdentityMap | None = None,
+        registry: ModelRegistry | None = None,
+    ):
+        """Initialize an api object.
+
+        Args:
+            auth: The Auth instance used for requests.
+            identity_map: If given, loads, sensors and devices are resolved to
+                one shared instance per id, updated by every API response.
+            registry: Model classes of the load and sensor types. Defaults to
+                the shared MODEL_REGISTRY.
+
+        """
         self.auth = auth
+        self.identity_map = identity_map
+        self.registry = registry if registry is not None else MODEL_REGISTRY
 
     # -- Device Info ---------------------------------------------------
 
@@ -326,7 +332,16 @@ class WiserByFellerAPI:
     async def async_get_loads(self) -> list[Load]:
         """Get all loads with all their properties."""
         data = await self.auth.request(HTTP_METHOD_GET, "loads")
-        return [self.resolve_class(light_data) for light_data in data]
+        return [self._resolve(ENTITY_LOAD, light_data) for light_data in data]
+
+    async def async_iter_loads(self) -> AsyncIterator[Load]:
+        """Yield all loads with all their properties while they are received.
+
+        Unlike async_get_loads(), the response is parsed incrementally, so
+        the first loads are available before the response is complete.
+        """
+        async for light_data in self.auth.stream(HTTP_METHOD_GET, "loads"):
+            yield self._resolve(ENTITY_LOAD, light_data)
 
     async def async_get_used_loads(self) -> list[Load]:
         """Get all used loads with all their properties.
@@ -342,12 +357,12 @@ class WiserByFellerAPI:
     async def async_get_load(self, load_id: int) -> Load:
         """Get one load with all its properties."""
         raw_data = await self.auth.request(HTTP_METHOD_GET, f"loads/{load_id}")
-        return self.resolve_class(raw_data)
+        return self._resolve(ENTITY_LOAD, raw_data)
 
     async def async_update_load(self, load: Load) -> Load:
         """Update an existing load on the API."""
         raw_data = await self.async_patch_load(load.id, load.raw_data)
-        return self.resolve_class(raw_data)
+        return self._resolve(ENTITY_LOAD, raw_data)
 
     async def async_patch_load(self, load_id: int, load: dict) -> dict:
         """Patch new values into an existing load."""
@@ -358,14 +373,73 @@ class WiserByFellerAPI:
 
         Note: A successful response assumes target_state as real state.
         """
-        load = Load({"id": load_id}, self.auth)
+        load = self._instance(ENTITY_LOAD, load_id, Load)
         await load.async_set_target_state(state)
 
         return load
 
+    async def async_set_target_states(
+        self,
+        states: Mapping[int | Load, dict],
+        *,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        retries: int = DEFAULT_BULK_RETRIES,
+        retry_delay: float = DEFAULT_BULK_RETRY_DELAY,
+    ) -> TargetStatesResult:
+        """Save new target states of several loads to µGateway.
+
+        At most concurrency requests are sent at the same time. Requests
+        failing with a network or server error are retried with increasing
+        delay, other errors are recorded for their load right away. If
+        the mapping is keyed by Load objects, their raw_state is updated.
+
+        Args:
+            states: Target state per load id or Load object.
+            concurrency: Maximum number of simultaneous requests.
+            retries: Number of retries per load after the first attempt.
+            retry_delay: Delay before the first retry, doubled for each
+                further retry.
+
+        Returns:
+            The confirmed state of each successful load and the error of
+            each failed one.
+
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        result = TargetStatesResult()
+
+        async def set_target_state(key: int | Load, state: dict) -> None:
+            load = (
+                key if isinstance(key, Load) else self._instance(ENTITY_LOAD, key, Load)
+            )
+
+            for attempt in range(retries + 1):
+                if attempt:
+                    await asyncio.sleep(retry_delay * 2 ** (attempt - 1))
+
+                result.attempts += 1
+                try:
+                    async with semaphore:
+                        confirmed = await load.async_set_target_state(state)
+                except BULK_ERRORS as e:
+                    result.failed[load.id] = e
+                    if is_retryable(e):
+                        continue
+                    return
+
+                result.failed.pop(load.id, None)
+                result.succeeded[load.id] = confirmed
+                return
+
+        await asyncio.gather(
+            *(set_target_state(key, state) for key, state in states.items())
+        )
+
+        return result
+
     async def async_load_ctrl(self, load_id: int, button: str, event: str) -> Load:
         """Invoke a button-event (ctrl) for one load."""
-        load = Load({"id": load_id}, self.auth)
+        load = self._instance(ENTITY_LOAD, load_id, Load)
         await load.async_ctrl(button, event)
 
         return load
@@ -374,7 +448,7 @@ class WiserByFellerAPI:
         self, load_id: int, time_ms: int, blink_pattern: BlinkPattern, color: str
     ) -> dict:
         """Get the corresponding buttons to control a load lights up."""
-        load = Load({"id": load_id}, self.auth)
+        load = self._instance(ENTITY_LOAD, load_id, Load)
         return await load.async_ping(time_ms, blink_pattern, color)
 
     async def async_get_loads_state(self) -> list[dict]:
@@ -502,7 +576,7 @@ class WiserByFellerAPI:
         """Get a list of all devices."""
         devices = await self.auth.request(HTTP_METHOD_GET, "devices")
         return [
-            Device(device_data, self.auth)
+            self._resolve(ENTITY_DEVICE, device_data, Device)
             for device_data in devices
             if device_data["id"] != "00000000"
         ]
@@ -512,14 +586,25 @@ class WiserByFellerAPI:
 
         Attention: This service takes very long time at the first call!
         Approx. 1 second per device. So with 60 devices it takes 1 minute.
+        DeviceInventory fetches devices concurrently and caches their details.
         """
         devices = await self.auth.request(HTTP_METHOD_GET, "devices/*")
         return [
-            Device(device_data, self.auth)
+            self._resolve(ENTITY_DEVICE, device_data, Device)
             for device_data in devices
             if device_data["id"] != "00000000"
         ]
 
+    async def async_iter_devices_detail(self) -> AsyncIterator[Device]:
+        """Yield all devices with all properties while they are received.
+
+        Like async_get_devices_detail(), but each device is yielded as soon
+        as its details arrived, instead of after the whole response.
+        """
+        async for device_data in self.auth.stream(HTTP_METHOD_GET, "devices/*"):
+            if device_data["id"] != "00000000":
+                yield self._resolve(ENTITY_DEVICE, device_data, Device)
+
     async def async_get_devices_info(self) -> dict:
         """General information about the connected devices."""
         return await self.auth.request(HTTP_METHOD_GET, "devices/info")
@@ -527,11 +612,14 @@ class WiserByFellerAPI:
     async def async_get_device(self, device_id: str) -> Device:
         """Get one device with all its properties."""
         raw_data = await self.auth.request(HTTP_METHOD_GET, f"devices/{device_id}")
-        return Device(raw_data, self.auth)
+        return self._resolve(ENTITY_DEVICE, raw_data, Device)
 
     async def async_delete_device(self, device_id: str) -> Device:
         """Delete an existing device."""
         raw_data = await self.auth.request(HTTP_METHOD_DELETE, f"devices/{device_id}")
+        if self.identity_map is not None:
+            self.identity_map.evict(ENTITY_DEVICE, device_id)
+
         return Device(raw_data, self.auth)
 
     async def async_ping_device(self, device_id: str) -> bool:
@@ -540,7 +628,7 @@ class WiserByFellerAPI:
         Device will light up the yellow LEDs of all buttons for a short time.
         """
 
-        device = Device({"id": device_id}, self.auth)
+        device = self._instance(ENTITY_DEVICE, device_id, Device)
         return await device.async_ping()
 
     async def async_refresh_device_properties(self, device_id: str) -> bool:
@@ -549,9 +637,55 @@ class WiserByFellerAPI:
         This is a recovery step for an edge case, see https://github.com/Feller-AG/wiser-api/issues/43 for details.
         """
 
-        device = Device({"id": device_id}, self.auth)
+        device = self._instance(ENTITY_DEVICE, device_id, Device)
         return await device.async_refresh_properties()
 
+    async def async_set_status_lights(
+        self,
+        statuses: Mapping[str | Device, Mapping[int, dict]],
+        *,
+        concurrency: int = DEFAULT_STATUS_CONCURRENCY,
+    ) -> StatusUpdateResult:
+        """Set the status lights of several devices.
+
+        Each device is updated in a single configuration session (see
+        Device.async_status_batch). Inputs that already show the requested
+        status are skipped. At most concurrency devices are updated at the
+        same time.
+
+        Args:
+            statuses: Status light data per input channel (see status_data())
+                per device id or Device object.
+            concurrency: Maximum number of devices updated simultaneously.
+
+        Returns:
+            The number of requests sent and saved, and the error per failed
+            device id.
+
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        result = StatusUpdateResult()
+
+        async def update(key: str | Device, channels: Mapping[int, dict]) -> None:
+            device = (
+                key
+                if isinstance(key, Device)
+                else self._instance(ENTITY_DEVICE, key, Device)
+            )
+            async with semaphore:
+                try:
+                    requests = await device.async_status_batch(channels)
+                except (AiowiserbyfellerException, ClientError) as e:
+                    result.failed[device.id] = e
+                    return
+
+            result.channels += len(channels)
+            result.requests += requests
+
+        await asyncio.gather(*(update(key, value) for key, value in statuses.items()))
+
+        return result
+
     async def async_get_device_config(self, device_id: str) -> dict:
         """Get a new configuration object and set the device into configuration mode."""
         return await self.auth.request(HTTP_METHOD_GET, f"devices/{device_id}/config")
@@ -1069,19 +1203,28 @@ class WiserByFellerAPI:
     async def async_get_sensors(self) -> list[Sensor]:
         """Get a list of all sensors."""
         data = await self.auth.request(HTTP_METHOD_GET, "sensors")
-        return [self.resolve_class(sensor_data) for sensor_data in data]
+        return [self._resolve(ENTITY_SENSOR, sensor_data) for sensor_data in data]
+
+    async def async_iter_sensors(self) -> AsyncIterator[Sensor]:
+        """Yield all sensors while they are received.
+
+        Unlike async_get_sensors(), the response is parsed incrementally,
+        which keeps the memory low for sensors with a long history.
+        """
+        async for sensor_data in self.auth.stream(HTTP_METHOD_GET, "sensors"):
+            yield self._resolve(ENTITY_SENSOR, sensor_data)
 
     async def async_get_sensor(self, sensor_id: int) -> Sensor:
         """Get one sensor by id with all its properties."""
         raw_data = await self.auth.request(HTTP_METHOD_GET, f"sensors/{sensor_id}")
-        return self.resolve_class(raw_data)
+        return self._resolve(ENTITY_SENSOR, raw_data)
 
     async def async_patch_sensor(self, sensor_id: int, data: dict) -> Sensor:
         """Patch new values into some properties of an existing sensor."""
         raw_data = await self.auth.request(
             HTTP_METHOD_PATCH, f"sensors/{sensor_id}", json=data
         )
-        return self.resolve_class(raw_data)
+        return self._resolve(ENTITY_SENSOR, raw_data)
 
     async def async_find_sensors(
         self, on: bool, time: int, blink_pattern: BlinkPattern, color: str
@@ -1567,35 +1710,36 @@ class WiserByFellerAPI:
 
     def resolve_class(self, data: dict):
         """Resolve this library's implementation class for given load or sensor."""
-        if data["type"] == LOAD_TYPE_ONOFF:
-            return OnOff(data, self.auth)
-        if data["type"] == LOAD_TYPE_DIM:
-            return Dim(data, self.auth)
-        if data["type"] == LOAD_TYPE_DALI and data["sub_type"] == LOAD_SUBTYPE_NONE:
-            return Dali(data, self.auth)
-        if data["type"] == LOAD_TYPE_DALI and data["sub_type"] == LOAD_SUBTYPE_DALI_TW:
-            return DaliTw(data, self.auth)
-        if data["type"] == LOAD_TYPE_DALI and data["sub_type"] == LOAD_SUBTYPE_DALI_RGB:
-            return DaliRgbw(data, self.auth)
-        if data["type"] == LOAD_TYPE_MOTOR:
-            return Motor(data, self.auth)
-        if data["type"] == LOAD_TYPE_HVAC:
-            return Hvac(data, self.auth)
-        if data["type"] == SENSOR_TYPE_BRIGHTNESS:
-            return Brightness(data, self.auth)
-        if data["type"] == SENSOR_TYPE_HAIL:
-            return Hail(data, self.auth)
-        if data["type"] == SENSOR_TYPE_RAIN:
-            return Rain(data, self.auth)
-        if data["type"] == SENSOR_TYPE_TEMPERATURE:
-            return Temperature(data, self.auth)
-        if data["type"] == SENSOR_TYPE_WIND:
-            return Wind(data, self.auth)
-        if data["type"] == SENSOR_TYPE_HUMIDITY:
-            return Humidity(data, self.auth)
-        if data["type"] == SENSOR_TYPE_CO2:
-            return Co2(data, self.auth)
-        if data["type"] == SENSOR_TYPE_WINDOW:
-            return Window(data, self.auth)
-
-        return Load(data, self.auth)
+        # Hot path when hydrating many entities: a single dict lookup.
+        cls = self.registry.resolved.get((data.get("type"), data.get("sub_type")))
+        if cls is None:
+            cls = self.registry.lookup(data)
+
+        return cls(data, self.auth)
+
+    def resolve_device(self, data: dict) -> Device:
+        """Return the device for given device data."""
+        return self._resolve(ENTITY_DEVICE, data, Device)
+
+    def model_class(self, data: dict) -> type:
+        """Return this library's implementation class for given load or sensor data."""
+        return self.registry.lookup(data)
+
+    def _resolve(self, kind: str, data: dict, cls: type | None = None):
+        """Return the model instance for data, shared if an identity map is used."""
+        cls = cls or self.model_class(data)
+        if self.identity_map is None:
+            return cls(data, self.auth)
+
+        return self.identity_map.resolve(
+            kind, data, lambda raw_data: cls(raw_data, self.auth), cls
+        )
+
+    def _instance(self, kind: str, entity_id, cls: type):
+        """Return the shared instance of an entity or a new minimal one."""
+        if self.identity_map is not None:
+            instance = self.identity_map.get(kind, entity_id)
+            if instance is not None:
+                return instance
+
+        return cls({"id": entity_id}, self.auth)
@@ -1,9 +1,13 @@
 """Wrapper for authenticated API calls."""
 
-import json
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING, Any
 
-from aiohttp import ClientSession, ContentTypeError
+from aiohttp import ClientResponse, ClientSession
 
+from .codec import DEFAULT_CODEC, JsonCodec
+from .completion import CompletionTracker
+from .const import HTTP_METHOD_GET
 from .errors import (
     AuthorizationFailed,
     InvalidJson,
@@ -11,6 +15,19 @@ from .errors import (
     UnauthorizedUser,
     UnsuccessfulRequest,
 )
+from .json_stream import DEFAULT_STREAM_CHUNK_SIZE, JsonArrayStream
+from .request_coalescer import RequestCoalescer, is_coalescable, request_key
+from .request_scheduler import (
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    RequestPriority,
+    RequestScheduler,
+    request_priority,
+)
+from .response_cache import ResponseCache
+from .write_coalescer import WriteCoalescer
+
+if TYPE_CHECKING:
+    from .websocket import Websocket
 
 
 class Auth:
@@ -23,13 +40,39 @@ class Auth:
             http: ClientSession instance to be used
             host: Hostname or IP of µGateway
             user: Username to be used for claiming token
-            kwargs: Can contain the token if applicable
+            kwargs: Can contain the token if applicable, the maximum
+                number of simultaneous requests (max_concurrent_requests),
+                an optional ResponseCache instance (cache), the window
+                in seconds for coalescing load target state writes
+                (write_coalescing_window) and the JsonCodec to use (codec,
+                the fastest installed one by default)
 
         """
         self.http = http
         self.base_url = f"http://{host}/api"
         self.host = host
         self.access_token = kwargs.get("token")
+        self.codec: JsonCodec = kwargs.get("codec") or DEFAULT_CODEC
+        self.scheduler = RequestScheduler(
+            kwargs.get("max_concurrent_requests", DEFAULT_MAX_CONCURRENT_REQUESTS)
+        )
+        self.coalescer = RequestCoalescer()
+        self.cache: ResponseCache | None = kwargs.get("cache")
+        self.completion = CompletionTracker(self)
+        self.write_coalescer: WriteCoalescer | None = None
+        if kwargs.get("write_coalescing_window") is not None:
+            self.write_coalescer = WriteCoalescer(kwargs["write_coalescing_window"])
+
+    def attach_websocket(self, websocket: "Websocket") -> None:
+        """Use the messages of a websocket connected to the same µGateway.
+
+        Commands waiting for a load state are confirmed by its state
+        messages and, if a response cache is configured, cached responses
+        are invalidated by the changes it pushes.
+        """
+        self.completion.attach(websocket)
+        if self.cache is not None:
+            websocket.subscribe(self.cache.on_websocket_message)
 
     async def claim(self, user: str, source="installer", **kwargs) -> str:
         """Get authentication token.
@@ -55,14 +98,14 @@ class Auth:
         if source is not None:
             data["source"] = source
 
+        headers = kwargs.pop("headers", {})
+        kwargs["json"] = data
+        self._encode_json(kwargs, headers)
         resp = await self.http.request(
-            "post", f"{self.base_url}/account/claim", **kwargs, json=data
+            "post", f"{self.base_url}/account/claim", **kwargs, headers=headers
         )
 
-        try:
-            parsed = await resp.json()
-        except (json.JSONDecodeError, ContentTypeError) as e:
-            raise InvalidJson from e
+        parsed = await self._decode_json(resp)
 
         if parsed["status"] != "success":
             raise AuthorizationFailed(parsed["message"])
@@ -72,30 +115,172 @@ class Auth:
         return self.access_token
 
     async def request(self, method: str, path: str, **kwargs):
-        """Send a request to the API."""
+        """Send a request to the API.
+
+        Requests are queued by the scheduler if the maximum number of
+        simultaneous requests is reached. Interactive commands are sent
+        with high priority by default, which can be overridden by passing
+        a RequestPriority as priority keyword argument.
+
+        Concurrent GET requests for the same path and parameters share
+        one underlying request, except for commands like running a job.
+        If a response cache is configured, cacheable GET requests are
+        answered from the cache and successful write requests invalidate
+        the cached responses of their resource.
+        """
         headers = kwargs.pop("headers", {})
         require_token = kwargs.pop("require_token", True)
+        priority: RequestPriority | None = kwargs.pop("priority", None)
 
         if require_token and self.access_token is None:
             raise TokenMissing
 
+        if priority is None:
+            priority = request_priority(path)
+
+        if (
+            method.lower() == HTTP_METHOD_GET
+            and not headers
+            and kwargs.keys() <= {"params"}
+            and is_coalescable(path)
+        ):
+            key = request_key(path, kwargs.get("params"), require_token)
+
+            if self.cache is None or not self.cache.is_cacheable(path):
+                return await self.coalescer.run(
+                    key, lambda: self._send(method, path, priority, headers, kwargs)
+                )
+
+            hit, data = self.cache.get(key)
+            if hit:
+                return data
+
+            generation = self.cache.generation(path)
+
+            async def send_cached():
+                data = await self._send(method, path, priority, headers, kwargs)
+                self.cache.set(key, path, data, generation)
+                return data
+
+            return await self.coalescer.run(key, send_cached)
+
+        data = await self._send(method, path, priority, headers, kwargs)
+
+        if self.cache is not None and method.lower() != HTTP_METHOD_GET:
+            self.cache.invalidate_path(path)
+
+        return data
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        priority: RequestPriority,
+        headers: dict,
+        kwargs: dict,
+    ):
+        """Send a request to the µGateway and unwrap the response data."""
         if self.access_token is not None:
             headers["authorization"] = "Bearer: " + self.access_token
+        self._encode_json(kwargs, headers)
 
-        resp = await self.http.request(
-            method,
-            f"{self.base_url}/{path}",
-            **kwargs,
-            headers=headers,
-        )
+        async with self.scheduler.slot(priority):
+            resp = await self.http.request(
+                method,
+                f"{self.base_url}/{path}",
+                **kwargs,
+                headers=headers,
+            )
+
+            resp.raise_for_status()
+            parsed = await self._decode_json(resp)
+
+        self._check_status(parsed)
+        return parsed["data"]
+
+    async def stream(self, method: str, path: str, **kwargs) -> AsyncIterator[Any]:
+        """Send a request to the API and yield the elements of its data array.
 
-        resp.raise_for_status()
+        The response is parsed while it is received, so each element is
+        yielded as soon as it is complete and the response is never held in
+        memory as a whole. Decoding a complete response this way takes a
+        little longer than with request() (about 5% for large responses),
+        as the elements are decoded one by one and always with the json
+        module. Streamed requests are neither coalesced nor cached. The
+        scheduler slot is held until the stream is exhausted or closed, so
+        iterate it without blocking.
 
+        Accepts the same keyword arguments as request() and the size of the
+        chunks read from the connection (chunk_size).
+
+        Raises:
+            InvalidJson: If the response is not an envelope with a data array.
+
+        """
+        headers = kwargs.pop("headers", {})
+        require_token = kwargs.pop("require_token", True)
+        priority: RequestPriority | None = kwargs.pop("priority", None)
+        chunk_size = kwargs.pop("chunk_size", DEFAULT_STREAM_CHUNK_SIZE)
+
+        if require_token and self.access_token is None:
+            raise TokenMissing
+
+        if priority is None:
+            priority = request_priority(path)
+
+        if self.access_token is not None:
+            headers["authorization"] = "Bearer: " + self.access_token
+        self._encode_json(kwargs, headers)
+
+        parser = JsonArrayStream()
+        async with (
+            self.scheduler.slot(priority),
+            self.http.request(
+                method,
+                f"{self.base_url}/{path}",
+                **kwargs,
+                headers=headers,
+            ) as resp,
+        ):
+            resp.raise_for_status()
+
+            try:
+                async for chunk in resp.content.iter_chunked(chunk_size):
+                    for item in parser.feed(chunk):
+                        yield item
+                remaining = parser.close()
+            except ValueError as e:
+                raise InvalidJson from e
+
+        for item in remaining:
+            yield item
+
+        self._check_status({"status": None, "message": "", **parser.envelope})
+
+        if "data" in parser.envelope:
+            # The data of the response is not an array.
+            raise InvalidJson
+
+    def _encode_json(self, kwargs: dict, headers: dict) -> None:
+        """Replace a json keyword argument by the body encoded with the codec."""
+        data = kwargs.pop("json", None)
+        if data is None:
+            return
+
+        kwargs["data"] = self.codec.dumps(data)
+        headers.setdefault("content-type", "application/json")
+
+    async def _decode_json(self, resp: ClientResponse) -> Any:
+        """Decode a response with the codec, regardless of its content type."""
+        body = await resp.read()
         try:
-            parsed = await resp.json()
-        except (json.JSONDecodeError, ContentTypeError) as e:
+            return self.codec.loads(body)
+        except ValueError as e:
             raise InvalidJson from e
 
+    @staticmethod
+    def _check_status(parsed: dict) -> None:
+        """Raise the error reported by the status of a response."""
         if parsed["status"] == "error" and "api is locked" in parsed["message"]:
             raise TokenMissing
 
@@ -105,8 +290,6 @@ class Auth:
         if parsed["status"] != "success":
             raise UnsuccessfulRequest(parsed["message"])
 
-        return parsed["data"]
-
     async def is_valid_login(self) -> bool:
         """Check if current token is valid."""
         try:
@@ -1,5 +1,6 @@
 """aiowiserbyfeller button module."""
 
 from .button import Button
+from .led import ButtonLedRenderer, LedRenderResult, LedState
 
-__all__ = ["Button"]
+__all__ = ["Button", "ButtonLedRenderer", "LedRenderResult", "LedState"]
@@ -9,6 +9,8 @@ from aiowiserbyfeller.enum import BlinkPattern
 class Button:
     """Representation of a button in the Feller Wiser µGateway API."""
 
+    __slots__ = ("__weakref__", "auth", "raw_data")
+
     def __init__(self, raw_data: dict, auth: Auth):
         """Initialize a button object."""
         self.raw_data = raw_data
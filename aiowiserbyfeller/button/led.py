@@ -0,0 +1,214 @@
+"""Diff-based rendering of button LEDs and status lights."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError
+
+from aiowiserbyfeller.device import Device
+from aiowiserbyfeller.enum import BlinkPattern
+from aiowiserbyfeller.errors import AiowiserbyfellerException
+
+from .button import Button
+
+if TYPE_CHECKING:
+    from aiowiserbyfeller.auth import Auth
+
+DEFAULT_LED_MIN_INTERVAL = 0.2
+
+
+@dataclass(frozen=True)
+class LedState:
+    """Desired state of an individual button LED."""
+
+    on: bool
+    pattern: BlinkPattern = BlinkPattern.PERMANENT
+    color: str = "#000000"
+
+
+@dataclass
+class LedRenderResult:
+    """Outcome of a render.
+
+    sent and unchanged count LEDs and status light channels, failed maps
+    button LED keys (button id, LED index) and status light keys
+    (device id, channel) to the error raised while sending them.
+    """
+
+    sent: int = 0
+    unchanged: int = 0
+    failed: dict[tuple[Any, int], Exception] = field(default_factory=dict)
+
+
+class ButtonLedRenderer:
+    """Show external information on button LEDs, sending only what changed.
+
+    The renderer remembers the state it applied to each button LED (per
+    button and LED index) and each status light (per device and input
+    channel). A render compares the desired state with the applied one and
+    only sends the differences. Requests to the same device are spaced by
+    at least min_interval seconds, different devices are updated in parallel.
+
+    The µGateway does not report LED overrides, so the renderer assumes
+    nobody else changes them. Call invalidate() if that may have happened,
+    e.g. after a device was restarted.
+
+    Usage:
+        renderer = ButtonLedRenderer(auth)
+        await renderer.async_render(
+            leds={(button, 0): LedState(True, color="#ff0000")},
+            status_lights={("00000679", 0): status_data("#ff0000", 100)},
+        )
+    """
+
+    def __init__(self, auth: Auth, *, min_interval: float = DEFAULT_LED_MIN_INTERVAL):
+        """Initialize a button LED renderer.
+
+        Args:
+            auth: The Auth instance used to send the updates.
+            min_interval: Minimum seconds between two requests to one device.
+
+        """
+        self.auth = auth
+        self._min_interval = min_interval
+        self._leds: dict[tuple[int, int], LedState] = {}
+        self._status_lights: dict[tuple[str, int], dict] = {}
+        self._locks: dict[Any, asyncio.Lock] = {}
+        self._last_sent: dict[Any, float] = {}
+
+    def applied_led(self, button_id: int, led_index: int) -> LedState | None:
+        """Return the state last applied to a button LED."""
+        return self._leds.get((button_id, led_index))
+
+    def applied_status_light(self, device_id: str, channel: int) -> dict | None:
+        """Return the status light data last applied to a device input."""
+        return self._status_lights.get((device_id, channel))
+
+    def invalidate(self, device_id: str | None = None) -> None:
+        """Forget the applied state, so the next render sends everything.
+
+        Args:
+            device_id: Only forget the status lights of this device. LED
+                states of buttons are always forgotten, as buttons given by
+                id cannot be attributed to a device.
+
+        """
+        self._leds.clear()
+        if device_id is None:
+            self._status_lights.clear()
+            return
+
+        for key in [key for key in self._status_lights if key[0] == device_id]:
+            del self._status_lights[key]
+
+    async def async_render(
+        self,
+        leds: Mapping[tuple[Button | int, int], LedState] | None = None,
+        status_lights: Mapping[tuple[str, int], dict] | None = None,
+    ) -> LedRenderResult:
+        """Send the LEDs and status lights that differ from the applied state.
+
+        Args:
+            leds: Desired state per (button or button id, LED index).
+            status_lights: Desired status light data per (device id, input
+                channel), see status_data().
+
+        """
+        result = LedRenderResult()
+        jobs: dict[Any, list[Callable[[], Awaitable[None]]]] = {}
+
+        for (button, led_index), state in (leds or {}).items():
+            if isinstance(button, Button):
+                group, button_id = button.device, button.id
+            else:
+                group, button_id = ("button", button), button
+
+            key = (button_id, led_index)
+            if self._leds.get(key) == state:
+                result.unchanged += 1
+                continue
+
+            jobs.setdefault(group, []).append(
+                self._led_job(result, key, Button({"id": button_id}, self.auth), state)
+            )
+
+        changed: dict[str, dict[int, dict]] = {}
+        for (device_id, channel), data in (status_lights or {}).items():
+            if self._status_lights.get((device_id, channel)) == data:
+                result.unchanged += 1
+                continue
+
+            changed.setdefault(device_id, {})[channel] = data
+
+        for device_id, channels in changed.items():
+            jobs.setdefault(device_id, []).append(
+                self._status_job(result, device_id, channels)
+            )
+
+        await asyncio.gather(
+            *(self._async_run_device(group, calls) for group, calls in jobs.items())
+        )
+
+        return result
+
+    def _led_job(
+        self, result: LedRenderResult, key: tuple[int, int], button: Button, state
+    ) -> Callable[[], Awaitable[None]]:
+        """Return a function sending one button LED state."""
+
+        async def send() -> None:
+            self._leds.pop(key, None)
+            try:
+                await button.async_set_led(key[1], state.on, state.pattern, state.color)
+            except (AiowiserbyfellerException, ClientError) as e:
+                result.failed[key] = e
+                return
+
+            self._leds[key] = state
+            result.sent += 1
+
+        return send
+
+    def _status_job(
+        self, result: LedRenderResult, device_id: str, channels: dict[int, dict]
+    ) -> Callable[[], Awaitable[None]]:
+        """Return a function sending the status lights of one device."""
+
+        async def send() -> None:
+            for channel in channels:
+                self._status_lights.pop((device_id, channel), None)
+
+            device = Device({"id": device_id}, self.auth)
+            try:
+                await device.async_status_batch(channels, skip_unchanged=False)
+            except (AiowiserbyfellerException, ClientError) as e:
+                for channel in channels:
+                    result.failed[(device_id, channel)] = e
+                return
+
+            for channel, data in channels.items():
+                self._status_lights[(device_id, channel)] = data
+            result.sent += len(channels)
+
+        return send
+
+    async def _async_run_device(
+        self, group: Any, calls: list[Callable[[], Awaitable[None]]]
+    ) -> None:
+        """Run the calls of one device one after another, rate limited."""
+        lock = self._locks.setdefault(group, asyncio.Lock())
+        loop = asyncio.get_running_loop()
+
+        async with lock:
+            for call in calls:
+                wait = self._last_sent.get(group, -self._min_interval)
+                wait += self._min_interval - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                await call()
+                self._last_sent[group] = loop.time()
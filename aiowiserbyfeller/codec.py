@@ -0,0 +1,98 @@
+"""JSON encoding and decoding with the fastest available backend."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import importlib
+import importlib.util
+import json
+from typing import Any
+
+# Backends in order of preference. orjson and msgspec are optional.
+CODEC_BACKENDS = ("orjson", "msgspec", "json")
+
+
+@dataclass(frozen=True)
+class JsonCodec:
+    """Functions to encode and decode JSON.
+
+    loads accepts bytes or str and raises a ValueError for invalid JSON.
+    dumps returns compact UTF-8 encoded bytes.
+    """
+
+    name: str
+    loads: Callable[[bytes | str], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _json_codec() -> JsonCodec:
+    """Return the codec of the json module."""
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    return JsonCodec("json", json.loads, dumps)
+
+
+def _orjson_codec() -> JsonCodec:
+    """Return the codec of orjson, whose errors are ValueErrors already."""
+    orjson = importlib.import_module("orjson")
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    return JsonCodec("orjson", orjson.loads, dumps)
+
+
+def _msgspec_codec() -> JsonCodec:
+    """Return the codec of msgspec, raising ValueErrors like the others."""
+    msgspec = importlib.import_module("msgspec")
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(data: bytes | str) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+    return JsonCodec("msgspec", loads, encoder.encode)
+
+
+_FACTORIES: dict[str, Callable[[], JsonCodec]] = {
+    "orjson": _orjson_codec,
+    "msgspec": _msgspec_codec,
+    "json": _json_codec,
+}
+
+
+def get_codec(name: str) -> JsonCodec:
+    """Return the codec of a backend.
+
+    Args:
+        name: One of CODEC_BACKENDS.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the backend is not installed.
+
+    """
+    if name not in _FACTORIES:
+        raise ValueError(f"Unknown JSON codec {name}")
+
+    return _FACTORIES[name]()
+
+
+def select_codec() -> JsonCodec:
+    """Return the codec of the first installed backend of CODEC_BACKENDS."""
+    name = next(
+        name
+        for name in CODEC_BACKENDS
+        if name == "json" or importlib.util.find_spec(name) is not None
+    )
+
+    return get_codec(name)
+
+
+DEFAULT_CODEC = select_codec()
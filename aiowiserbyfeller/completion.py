@@ -0,0 +1,195 @@
+"""Awaitable completion of load commands."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from .const import HTTP_METHOD_GET, MESSAGE_KIND_LOAD
+from .errors import StateNotReached
+
+if TYPE_CHECKING:
+    from .auth import Auth
+    from .websocket import Websocket
+
+DEFAULT_COMPLETION_TIMEOUT = 60.0
+DEFAULT_POLL_INTERVAL = 1.0
+
+
+# Target state attributes only covers have, which report whether they move.
+COVER_TARGET_KEYS = ("level", "tilt")
+
+
+def target_reached(state: dict, target: dict) -> bool:
+    """Return True if a load state matches the target and is not moving.
+
+    A cover target is only reached once the state reports it stopped.
+    """
+    default = None if any(key in target for key in COVER_TARGET_KEYS) else "stop"
+    return (
+        all(state.get(key) == value for key, value in target.items())
+        and state.get("moving", default) == "stop"
+    )
+
+
+class Expectation:
+    """A load state some caller waits for.
+
+    Only state reported by the µGateway after the expectation was
+    registered resolves it, so a stale or optimistically assumed state
+    never counts as reached.
+    """
+
+    def __init__(
+        self,
+        tracker: CompletionTracker,
+        load_id: int,
+        predicate: Callable[[dict], bool],
+        state: dict | None,
+    ):
+        """Initialize an expectation."""
+        self.load_id = load_id
+        self.predicate = predicate
+        self.state = dict(state or {})
+        self.reported = False
+        self._tracker = tracker
+        self._future: asyncio.Future[dict] = asyncio.get_running_loop().create_future()
+
+    def update(self, state: dict) -> None:
+        """Merge a reported state and resolve if the state was reached."""
+        self.state.update(state)
+        self.reported = True
+        if not self._future.done() and self.predicate(self.state):
+            self._future.set_result(dict(self.state))
+
+    async def async_wait(self, timeout: float = DEFAULT_COMPLETION_TIMEOUT) -> dict:
+        """Wait until the expected state is reached and return it.
+
+        While the websocket is connected, the state messages of the load are
+        awaited. If none arrived within the poll interval, e.g. for a load
+        set to its current state, the state is polled once. Without
+        connected websocket, the state is polled every poll interval.
+
+        Raises:
+            StateNotReached: If the state was not reached within timeout.
+
+        """
+        tracker = self._tracker
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        listened = False
+
+        try:
+            while not self._future.done():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise StateNotReached(
+                        f"Load {self.load_id} did not reach the target state "
+                        f"within {timeout} seconds"
+                    )
+
+                interval = min(remaining, tracker.poll_interval)
+                if tracker.connected and (self.reported or not listened):
+                    listened = True
+                    await asyncio.wait([self._future], timeout=interval)
+                    continue
+
+                data = await tracker.auth.request(
+                    HTTP_METHOD_GET, f"loads/{self.load_id}/state"
+                )
+                self.update(data.get("state") or {})
+                if not self._future.done() and not tracker.connected:
+                    await asyncio.sleep(interval)
+        finally:
+            self.cancel()
+
+        return self._future.result()
+
+    def cancel(self) -> None:
+        """Stop waiting for the state."""
+        self._tracker.discard(self)
+
+
+class CompletionTracker:
+    """Resolve expected load states from websocket state messages.
+
+    Each Auth has a tracker (Auth.completion). Attach a websocket with
+    Auth.attach_websocket() to confirm commands by its state messages; without websocket, or while
+    it is disconnected, waiting callers poll the load state instead.
+    """
+
+    def __init__(self, auth: Auth, *, poll_interval: float = DEFAULT_POLL_INTERVAL):
+        """Initialize a completion tracker.
+
+        Args:
+            auth: The Auth instance used for polling.
+            poll_interval: Seconds between two state polls.
+
+        """
+        self.auth = auth
+        self.poll_interval = poll_interval
+        self._websocket: Websocket | None = None
+        self._expectations: dict[int, list[Expectation]] = {}
+
+    @property
+    def connected(self) -> bool:
+        """True if an attached websocket is connected.
+
+        False while the websocket waits to reconnect, so waiting callers
+        poll during an outage.
+        """
+        return self._websocket is not None and self._websocket.connected
+
+    @property
+    def pending(self) -> int:
+        """Number of expectations waiting for their state."""
+        return sum(len(items) for items in self._expectations.values())
+
+    def attach(self, websocket: Websocket) -> None:
+        """Confirm commands by the state messages of a websocket."""
+        self._websocket = websocket
+        websocket.subscribe(self.on_message)
+
+    def expect(
+        self,
+        load_id: int,
+        predicate: Callable[[dict], bool],
+        state: dict | None = None,
+    ) -> Expectation:
+        """Register an expected load state.
+
+        Register before sending the command, so no state message is missed.
+
+        Args:
+            load_id: The id of the load.
+            predicate: Called with the merged load state, True if reached.
+            state: Load state confirmed by the µGateway, partial messages are
+                merged into it. It does not resolve the expectation itself.
+
+        """
+        expectation = Expectation(self, load_id, predicate, state)
+        self._expectations.setdefault(load_id, []).append(expectation)
+
+        return expectation
+
+    def discard(self, expectation: Expectation) -> None:
+        """Forget an expectation."""
+        expectations = self._expectations.get(expectation.load_id, [])
+        if expectation in expectations:
+            expectations.remove(expectation)
+        if not expectations:
+            self._expectations.pop(expectation.load_id, None)
+
+    def on_message(self, data: Any) -> None:
+        """Resolve expectations matching a websocket state message."""
+        if not isinstance(data, dict) or MESSAGE_KIND_LOAD not in data:
+            return
+
+        payload = data[MESSAGE_KIND_LOAD]
+        state = payload.get("state")
+        if state is None:
+            return
+
+        for expectation in list(self._expectations.get(payload.get("id"), ())):
+            expectation.update(state)
@@ -99,3 +99,10 @@ HTTP_METHOD_POST = "post"
 HTTP_METHOD_PUT = "put"
 HTTP_METHOD_PATCH = "patch"
 HTTP_METHOD_DELETE = "delete"
+
+# Websocket message kinds
+MESSAGE_KIND_LOAD = "load"
+MESSAGE_KIND_SENSOR = "sensor"
+MESSAGE_KIND_HVAC_GROUP = "hvacgroup"
+MESSAGE_KIND_FINDME = "findme"
+MESSAGE_KIND_BUTTON = "button"
@@ -1,5 +1,13 @@
 """Wiser by Feller device submodule."""
 
 from .device import Device
+from .inventory import DeviceInventory, InventoryStats
+from .status import StatusUpdateResult, status_data
 
-__all__ = ["Device"]
+__all__ = [
+    "Device",
+    "DeviceInventory",
+    "InventoryStats",
+    "StatusUpdateResult",
+    "status_data",
+]
@@ -2,21 +2,48 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+import contextlib
+
 from aiowiserbyfeller.auth import Auth
 from aiowiserbyfeller.errors import UnexpectedGatewayResponse
 from aiowiserbyfeller.map import DEVICE_ALLOWED_EMPTY_FIELDS, DEVICE_CHECK_FIELDS
 from aiowiserbyfeller.util import get_device_name_by_fwid, get_device_name_by_hwid_a
 
+from .status import status_data
+
+_UNSET = object()
+
 
 class Device:
     """Class that represents a physical Feller Wiser device."""
 
+    __slots__ = (
+        "__weakref__",
+        "_a_device_family",
+        "_a_name",
+        "_c_name",
+        "_raw_data",
+        "auth",
+    )
+
     def __init__(self, raw_data: dict, auth: Auth):
         """Initialize a device object."""
-        self.raw_data = raw_data
         self.auth = auth
-        self._a_name = get_device_name_by_hwid_a(raw_data.get("a", {}).get("hw_id"))
-        self._c_name = get_device_name_by_fwid(raw_data.get("c", {}).get("fw_id"))
+        self.raw_data = raw_data
+
+    @property
+    def raw_data(self) -> dict:
+        """Raw data of the device as returned by the µGateway."""
+        return self._raw_data
+
+    @raw_data.setter
+    def raw_data(self, raw_data: dict) -> None:
+        """Set the raw data and reset the values derived from it."""
+        self._raw_data = raw_data
+        self._a_name = _UNSET
+        self._c_name = _UNSET
+        self._a_device_family = _UNSET
 
     @property
     def id(self) -> str | None:
@@ -44,6 +71,9 @@ class Device:
     @property
     def a_name(self) -> str:
         """Name of the actuator module (Funktionseinsatz)."""
+        if self._a_name is _UNSET:
+            self._a_name = get_device_name_by_hwid_a(self.a.get("hw_id"))
+
         return self._a_name
 
     @property
@@ -63,16 +93,21 @@ class Device:
         # |  0 |   channel_type    |  channel_features |
         # +----+----+----+----+----+----+----+----+----+
         """
+        if self._a_device_family is not _UNSET:
+            return self._a_device_family
+
         hw_id = self.a.get("hw_id", "")
 
         if hw_id == "":
+            self._a_device_family = None
             return None
 
         hw_id = int(hw_id, 16)
         device_type = (hw_id >> 8) & 0x0F
         device_features = (hw_id >> 4) & 0x0F
+        self._a_device_family = (device_type << 4) | device_features
 
-        return (device_type << 4) | device_features
+        return self._a_device_family
 
     @property
     def c(self) -> dict:
@@ -82,6 +117,9 @@ class Device:
     @property
     def c_name(self) -> str:
         """Name of the control module (Bedienaufsatz)."""
+        if self._c_name is _UNSET:
+            self._c_name = get_device_name_by_fwid(self.c.get("fw_id"))
+
         return self._c_name
 
     @property
@@ -151,29 +189,62 @@ class Device:
         background_color: str | None = None,
     ) -> None:
         """Set status light of load."""
+        await self.async_status_batch(
+            {
+                channel: status_data(
+                    color,
+                    background_bri,
+                    foreground_bri,
+                    foreground_color,
+                    background_color,
+                )
+            },
+            skip_unchanged=False,
+        )
+
+    async def async_status_batch(
+        self, statuses: Mapping[int, dict], *, skip_unchanged: bool = True
+    ) -> int:
+        """Set the status lights of several channels in one configuration session.
+
+        The configuration is fetched once, all inputs are written and the
+        configuration is applied once, instead of three requests per channel.
+
+        Args:
+            statuses: Status light data per input channel (see status_data()).
+            skip_unchanged: Do not write inputs already configured like this.
+                If no input changed, the configuration session is discarded
+                instead of applied. It is also discarded if a write fails.
 
-        if foreground_bri is None:
-            foreground_bri = background_bri
-
-        data = {
-            "color": color,
-            "background_bri": background_bri,
-            "foreground_bri": foreground_bri,
-            "foreground_color": foreground_color
-            if foreground_color is not None
-            else color,
-            "background_color": background_color
-            if background_color is not None
-            else color,
-        }
+        Returns:
+            The number of requests sent.
 
+        """
         config = await self.auth.request("get", f"devices/{self.id}/config")
+        config_path = f"devices/config/{config['id']}"
+        inputs = config.get("inputs", [])
+        requests = 1
+
+        try:
+            for channel, data in statuses.items():
+                current = inputs[channel] if channel < len(inputs) else {}
+                if skip_unchanged and all(current.get(k) == v for k, v in data.items()):
+                    continue
 
-        await self.auth.request(
-            "put", f"devices/config/{config['id']}/inputs/{channel}", json=data
-        )
+                await self.auth.request(
+                    "put", f"{config_path}/inputs/{channel}", json=data
+                )
+                requests += 1
+        except Exception:
+            # Do not leave the device in configuration mode.
+            with contextlib.suppress(Exception):
+                await self.auth.request("delete", config_path)
+            raise
+
+        # Apply the changes, or close the session if there were none.
+        await self.auth.request("put" if requests > 1 else "delete", config_path)
 
-        await self.auth.request("put", f"devices/config/{config['id']}")
+        return requests + 1
 
     async def async_refresh_properties(self) -> bool:
         """Refresh device properties.
@@ -0,0 +1,256 @@
+"""Device inventory with a persistent cache of the device details."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError
+
+from aiowiserbyfeller.errors import AiowiserbyfellerException
+
+from .device import Device
+
+if TYPE_CHECKING:
+    from aiowiserbyfeller.api import WiserByFellerAPI
+
+DEFAULT_INVENTORY_CONCURRENCY = 4
+INVENTORY_CACHE_VERSION = 1
+LOGGER = logging.getLogger(__name__)
+
+# Fields of the A and C blocks identifying the hardware and firmware of a
+# device. A device whose fields changed is fetched again.
+FINGERPRINT_FIELDS = ("address", "comm_ref", "fw_id", "fw_version", "hw_id")
+
+
+def device_fingerprint(data: dict) -> str:
+    """Return a fingerprint of the hardware and firmware of a device.
+
+    Args:
+        data: Raw device data, either from the devices summary or the
+            device details. Volatile fields like last_seen are ignored.
+
+    """
+    return json.dumps(
+        [
+            data.get("id"),
+            *(
+                [data.get(block, {}).get(name) for name in FINGERPRINT_FIELDS]
+                for block in ("a", "c")
+            ),
+        ],
+        separators=(",", ":"),
+    )
+
+
+@dataclass
+class InventoryStats:
+    """Outcome of loading the device inventory.
+
+    failed maps the ids of devices whose details could not be fetched to
+    the error raised. These devices are returned with their summary data.
+    """
+
+    cached: int = 0
+    fetched: int = 0
+    failed: dict[str, Exception] = field(default_factory=dict)
+
+
+class DeviceInventory:
+    """Load all devices with their details, fetching only what changed.
+
+    Fetching the details of a device takes about a second on the first
+    call. The inventory fetches the details of many devices concurrently
+    and stores them in a JSON file. On later loads, the details of devices
+    whose entry in the devices summary still matches the stored fingerprint
+    (id, addresses, product references, hardware and firmware ids and
+    versions) are taken from the file, all others are fetched again.
+
+    Details failing Device.validate_data are returned, but not stored, so
+    they are fetched again next time.
+
+    Usage:
+        inventory = DeviceInventory(api, "/config/wiser_devices.json")
+        devices = await inventory.async_load()
+    """
+
+    def __init__(
+        self,
+        api: WiserByFellerAPI,
+        cache_path: str | os.PathLike | None = None,
+        *,
+        concurrency: int = DEFAULT_INVENTORY_CONCURRENCY,
+        logger: logging.Logger = LOGGER,
+    ):
+        """Initialize a device inventory.
+
+        Args:
+            api: The API used to fetch the devices.
+            cache_path: File storing the device details. If None, details
+                are only kept in memory.
+            concurrency: Maximum number of device details fetched at once.
+            logger: The logger to use.
+
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self._api = api
+        self._cache_path = Path(cache_path) if cache_path is not None else None
+        self._concurrency = concurrency
+        self._logger = logger
+        self._entries: dict[str, dict] | None = None
+        self.stats = InventoryStats()
+
+    async def async_load(self) -> list[Device]:
+        """Return all devices with their details.
+
+        The devices are returned in the order of the devices summary.
+        """
+        summary = await self._api.async_get_devices()
+        entries = await self._async_entries()
+        self.stats = InventoryStats()
+
+        devices: dict[str, Device] = {}
+        outdated: list[Device] = []
+        for device in summary:
+            entry = entries.get(device.id)
+            if entry is None or entry["fingerprint"] != device_fingerprint(
+                device.raw_data
+            ):
+                outdated.append(device)
+                continue
+
+            data = {**entry["data"], "last_seen": device.last_seen}
+            devices[device.id] = self._api.resolve_device(data)
+            self.stats.cached += 1
+
+        fetched = await self._async_fetch([device.id for device in outdated])
+        for device in outdated:
+            devices[device.id] = fetched.get(device.id, device)
+            if device.id in fetched and device.id in entries:
+                # Compare with the summary next time, even if the details
+                # format a field differently.
+                entries[device.id]["fingerprint"] = device_fingerprint(device.raw_data)
+
+        current = {device.id for device in summary}
+        changed = bool(fetched) or entries.keys() != current
+        for device_id in entries.keys() - current:
+            del entries[device_id]
+
+        if changed:
+            await self._async_save(entries)
+
+        return [devices[device.id] for device in summary]
+
+    async def async_fetch(self, device_ids: list[str]) -> dict[str, Device]:
+        """Fetch the details of devices concurrently and store them.
+
+        The cache file is written if any device was fetched.
+
+        Returns:
+            The fetched devices by id. Devices that could not be fetched
+            are missing and recorded in stats.failed.
+
+        """
+        fetched = await self._async_fetch(device_ids)
+        if fetched:
+            await self._async_save(await self._async_entries())
+
+        return fetched
+
+    async def _async_fetch(self, device_ids: list[str]) -> dict[str, Device]:
+        """Fetch the details of devices concurrently, updating the entries."""
+        entries = await self._async_entries()
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def fetch(device_id: str) -> Device | None:
+            async with semaphore:
+                try:
+                    device = await self._api.async_get_device(device_id)
+                except (
+                    AiowiserbyfellerException,
+                    ClientError,
+                    asyncio.TimeoutError,
+                ) as e:
+                    self._logger.warning(
+                        "Could not fetch details of device %s: %s", device_id, e
+                    )
+                    self.stats.failed[device_id] = e
+                    return None
+
+            self.stats.fetched += 1
+            try:
+                device.validate_data()
+            except AiowiserbyfellerException as e:
+                self._logger.debug("Not caching device %s: %s", device_id, e)
+                entries.pop(device_id, None)
+            else:
+                entries[device_id] = {
+                    "fingerprint": device_fingerprint(device.raw_data),
+                    "data": device.raw_data,
+                }
+
+            return device
+
+        results = await asyncio.gather(*(fetch(device_id) for device_id in device_ids))
+
+        return {device.id: device for device in results if device is not None}
+
+    async def async_clear(self) -> None:
+        """Forget all stored device details, including the cache file."""
+        self._entries = {}
+        if self._cache_path is not None:
+            await asyncio.to_thread(self._cache_path.unlink, missing_ok=True)
+
+    async def _async_entries(self) -> dict[str, dict]:
+        """Return the stored device details, reading the cache file once."""
+        if self._entries is None:
+            self._entries = {}
+            if self._cache_path is not None:
+                self._entries = await asyncio.to_thread(self._read)
+
+        return self._entries
+
+    def _read(self) -> dict[str, dict]:
+        """Read the cache file, ignoring missing or invalid files."""
+        try:
+            content: Any = json.loads(self._cache_path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            self._logger.warning("Ignoring device cache %s: %s", self._cache_path, e)
+            return {}
+
+        if (
+            not isinstance(content, dict)
+            or content.get("version") != INVENTORY_CACHE_VERSION
+        ):
+            self._logger.info("Ignoring outdated device cache %s", self._cache_path)
+            return {}
+
+        return content.get("devices", {})
+
+    async def _async_save(self, entries: dict[str, dict]) -> None:
+        """Write the stored device details to the cache file."""
+        if self._cache_path is None:
+            return
+
+        content = {"version": INVENTORY_CACHE_VERSION, "devices": entries}
+        try:
+            await asyncio.to_thread(self._write, json.dumps(content))
+        except OSError as e:
+            self._logger.warning(
+                "Could not write device cache %s: %s", self._cache_path, e
+            )
+
+    def _write(self, content: str) -> None:
+        """Replace the cache file atomically."""
+        tmp_path = self._cache_path.with_name(f"{self._cache_path.name}.tmp")
+        tmp_path.write_text(content, encoding="utf-8")
+        tmp_path.replace(self._cache_path)
@@ -0,0 +1,59 @@
+"""Status light data and batched status light updates."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+DEFAULT_STATUS_CONCURRENCY = 4
+
+# Requests needed by Device.async_status for a single channel:
+# get config, put input, apply config.
+REQUESTS_PER_STATUS = 3
+
+
+def status_data(
+    color: str,
+    background_bri: int,
+    foreground_bri: int | None = None,
+    foreground_color: str | None = None,
+    background_color: str | None = None,
+) -> dict:
+    """Return the input configuration for a status light.
+
+    The foreground brightness defaults to the background brightness, the
+    foreground and background colors default to color.
+    """
+    if foreground_bri is None:
+        foreground_bri = background_bri
+
+    return {
+        "color": color,
+        "background_bri": background_bri,
+        "foreground_bri": foreground_bri,
+        "foreground_color": foreground_color if foreground_color is not None else color,
+        "background_color": background_color if background_color is not None else color,
+    }
+
+
+@dataclass
+class StatusUpdateResult:
+    """Outcome of a batched status light update.
+
+    channels and requests count the successfully updated devices only.
+    requests_saved compares the requests sent with one Device.async_status
+    call per channel.
+    """
+
+    channels: int = 0
+    requests: int = 0
+    failed: dict[str, Exception] = field(default_factory=dict)
+
+    @property
+    def requests_saved(self) -> int:
+        """Number of requests saved compared to updating each channel separately."""
+        return self.channels * REQUESTS_PER_STATUS - self.requests
+
+    @property
+    def ok(self) -> bool:
+        """True if the status lights of all devices were updated."""
+        return not self.failed
@@ -59,3 +59,7 @@ class InvalidJson(UnsuccessfulRequest):
 
 class WebsocketError(AiowiserbyfellerException):
     """Request returned non-success error."""
+
+
+class StateNotReached(AiowiserbyfellerException):
+    """Load did not reach the target state within the timeout."""
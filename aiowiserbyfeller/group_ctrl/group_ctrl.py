@@ -8,6 +8,8 @@ from aiowiserbyfeller.auth import Auth
 class GroupCtrl:
     """Class that represents a Feller Wiser Group Ctrl."""
 
+    __slots__ = ("__weakref__", "auth", "raw_data")
+
     def __init__(self, raw_data: dict, auth: Auth):
         """Initialize a GroupCtrl object."""
         self.raw_data = raw_data
@@ -29,6 +29,8 @@ class HvacChannelState(Enum):
 class HvacStateProperties:
     """Abstract class with shared properties of HVAC classes with state."""
 
+    __slots__ = ()
+
     @property
     def raw_data(self) -> dict:
         """Raw data dict."""
@@ -191,6 +193,8 @@ class ThermostatReference:
 class HvacGroup(HvacStateProperties):
     """Class that represents a Feller Wiser HVAC group."""
 
+    __slots__ = ("__weakref__", "_auth", "_raw_data", "_thermostat_ref", "raw_state")
+
     def __init__(self, raw_data: dict, auth: Auth, raw_state: dict | None = None):
         """Initialize an HVAC group object."""
         self._thermostat_ref = None
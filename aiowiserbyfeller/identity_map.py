@@ -0,0 +1,108 @@
+"""Identity map sharing one model instance per entity."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+import weakref
+
+DEFAULT_IDENTITY_MAP_SIZE = 512
+
+ENTITY_LOAD = "load"
+ENTITY_DEVICE = "device"
+ENTITY_SENSOR = "sensor"
+
+
+class IdentityMap:
+    """Resolve every entity to one shared model instance.
+
+    Instances are keyed by entity kind (e.g. "load", "device") and id. They
+    are held by weak references, so instances nobody uses any more are
+    freed. The most recently used max_size instances are additionally kept
+    alive, so short-lived lookups do not allocate new objects every time.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_IDENTITY_MAP_SIZE):
+        """Initialize an identity map.
+
+        Args:
+            max_size: Number of recently used instances kept alive even if
+                the application holds no reference to them.
+
+        """
+        self._max_size = max_size
+        self._instances: weakref.WeakValueDictionary[tuple[str, Hashable], Any] = (
+            weakref.WeakValueDictionary()
+        )
+        self._recent: OrderedDict[tuple[str, Hashable], Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of live instances."""
+        return len(self._instances)
+
+    def get(self, kind: str, entity_id: Hashable) -> Any | None:
+        """Return the instance of an entity, if there is one."""
+        instance = self._instances.get((kind, entity_id))
+        if instance is not None:
+            self._touch((kind, entity_id), instance)
+
+        return instance
+
+    def resolve(
+        self,
+        kind: str,
+        raw_data: dict,
+        factory: Callable[[dict], Any],
+        cls: type | None = None,
+    ) -> Any:
+        """Return the canonical instance for raw data, updated with it.
+
+        Args:
+            kind: The entity kind, e.g. "load".
+            raw_data: Data received from the µGateway, including the id.
+            factory: Creates a new instance from raw data.
+            cls: The class factory would create. If the existing instance
+                has a different class (e.g. the load type changed), it is
+                replaced by a new instance.
+
+        """
+        entity_id = raw_data.get("id")
+        if entity_id is None:
+            return factory(raw_data)
+
+        key = (kind, entity_id)
+        instance = self._instances.get(key)
+
+        if instance is not None and (cls is None or type(instance) is cls):
+            self.hits += 1
+            instance.raw_data = raw_data
+        else:
+            self.misses += 1
+            instance = factory(raw_data)
+            self._instances[key] = instance
+
+        self._touch(key, instance)
+
+        return instance
+
+    def _touch(self, key: tuple[str, Hashable], instance: Any) -> None:
+        """Mark an instance as recently used, evicting the least recent one."""
+        self._recent[key] = instance
+        self._recent.move_to_end(key)
+
+        while len(self._recent) > self._max_size:
+            self._recent.popitem(last=False)
+
+    def evict(self, kind: str | None = None, entity_id: Hashable = None) -> None:
+        """Forget instances of one entity, one kind, or all instances."""
+        for key in list(self._instances.keys()):
+            if kind is not None and key[0] != kind:
+                continue
+            if entity_id is not None and key[1] != entity_id:
+                continue
+
+            self._instances.pop(key, None)
+            self._recent.pop(key, None)
@@ -1,5 +1,6 @@
 """Wiser by Feller job submodule."""
 
+from .compiler import JobCompiler, JobCompilerStats
 from .job import Job
 
-__all__ = ["Job"]
+__all__ = ["Job", "JobCompiler", "JobCompilerStats"]
@@ -0,0 +1,170 @@
+"""Compilation of load state sets into transient jobs."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from aiowiserbyfeller.errors import UnsuccessfulRequest
+from aiowiserbyfeller.load import Load
+
+from .job import Job
+
+if TYPE_CHECKING:
+    from aiowiserbyfeller.api import WiserByFellerAPI
+
+DEFAULT_MAX_TRANSIENT_JOBS = 16
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class JobCompilerStats:
+    """Counters of a job compiler."""
+
+    created: int = 0
+    reused: int = 0
+    deleted: int = 0
+
+
+def normalize_states(states: Mapping[int | Load, dict]) -> dict[int, dict]:
+    """Return the states keyed by load id."""
+    return {
+        (key.id if isinstance(key, Load) else key): state
+        for key, state in states.items()
+    }
+
+
+def states_hash(states: Mapping[int, dict]) -> str:
+    """Return a hash identifying a set of load states regardless of order."""
+    encoded = json.dumps(
+        sorted(states.items()), sort_keys=True, separators=(",", ":")
+    ).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def compile_job(states: Mapping[int, dict], auth) -> Job:
+    """Return an unsaved job setting the given load states."""
+    return Job(
+        {
+            "target_states": [
+                {"load": load_id, "state": state} for load_id, state in states.items()
+            ]
+        },
+        auth,
+    )
+
+
+class JobCompiler:
+    """Apply many load states with a single request through transient jobs.
+
+    A set of load states is compiled into a job which is then run with one
+    jobs/{id}/run request. Jobs are cached by the hash of their states, so
+    applying the same set again reuses the job. The least recently used
+    jobs are deleted from the µGateway once more than max_jobs exist.
+
+    Usage:
+        compiler = JobCompiler(api)
+        await compiler.async_apply({load.id: {"bri": 0} for load in loads})
+        ...
+        await compiler.async_clear()  # delete the transient jobs
+    """
+
+    def __init__(
+        self,
+        api: WiserByFellerAPI,
+        *,
+        max_jobs: int = DEFAULT_MAX_TRANSIENT_JOBS,
+        logger: logging.Logger = LOGGER,
+    ):
+        """Initialize a job compiler.
+
+        Args:
+            api: The API used to create, run and delete jobs.
+            max_jobs: Maximum number of transient jobs kept on the µGateway.
+            logger: The logger to use.
+
+        """
+        if max_jobs < 1:
+            raise ValueError("max_jobs must be at least 1")
+
+        self._api = api
+        self._max_jobs = max_jobs
+        self._logger = logger
+        self._jobs: OrderedDict[str, int] = OrderedDict()
+        self._lock = asyncio.Lock()
+        self.stats = JobCompilerStats()
+
+    @property
+    def job_ids(self) -> list[int]:
+        """Ids of the transient jobs, least recently used first."""
+        return list(self._jobs.values())
+
+    async def async_apply(self, states: Mapping[int | Load, dict]) -> Job:
+        """Set the target states of several loads with one job run.
+
+        If the mapping is keyed by Load objects, their raw_state is updated.
+
+        Returns:
+            The job that was run.
+
+        """
+        normalized = normalize_states(states)
+        key = states_hash(normalized)
+        job_id = await self._async_job_id(key, normalized)
+        job = Job({"id": job_id}, self._api.auth)
+
+        try:
+            await job.async_trigger_states()
+        except UnsuccessfulRequest:
+            # The job may have been deleted by someone else, compile it again.
+            self._jobs.pop(key, None)
+            job.raw_data = {"id": await self._async_job_id(key, normalized)}
+            await job.async_trigger_states()
+
+        for load in states:
+            if isinstance(load, Load):
+                load.raw_state = {**(load.raw_state or {}), **states[load]}
+
+        return job
+
+    async def _async_job_id(self, key: str, states: dict[int, dict]) -> int:
+        """Return the id of the cached job for a state set, creating it if needed."""
+        async with self._lock:
+            job_id = self._jobs.get(key)
+            if job_id is not None:
+                self._jobs.move_to_end(key)
+                self.stats.reused += 1
+                return job_id
+
+            job = await self._api.async_create_job(compile_job(states, self._api.auth))
+            self._jobs[key] = job.id
+            self.stats.created += 1
+
+            while len(self._jobs) > self._max_jobs:
+                _, evicted = self._jobs.popitem(last=False)
+                await self._async_delete(evicted)
+
+            return job.id
+
+    async def _async_delete(self, job_id: int) -> None:
+        """Delete a transient job, ignoring jobs that are already gone."""
+        try:
+            await self._api.async_delete_job(job_id)
+        except UnsuccessfulRequest as e:
+            self._logger.debug("Could not delete transient job %s: %s", job_id, e)
+            return
+
+        self.stats.deleted += 1
+
+    async def async_clear(self) -> None:
+        """Delete all transient jobs from the µGateway."""
+        async with self._lock:
+            while self._jobs:
+                _, job_id = self._jobs.popitem(last=False)
+                await self._async_delete(job_id)
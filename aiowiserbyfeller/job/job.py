@@ -9,6 +9,8 @@ from aiowiserbyfeller.util import validate_str
 class Job:
     """Representation of a job in the Feller Wiser µGateway API."""
 
+    __slots__ = ("__weakref__", "auth", "raw_data")
+
     def __init__(self, raw_data: dict, auth: Auth):
         """Initialize a job object."""
         self.raw_data = raw_data
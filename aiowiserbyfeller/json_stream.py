@@ -0,0 +1,239 @@
+"""Incremental parsing of the data array of a µGateway response."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any
+
+DEFAULT_STREAM_CHUNK_SIZE = 16384
+
+_START = 0
+_KEY = 1
+_VALUE = 2
+_ITEM = 3
+_ITEM_END = 4
+_AFTER_ARRAY = 5
+_END = 6
+
+# Scanner of the C decoder, returning (value, end) without the overhead of
+# JSONDecoder.raw_decode. Raises StopIteration if no value starts at index.
+_SCAN_ONCE = json.JSONDecoder().scan_once
+
+_WHITESPACE = " \t\n\r"
+
+_SKIP_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Characters that can follow a complete array element.
+_ITEM_END_CHARS = _WHITESPACE + ",]"
+
+# Characters changing the nesting or ending a field of the envelope.
+_STRUCTURE = re.compile(r'["\[\]{},:]')
+
+# Characters changing the nesting inside of a field of the envelope.
+_NESTED = re.compile(r'["\[\]{}]')
+
+# Characters ending or escaping inside of a string.
+_STRING = re.compile(r'["\\]')
+
+
+class JsonArrayStream:
+    """Parse a response envelope, returning the elements of its data array.
+
+    The µGateway wraps the data in an object like {"status": "success",
+    "data": [...]}. Each element of the array is decoded as soon as its last
+    byte was fed, so the response never has to be kept in memory as a
+    whole. The other fields of the envelope are available in envelope once
+    the response was parsed completely.
+
+    Usage:
+        stream = JsonArrayStream()
+        async for chunk in resp.content.iter_chunked(DEFAULT_STREAM_CHUNK_SIZE):
+            for item in stream.feed(chunk):
+                ...
+        stream.close()
+    """
+
+    def __init__(self, key: str = "data"):
+        """Initialize a JSON array stream.
+
+        Args:
+            key: The field of the envelope holding the array.
+
+        """
+        self._key = key
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._field: str | None = None
+        self._scan = 0
+        self._depth = 0
+        self._in_string = False
+        self.envelope: dict[str, Any] = {}
+        self.count = 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Parse a chunk of the response.
+
+        Returns:
+            The array elements completed by the chunk.
+
+        Raises:
+            ValueError: If the response is not a valid envelope.
+
+        """
+        self._buffer += self._decoder.decode(chunk)
+        items: list[Any] = []
+        self._parse(items, final=False)
+
+        # Drop the parsed part, keeping a token that is not complete yet.
+        self._buffer = self._buffer[self._pos :]
+        self._scan = max(self._scan - self._pos, 0)
+        self._pos = 0
+
+        return items
+
+    def close(self) -> list[Any]:
+        """Finish parsing after the last chunk was fed.
+
+        Returns:
+            The array elements completed by the end of the response.
+
+        Raises:
+            ValueError: If the response ended before the envelope was complete.
+
+        """
+        self._buffer += self._decoder.decode(b"", final=True)
+        items: list[Any] = []
+        self._parse(items, final=True)
+
+        if self._state != _END or self._buffer[self._pos :].strip(_WHITESPACE):
+            raise ValueError("Incomplete or invalid JSON response")
+
+        return items
+
+    def _parse(self, items: list[Any], final: bool) -> None:
+        """Parse as far as the buffer allows.
+
+        Array elements are decoded with the C decoder of the json module. An
+        element that is not complete yet is decoded again with the next
+        chunk, which is cheap as elements are much smaller than chunks.
+        """
+        buffer = self._buffer
+        length = len(buffer)
+        while True:
+            pos = _SKIP_WHITESPACE.match(buffer, self._pos).end()
+            self._pos = pos
+            if pos >= length or self._state == _END:
+                return
+
+            char = buffer[pos]
+            if self._state == _START:
+                if char != "{":
+                    raise ValueError("Response is not a JSON object")
+                self._pos = pos + 1
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char == "}":
+                    self._pos = pos + 1
+                    self._state = _END
+                    continue
+                token = self._token(":")
+                if token is None:
+                    return
+                self._field = json.loads(token)
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                if self._field == self._key and char == "[":
+                    self._pos = pos + 1
+                    self._state = _ITEM
+                    continue
+                token = self._token(",}")
+                if token is None:
+                    return
+                self.envelope[self._field] = json.loads(token)
+                self._state = self._after_value()
+            elif self._state == _ITEM:
+                if char == "]":
+                    self._pos = pos + 1
+                    self._state = _AFTER_ARRAY
+                    continue
+                try:
+                    item, end = _SCAN_ONCE(buffer, pos)
+                except (json.JSONDecodeError, StopIteration) as e:
+                    if final:
+                        raise ValueError("Invalid element in the data array") from e
+                    # Incomplete, decode it again once more data arrived.
+                    return
+                if not final and (end == length or buffer[end] not in _ITEM_END_CHARS):
+                    # A number might continue in the next chunk, e.g. 1.5
+                    # received as 1 and .5.
+                    return
+                items.append(item)
+                self.count += 1
+                if end < length and buffer[end] == ",":
+                    # Common case, continue with the next element right away.
+                    self._pos = end + 1
+                else:
+                    self._pos = end
+                    self._state = _ITEM_END
+            elif self._state == _ITEM_END:
+                if char not in ",]":
+                    raise ValueError(f"Unexpected {char!r} in the data array")
+                self._pos = pos + 1
+                self._state = _ITEM if char == "," else _AFTER_ARRAY
+            elif self._state == _AFTER_ARRAY:
+                if char not in ",}":
+                    raise ValueError(f"Unexpected {char!r} after the data array")
+                self._pos = pos + 1
+                self._state = _KEY if char == "," else _END
+
+    def _token(self, delimiters: str) -> str | None:
+        """Return the next envelope token up to one of delimiters.
+
+        The delimiter is consumed. Returns None if the buffer ends before
+        the token does, keeping the progress to resume with the next chunk.
+        """
+        buffer = self._buffer
+        scan = max(self._scan, self._pos)
+        while True:
+            if self._in_string:
+                match = _STRING.search(buffer, scan)
+                if match is None:
+                    self._scan = len(buffer)
+                    return None
+                scan = match.end()
+                if match.group() == "\\":
+                    if scan >= len(buffer):
+                        # Resume at the backslash once the next chunk arrived.
+                        self._scan = scan - 1
+                        return None
+                    scan += 1
+                else:
+                    self._in_string = False
+                continue
+
+            pattern = _NESTED if self._depth else _STRUCTURE
+            match = pattern.search(buffer, scan)
+            if match is None:
+                self._scan = len(buffer)
+                return None
+            scan = match.end()
+            char = match.group()
+            if char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._depth += 1
+            elif self._depth > 0 and char in "]}":
+                self._depth -= 1
+            elif self._depth == 0 and char in delimiters:
+                token = buffer[self._pos : scan - 1]
+                self._pos = scan
+                self._scan = 0
+                return token
+
+    def _after_value(self) -> int:
+        """Return the state following an envelope field."""
+        return _KEY if self._buffer[self._pos - 1] == "," else _END
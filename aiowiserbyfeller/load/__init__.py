@@ -1,5 +1,6 @@
 """Wiser by Feller load submodule."""
 
+from .bulk import TargetStatesResult
 from .dali import Dali
 from .dali_rgbw import DaliRgbw
 from .dali_tw import DaliTw
@@ -9,4 +10,14 @@ from .load import Load
 from .motor import Motor
 from .on_off import OnOff
 
-__all__ = ["Dali", "DaliRgbw", "DaliTw", "Dim", "Hvac", "Load", "Motor", "OnOff"]
+__all__ = [
+    "Dali",
+    "DaliRgbw",
+    "DaliTw",
+    "Dim",
+    "Hvac",
+    "Load",
+    "Motor",
+    "OnOff",
+    "TargetStatesResult",
+]
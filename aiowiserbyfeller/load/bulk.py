@@ -0,0 +1,51 @@
+"""Results of bulk load operations."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+from aiohttp import ClientError, ClientResponseError
+
+from aiowiserbyfeller.errors import AiowiserbyfellerException, InvalidJson
+
+DEFAULT_BULK_CONCURRENCY = 4
+DEFAULT_BULK_RETRIES = 2
+DEFAULT_BULK_RETRY_DELAY = 0.25
+
+# Errors that may succeed when the request is sent again, see is_retryable().
+RETRYABLE_ERRORS = (ClientError, asyncio.TimeoutError, InvalidJson)
+
+# Errors recorded per load instead of failing the whole bulk operation.
+BULK_ERRORS = (*RETRYABLE_ERRORS, AiowiserbyfellerException)
+
+
+def is_retryable(error: Exception) -> bool:
+    """Return True if a request failing with error may succeed when sent again.
+
+    Connection errors, timeouts, invalid responses and server errors (5xx)
+    are retried. Client errors (4xx) and requests rejected by the µGateway
+    (UnsuccessfulRequest, TokenMissing, etc.) fail again and are not.
+    """
+    if isinstance(error, ClientResponseError):
+        return error.status >= 500
+
+    return isinstance(error, RETRYABLE_ERRORS)
+
+
+@dataclass
+class TargetStatesResult:
+    """Outcome of setting the target state of several loads.
+
+    succeeded maps load ids to the state confirmed by the µGateway, failed
+    maps load ids to the exception of the last attempt.
+    """
+
+    succeeded: dict[int, dict] = field(default_factory=dict)
+    failed: dict[int, Exception] = field(default_factory=dict)
+    attempts: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """True if the target state of all loads was set."""
+        return not self.failed
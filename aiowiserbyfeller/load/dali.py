@@ -5,3 +5,5 @@ from .dim import Dim
 
 class Dali(Dim):
     """Representation of a DALI light switch in the Feller Wiser µGateway API."""
+
+    __slots__ = ()
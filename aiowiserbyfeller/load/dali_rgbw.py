@@ -1,11 +1,15 @@
 """Support for DALI RGB light switch devices."""
 
+from aiowiserbyfeller.completion import DEFAULT_COMPLETION_TIMEOUT
+
 from .dim import Dim
 
 
 class DaliRgbw(Dim):
     """Representation of a DALI RGBW light switch in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def state_rgbw(self) -> dict | None:
         """Current color of the load."""
@@ -17,11 +21,19 @@ class DaliRgbw(Dim):
     # pylint: disable=too-many-arguments
 
     async def async_set_bri_rgbw(
-        self, bri: int, red: int, green: int, blue: int, white: int
+        self,
+        bri: int,
+        red: int,
+        green: int,
+        blue: int,
+        white: int,
+        *,
+        wait: bool = False,
+        timeout: float = DEFAULT_COMPLETION_TIMEOUT,
     ) -> dict:
         """Select brightness and color.
 
         Brightness: 0..10000, Red, green, blue, white: 0..255
         """
         data = {"bri": bri, "red": red, "green": green, "blue": blue, "white": white}
-        return await super().async_set_target_state(data)
+        return await super().async_set_target_state(data, wait=wait, timeout=timeout)
@@ -1,11 +1,15 @@
 """Support for DALI tunable white light switch devices."""
 
+from aiowiserbyfeller.completion import DEFAULT_COMPLETION_TIMEOUT
+
 from .dim import Dim
 
 
 class DaliTw(Dim):
     """Representation of a DALI tunable white light switch in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def state_ct(self) -> int | None:
         """Current color temperature of the load."""
@@ -14,9 +18,18 @@ class DaliTw(Dim):
 
         return self.raw_state["ct"]
 
-    async def async_set_bri_ct(self, bri: int, ct: int) -> dict:
+    async def async_set_bri_ct(
+        self,
+        bri: int,
+        ct: int,
+        *,
+        wait: bool = False,
+        timeout: float = DEFAULT_COMPLETION_TIMEOUT,
+    ) -> dict:
         """Set brightness and color temperature.
 
         Brightness: 0..10000, Color Temperature: 1000..20000
         """
-        return await super().async_set_target_state({"bri": bri, "ct": ct})
+        return await super().async_set_target_state(
+            {"bri": bri, "ct": ct}, wait=wait, timeout=timeout
+        )
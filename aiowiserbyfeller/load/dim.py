@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from aiowiserbyfeller.completion import DEFAULT_COMPLETION_TIMEOUT
 from aiowiserbyfeller.const import BUTTON_OFF, BUTTON_ON, EVENT_CLICK
 
 from .load import Load
@@ -10,6 +11,8 @@ from .load import Load
 class Dim(Load):
     """Representation of a dimmable light switch in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def state_bri(self) -> int | None:
         """Current brightness of the load."""
@@ -18,9 +21,17 @@ class Dim(Load):
 
         return self.raw_state["bri"]
 
-    async def async_set_bri(self, bri: int) -> dict:
+    async def async_set_bri(
+        self,
+        bri: int,
+        *,
+        wait: bool = False,
+        timeout: float = DEFAULT_COMPLETION_TIMEOUT,
+    ) -> dict:
         """Set new target brightness of the light switch."""
-        return await super().async_set_target_state({"bri": bri})
+        return await super().async_set_target_state(
+            {"bri": bri}, wait=wait, timeout=timeout
+        )
 
     async def async_switch_on(self) -> dict:
         """Switch on the load.
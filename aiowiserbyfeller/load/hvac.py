@@ -10,6 +10,8 @@ from .load import Load
 class Hvac(HvacStateProperties, Load):
     """Representation of a heating channel (valve) in the Feller Wiser µGateway API."""
 
+    __slots__ = ("_thermostat_ref",)
+
     @property
     def controller(self) -> str | None:
         """Current name of hvac controller."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from aiowiserbyfeller.auth import Auth
+from aiowiserbyfeller.completion import DEFAULT_COMPLETION_TIMEOUT, target_reached
 from aiowiserbyfeller.const import (
     BUTTON_DOWN,
     BUTTON_OFF,
@@ -21,6 +22,8 @@ from aiowiserbyfeller.util import validate_str
 class Load:
     """Base class that represents a load object in the Feller Wiser µGateway API."""
 
+    __slots__ = ("__weakref__", "_raw_data", "auth", "raw_state")
+
     def __init__(self, raw_data: dict, auth: Auth, **kwargs):
         """Initialize load instance."""
         self.raw_data = raw_data
@@ -104,11 +107,26 @@ class Load:
 
         return self.raw_state
 
-    async def async_set_target_state(self, data: dict) -> dict:
+    async def async_set_target_state(
+        self,
+        data: dict,
+        *,
+        wait: bool = False,
+        timeout: float = DEFAULT_COMPLETION_TIMEOUT,
+    ) -> dict:
         """Save new target state to µGateway.
 
         Note: A successful response assumes target_state as real state.
 
+        With wait=True, the call returns when the load reached the target
+        state (e.g. a cover stopped at the target level), confirmed by the
+        websocket attached with Auth.attach_websocket() or by polling the
+        load state if no websocket is connected. StateNotReached is raised
+        if this takes longer than timeout seconds.
+
+        If the Auth has a write coalescing window, writes to the same load
+        within the window are merged and sent as one request.
+
         Possible target-state depending on load-type:
             Main-Type  Sub-Type  Attr.
             onoff                bri
@@ -128,11 +146,35 @@ class Load:
             blue:  0..255
             white: 0..255
         """
-        data = await self.auth.request(
-            "put", f"loads/{self.id}/target_state", json=data
-        )
+        path = f"loads/{self.id}/target_state"
+        target = data
+        expectation = None
+        if wait:
+            # raw_state may be stale or an earlier assumed target state.
+            expectation = self.auth.completion.expect(
+                self.id, lambda state: target_reached(state, target)
+            )
+
+        try:
+            if self.auth.write_coalescer is None:
+                data = await self.auth.request("put", path, json=data)
+            else:
+                # Rapid writes to the same load are merged into one request
+                data = await self.auth.write_coalescer.write(
+                    path,
+                    data,
+                    lambda merged: self.auth.request("put", path, json=merged),
+                )
+        except BaseException:
+            if expectation is not None:
+                expectation.cancel()
+            raise
+
         self.raw_state = data["target_state"]
 
+        if expectation is not None:
+            self.raw_state = await expectation.async_wait(timeout)
+
         return self.raw_state
 
     async def async_refresh(self):
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from aiowiserbyfeller.completion import DEFAULT_COMPLETION_TIMEOUT
 from aiowiserbyfeller.const import BUTTON_STOP, EVENT_CLICK
+from aiowiserbyfeller.errors import StateNotReached
 
 from .load import Load
 
+DEFAULT_STOP_TIMEOUT = 5.0
+
 
 class Motor(Load):
     """Representation of a motor (cover, venetian blinds, roller shutters, awning) switch in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def state(self) -> dict | None:
         """Current state of the motor."""
@@ -18,15 +24,51 @@ class Motor(Load):
 
         return self.raw_state
 
-    async def async_set_level(self, level: int) -> dict:
+    async def async_set_level(
+        self,
+        level: int,
+        *,
+        wait: bool = False,
+        timeout: float = DEFAULT_COMPLETION_TIMEOUT,
+    ) -> dict:
         """Set the target level of the cover (0..10000)."""
-        return await super().async_set_target_state({"level": level})
+        return await super().async_set_target_state(
+            {"level": level}, wait=wait, timeout=timeout
+        )
 
-    async def async_set_tilt(self, tilt: int) -> dict:
+    async def async_set_tilt(
+        self,
+        tilt: int,
+        *,
+        wait: bool = False,
+        timeout: float = DEFAULT_COMPLETION_TIMEOUT,
+    ) -> dict:
         """Set the target tilt of the cover (0..9)."""
-        return await super().async_set_target_state({"tilt": tilt})
+        return await super().async_set_target_state(
+            {"tilt": tilt}, wait=wait, timeout=timeout
+        )
 
     async def async_stop(self):
-        """Stop the cover movement."""
-        await super().async_ctrl(BUTTON_STOP, EVENT_CLICK)
-        await self.async_refresh_state()
+        """Stop the cover movement.
+
+        If a websocket is attached with Auth.attach_websocket() and connected,
+        the stopped state is taken from its state messages. Otherwise the state
+        is fetched after the command.
+        """
+        completion = self.auth.completion
+        if not completion.connected:
+            await super().async_ctrl(BUTTON_STOP, EVENT_CLICK)
+            await self.async_refresh_state()
+            return
+
+        # Not seeded with raw_state, which may report a stop that is outdated.
+        expectation = completion.expect(
+            self.id, lambda state: state.get("moving") == "stop"
+        )
+        try:
+            await super().async_ctrl(BUTTON_STOP, EVENT_CLICK)
+            self.raw_state = await expectation.async_wait(DEFAULT_STOP_TIMEOUT)
+        except StateNotReached:
+            await self.async_refresh_state()
+        finally:
+            expectation.cancel()
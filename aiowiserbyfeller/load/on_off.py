@@ -10,6 +10,8 @@ from .load import Load
 class OnOff(Load):
     """Representation of an on/off switch in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def state(self) -> bool | None:
         """Current state of the switch."""
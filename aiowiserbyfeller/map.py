@@ -49,6 +49,32 @@ DEVICE_A_BLOCK_FWID_BLOCK_MAP = [
     },
 ]
 
+
+def _compile_hwid_names(hwid_map: list[dict]) -> dict[tuple[int, int | None], str]:
+    """Return the A block names keyed by (type, feature)."""
+    names = {}
+    for entry in hwid_map:
+        names.setdefault((entry["type"], entry["feature"]), entry["name"])
+
+    return names
+
+
+def _compile_fwid_names(block: dict) -> dict[int, str]:
+    """Return the names of a block keyed by the masked fw_id."""
+    names = {}
+    for fw_id, name in block["fw_id_map"].items():
+        names.setdefault(fw_id & block["mask"], name)
+
+    return names
+
+
+# Compiled lookup tables of the maps above, so identifying a device does not
+# scan them. A feature of None is the fallback name of a type.
+DEVICE_A_BLOCK_HWID_NAMES = _compile_hwid_names(DEVICE_A_BLOCK_HWID_MAP)
+DEVICE_FWID_BLOCK_NAMES = [
+    _compile_fwid_names(block) for block in DEVICE_A_BLOCK_FWID_BLOCK_MAP
+]
+
 # Fields that are required when validating device data
 DEVICE_CHECK_FIELDS = {
     "c": ["comm_ref", "fw_version", "comm_name", "serial_nr"],
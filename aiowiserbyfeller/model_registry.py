@@ -0,0 +1,117 @@
+"""Registry of the model classes for load and sensor types."""
+
+from __future__ import annotations
+
+from .const import (
+    LOAD_SUBTYPE_DALI_RGB,
+    LOAD_SUBTYPE_DALI_TW,
+    LOAD_SUBTYPE_NONE,
+    LOAD_TYPE_DALI,
+    LOAD_TYPE_DIM,
+    LOAD_TYPE_HVAC,
+    LOAD_TYPE_MOTOR,
+    LOAD_TYPE_ONOFF,
+    SENSOR_TYPE_BRIGHTNESS,
+    SENSOR_TYPE_CO2,
+    SENSOR_TYPE_HAIL,
+    SENSOR_TYPE_HUMIDITY,
+    SENSOR_TYPE_RAIN,
+    SENSOR_TYPE_TEMPERATURE,
+    SENSOR_TYPE_WIND,
+    SENSOR_TYPE_WINDOW,
+)
+from .load import Dali, DaliRgbw, DaliTw, Dim, Hvac, Load, Motor, OnOff
+from .sensor import Brightness, Co2, Hail, Humidity, Rain, Temperature, Wind, Window
+
+# Sub type wildcard: the class is used for every sub type of its type.
+ANY_SUB_TYPE = None
+
+
+class ModelRegistry:
+    """Map (type, sub_type) of loads and sensors to their model classes.
+
+    A class registered for a type with ANY_SUB_TYPE is used for all sub
+    types without an exact registration. Data matching nothing resolves to
+    the default class.
+
+    Usage:
+        MODEL_REGISTRY.register(MyValve, "valve")
+        MODEL_REGISTRY.register(MyDaliDt8, "dali", "dt8")
+    """
+
+    def __init__(self, default: type = Load):
+        """Initialize an empty model registry.
+
+        Args:
+            default: The class used for data matching no registration.
+
+        """
+        self.default = default
+        self._classes: dict[tuple[str, str | None], type] = {}
+        # Results of lookup() by (type, sub_type) of the data, so known types
+        # resolve with a single dict lookup. Cleared on every registration.
+        self.resolved: dict[tuple[str | None, str | None], type] = {}
+
+    def register(
+        self, cls: type, type_: str, sub_type: str | None = ANY_SUB_TYPE
+    ) -> type:
+        """Register the model class of a type (and optionally sub type).
+
+        Replaces the class registered for the same key before.
+
+        Returns:
+            The registered class.
+
+        """
+        self._classes[(type_, sub_type)] = cls
+        self.resolved.clear()
+        return cls
+
+    def unregister(self, type_: str, sub_type: str | None = ANY_SUB_TYPE) -> None:
+        """Remove the registration of a type and sub type, if there is one."""
+        self._classes.pop((type_, sub_type), None)
+        self.resolved.clear()
+
+    def lookup(self, data: dict) -> type:
+        """Return the model class for raw load or sensor data."""
+        key = (data.get("type"), data.get("sub_type"))
+        cls = self.resolved.get(key)
+        if cls is None:
+            cls = self._classes.get(key)
+            if cls is None:
+                cls = self._classes.get((key[0], ANY_SUB_TYPE), self.default)
+            self.resolved[key] = cls
+
+        return cls
+
+    def copy(self) -> ModelRegistry:
+        """Return an independent copy of the registry."""
+        registry = ModelRegistry(self.default)
+        registry._classes = dict(self._classes)
+        return registry
+
+
+def default_registry() -> ModelRegistry:
+    """Return a new registry with the classes of this library."""
+    registry = ModelRegistry()
+    registry.register(OnOff, LOAD_TYPE_ONOFF)
+    registry.register(Dim, LOAD_TYPE_DIM)
+    registry.register(Dali, LOAD_TYPE_DALI, LOAD_SUBTYPE_NONE)
+    registry.register(DaliTw, LOAD_TYPE_DALI, LOAD_SUBTYPE_DALI_TW)
+    registry.register(DaliRgbw, LOAD_TYPE_DALI, LOAD_SUBTYPE_DALI_RGB)
+    registry.register(Motor, LOAD_TYPE_MOTOR)
+    registry.register(Hvac, LOAD_TYPE_HVAC)
+    registry.register(Brightness, SENSOR_TYPE_BRIGHTNESS)
+    registry.register(Hail, SENSOR_TYPE_HAIL)
+    registry.register(Rain, SENSOR_TYPE_RAIN)
+    registry.register(Temperature, SENSOR_TYPE_TEMPERATURE)
+    registry.register(Wind, SENSOR_TYPE_WIND)
+    registry.register(Humidity, SENSOR_TYPE_HUMIDITY)
+    registry.register(Co2, SENSOR_TYPE_CO2)
+    registry.register(Window, SENSOR_TYPE_WINDOW)
+
+    return registry
+
+
+# Registry used by all API instances not given their own.
+MODEL_REGISTRY = default_registry()
@@ -0,0 +1,83 @@
+"""Single-flight coalescing of identical in-flight requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import copy
+import re
+from typing import Any
+
+from .request_scheduler import RequestPriority, request_priority
+
+# GET requests that are commands to the µGateway (running jobs, pinging
+# devices, opening a device configuration session, etc.) instead of reads.
+COMMAND_PATH_PATTERN = re.compile(
+    r"(^|/)(run|ctrl|trigger|execute|setflags|ping|refresh_properties|calibration"
+    r"|notify|start|stop|reboot|test|scan)(/|$)|^devices/[^/]+/config$"
+)
+
+
+class RequestCoalescer:
+    """Share one underlying request between concurrent identical callers.
+
+    The first caller for a key (miss) starts the request, every caller with
+    the same key arriving before it completes (hit) awaits the same result.
+    Hits receive a deep copy of the parsed result, as model classes may
+    modify the raw data they are initialized with.
+    """
+
+    def __init__(self):
+        """Initialize a request coalescer."""
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently in flight."""
+        return len(self._in_flight)
+
+    async def run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory for key, or join an identical request in flight."""
+        task = self._in_flight.get(key)
+
+        if task is not None:
+            self.hits += 1
+            return copy.deepcopy(await asyncio.shield(task))
+
+        self.misses += 1
+        task = asyncio.ensure_future(factory())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda t: self._on_done(key, t))
+
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished request."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+        # Mark the exception as retrieved in case all callers were cancelled.
+        if not task.cancelled():
+            task.exception()
+
+
+def is_coalescable(path: str) -> bool:
+    """Return True if concurrent GET requests for path may share a response.
+
+    Commands must reach the µGateway once per call, e.g. two concurrent
+    button triggers of a job toggle twice.
+    """
+    return request_priority(path) != RequestPriority.HIGH and not (
+        COMMAND_PATH_PATTERN.search(path)
+    )
+
+
+def request_key(path: str, params: Any, require_token: bool) -> Hashable:
+    """Build a hashable coalescing key for a GET request."""
+    if params is None:
+        return (path, None, require_token)
+
+    items = params.items() if hasattr(params, "items") else params
+    return (path, tuple(sorted((str(k), str(v)) for k, v in items)), require_token)
@@ -0,0 +1,149 @@
+"""Per-gateway request scheduling with bounded concurrency and priority lanes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+import contextlib
+from dataclasses import dataclass
+from enum import IntEnum
+import re
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+# Paths of interactive commands that should not wait behind background polling.
+INTERACTIVE_PATH_PATTERN = re.compile(
+    r"^(loads|hvacgroups)/\d+/(target_state|ctrl)$|^jobs/\d+/(run|ctrl|trigger)(/|$)"
+)
+
+
+class RequestPriority(IntEnum):
+    """Available request priority lanes. Lower values are served first."""
+
+    HIGH = 0
+    NORMAL = 1
+
+
+@dataclass
+class RequestSchedulerStats:
+    """Counters to observe and tune the request scheduler."""
+
+    requests: int = 0
+    queued: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    @property
+    def wait_time_avg(self) -> float:
+        """Average time a queued request had to wait for a free slot."""
+        return self.wait_time_total / self.queued if self.queued else 0.0
+
+
+def request_priority(path: str) -> RequestPriority:
+    """Return the default priority lane for a request.
+
+    Interactive commands (target states, button controls and job runs) are
+    sent with high priority. Everything else, most notably background GET
+    requests, is sent with normal priority.
+    """
+    if INTERACTIVE_PATH_PATTERN.match(path):
+        return RequestPriority.HIGH
+
+    return RequestPriority.NORMAL
+
+
+class RequestScheduler:
+    """Limit the number of in-flight requests to a single µGateway.
+
+    The µGateway is a small embedded device and starts timing out under
+    parallel load. Requests exceeding the concurrency limit are queued per
+    priority lane. Whenever a slot frees up, it is handed over to the oldest
+    waiter of the highest priority lane.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENT_REQUESTS):
+        """Initialize a request scheduler.
+
+        Args:
+            max_concurrency: Maximum number of simultaneous requests.
+
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._max_concurrency = max_concurrency
+        self._in_flight = 0
+        self._lanes: dict[RequestPriority, deque[asyncio.Future]] = {
+            priority: deque() for priority in sorted(RequestPriority)
+        }
+        self.stats = RequestSchedulerStats()
+
+    @property
+    def max_concurrency(self) -> int:
+        """Maximum number of simultaneous requests."""
+        return self._max_concurrency
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def queue_depth(self, priority: RequestPriority | None = None) -> int:
+        """Return the number of waiting requests, optionally for one lane only."""
+        if priority is not None:
+            return len(self._lanes[priority])
+
+        return sum(len(lane) for lane in self._lanes.values())
+
+    async def acquire(self, priority: RequestPriority = RequestPriority.NORMAL) -> None:
+        """Wait for a free request slot."""
+        self.stats.requests += 1
+
+        if self._in_flight < self._max_concurrency and not self.queue_depth():
+            self._in_flight += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        lane = self._lanes[priority]
+        lane.append(waiter)
+        self.stats.queued += 1
+        start = loop.time()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot has already been handed over, pass it on.
+                self.release()
+            else:
+                with contextlib.suppress(ValueError):
+                    lane.remove(waiter)
+            raise
+
+        waited = loop.time() - start
+        self.stats.wait_time_total += waited
+        self.stats.wait_time_max = max(self.stats.wait_time_max, waited)
+
+    def release(self) -> None:
+        """Free a request slot and hand it over to the next waiter."""
+        for lane in self._lanes.values():
+            while lane:
+                waiter = lane.popleft()
+                if not waiter.done():
+                    waiter.set_result(None)
+                    return
+
+        self._in_flight -= 1
+
+    @contextlib.asynccontextmanager
+    async def slot(
+        self, priority: RequestPriority = RequestPriority.NORMAL
+    ) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of the context."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
@@ -0,0 +1,168 @@
+"""TTL response cache for rarely changing read endpoints."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+import copy
+import re
+import time
+from typing import Any
+
+DEFAULT_CACHE_MAX_ENTRIES = 256
+
+# Time to live in seconds per resource (first path segment).
+DEFAULT_CACHE_TTLS = {
+    "devices": 3600,
+    "jobs": 300,
+    "loads": 300,
+    "rooms": 3600,
+    "scenes": 300,
+    "sensors": 60,
+    "site": 3600,
+    "timers": 300,
+}
+
+# Websocket message keys and the resource they invalidate.
+WEBSOCKET_RESOURCE_MAP = {
+    "hvacgroup": "hvacgroups",
+    "load": "loads",
+    "sensor": "sensors",
+}
+
+# Fields of state pushes, which do not change the cached definitions. Sensor
+# values are part of the cached sensors, so their pushes always invalidate.
+WEBSOCKET_STATE_FIELDS = {
+    "hvacgroup": frozenset({"id", "state"}),
+    "load": frozenset({"id", "state"}),
+}
+
+# Only collections and single items are cached, e.g. `loads` or `loads/3`.
+CACHEABLE_PATH_PATTERN = re.compile(r"^([a-z]+)(/[^/]+)?$")
+
+# Path segments that never describe a cacheable resource or a definition change.
+UNCACHEABLE_SEGMENTS = frozenset({"state", "target_state", "ctrl", "ping", "findme"})
+
+
+def path_resource(path: str) -> str:
+    """Return the resource a request path belongs to."""
+    return path.split("/", 1)[0]
+
+
+class ResponseCache:
+    """Size-bounded TTL cache for parsed GET responses.
+
+    The cache is opt-in. Pass an instance as cache keyword argument to Auth to
+    enable it. Entries are invalidated whenever a write request to the same
+    resource succeeds. Entries are also invalidated by the changes pushed by
+    the µGateway once a websocket is attached with Auth.attach_websocket().
+    """
+
+    def __init__(
+        self,
+        ttls: dict[str, float] | None = None,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ):
+        """Initialize a response cache.
+
+        Args:
+            ttls: Time to live in seconds per resource, e.g. {"loads": 60}.
+                  Resources without TTL are not cached.
+            max_entries: Maximum number of cached responses. The least
+                  recently used entries are evicted first.
+
+        """
+        self._ttls = DEFAULT_CACHE_TTLS if ttls is None else ttls
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[str, float, Any]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def is_cacheable(self, path: str) -> bool:
+        """Return True if responses for path may be cached."""
+        match = CACHEABLE_PATH_PATTERN.match(path)
+        if match is None or match.group(1) not in self._ttls:
+            return False
+
+        return path.rsplit("/", 1)[-1] not in UNCACHEABLE_SEGMENTS
+
+    def generation(self, path: str) -> int:
+        """Return the invalidation generation of the resource of path."""
+        return self._generations.get(path_resource(path), 0)
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return a tuple of (hit, data) for a cache key."""
+        entry = self._entries.get(key)
+
+        if entry is None or entry[1] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, copy.deepcopy(entry[2])
+
+    def set(self, key: Hashable, path: str, data: Any, generation: int) -> None:
+        """Store the response for path, unless it got invalidated in the meantime."""
+        resource = path_resource(path)
+        if generation != self._generations.get(resource, 0):
+            return
+
+        expires = time.monotonic() + self._ttls[resource]
+        self._entries[key] = (resource, expires, copy.deepcopy(data))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, resource: str) -> None:
+        """Drop all cached responses of a resource."""
+        self._generations[resource] = self._generations.get(resource, 0) + 1
+
+        for key in [k for k, e in self._entries.items() if e[0] == resource]:
+            del self._entries[key]
+
+    def invalidate_path(self, path: str) -> None:
+        """Drop cached responses affected by a successful write to path."""
+        if path.rsplit("/", 1)[-1] in UNCACHEABLE_SEGMENTS:
+            return
+
+        self.invalidate(path_resource(path))
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        for resource in {e[0] for e in self._entries.values()}:
+            self.invalidate(resource)
+
+    def on_websocket_message(self, data: Any) -> None:
+        """Invalidate resources affected by a websocket message.
+
+        State pushes of loads and HVAC groups are ignored, as their state is
+        never cached.
+        """
+        if not isinstance(data, dict):
+            return
+
+        for key, resource in WEBSOCKET_RESOURCE_MAP.items():
+            payload = data.get(key)
+            if payload is None:
+                continue
+
+            state_fields = WEBSOCKET_STATE_FIELDS.get(key)
+            if (
+                state_fields is not None
+                and isinstance(payload, dict)
+                and payload.keys() <= state_fields
+            ):
+                continue
+
+            self.invalidate(resource)
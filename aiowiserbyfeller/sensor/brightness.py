@@ -19,6 +19,8 @@ class BrightnessRecord:
 class Brightness(Sensor):
     """Representation of a brightness sensor in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def value_brightness(self) -> int:
         """Current brightness."""
@@ -19,6 +19,8 @@ class Co2Record:
 class Co2(Sensor):
     """Representation of a CO2 sensor in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def value_co2(self) -> float:
         """Current CO2 concentration in ppm."""
@@ -19,6 +19,8 @@ class HailRecord:
 class Hail(Sensor):
     """Representation of a hail sensor in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def value_hail(self) -> bool:
         """Indicates if hail is being detected."""
@@ -19,6 +19,8 @@ class HumidityRecord:
 class Humidity(Sensor):
     """Representation of a humidity sensor in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def value_humidity(self) -> float:
         """Current relative humidity."""
@@ -19,6 +19,8 @@ class RainRecord:
 class Rain(Sensor):
     """Representation of a rain sensor in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def value_rain(self) -> bool:
         """Indicates if rain is being detected."""
@@ -9,6 +9,8 @@ from aiowiserbyfeller.util import normalize_unit
 class Sensor:
     """Representation of a sensor in the Feller Wiser µGateway API."""
 
+    __slots__ = ("__weakref__", "auth", "raw_data")
+
     def __init__(self, raw_data: dict, auth: Auth):
         """Initialize a sensor object."""
         self.raw_data = raw_data
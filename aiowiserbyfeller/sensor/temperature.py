@@ -19,6 +19,8 @@ class TemperatureRecord:
 class Temperature(Sensor):
     """Representation of a temperature sensor in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def value_temperature(self) -> float:
         """Current temperature."""
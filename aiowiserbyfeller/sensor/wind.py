@@ -19,6 +19,8 @@ class WindRecord:
 class Wind(Sensor):
     """Representation of a wind sensor in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def value_wind_speed(self) -> int:
         """Current wind speed."""
@@ -19,6 +19,8 @@ class WindowRecord:
 class Window(Sensor):
     """Representation of a window sensor in the Feller Wiser µGateway API."""
 
+    __slots__ = ()
+
     @property
     def value_window(self) -> bool:
         """Indicates if the window is open."""
@@ -0,0 +1,22 @@
+"""Wiser by Feller site snapshot submodule."""
+
+from .model import ReconcileResult, SiteModel
+from .snapshot import SiteSnapshot
+from .sync import (
+    DEFAULT_SYNC_PHASES,
+    PhaseTiming,
+    SyncOrchestrator,
+    SyncPhase,
+    SyncResult,
+)
+
+__all__ = [
+    "DEFAULT_SYNC_PHASES",
+    "PhaseTiming",
+    "ReconcileResult",
+    "SiteModel",
+    "SiteSnapshot",
+    "SyncOrchestrator",
+    "SyncPhase",
+    "SyncResult",
+]
@@ -0,0 +1,209 @@
+"""Hydrated model set of a µGateway site."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+import time
+from typing import TYPE_CHECKING, Any
+
+from aiowiserbyfeller.button import Button
+from aiowiserbyfeller.device import Device
+from aiowiserbyfeller.hvac import HvacGroup
+from aiowiserbyfeller.job import Job
+from aiowiserbyfeller.load import Load
+from aiowiserbyfeller.scene import Scene
+from aiowiserbyfeller.sensor import Sensor
+
+if TYPE_CHECKING:
+    from aiowiserbyfeller.api import WiserByFellerAPI
+
+# Entity lists of a site model whose entries have a state besides their data.
+STATEFUL_KINDS = ("loads", "hvac_groups")
+
+# Fields of a site model holding raw data instead of model instances.
+RAW_KINDS = ("rooms", "info", "created")
+
+
+@dataclass
+class ReconcileResult:
+    """Changes applied to a site model by a reconcile.
+
+    Counts entities over all kinds. Entities whose data did not change are
+    neither counted as updated nor touched.
+    """
+
+    added: int = 0
+    removed: int = 0
+    updated: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """True if anything was added, removed or updated."""
+        return bool(self.added or self.removed or self.updated)
+
+
+@dataclass
+class SiteModel:
+    """All loads, sensors, devices, HVAC groups, scenes, jobs, buttons and rooms.
+
+    info is the µGateway information (see WiserByFellerAPI.async_get_info).
+    Devices are the entries of the devices summary (see DeviceInventory for
+    their details). created is the time the data was fetched from the
+    µGateway, as returned by time.time().
+    """
+
+    loads: list[Load] = field(default_factory=list)
+    sensors: list[Sensor] = field(default_factory=list)
+    devices: list[Device] = field(default_factory=list)
+    hvac_groups: list[HvacGroup] = field(default_factory=list)
+    scenes: list[Scene] = field(default_factory=list)
+    jobs: list[Job] = field(default_factory=list)
+    buttons: list[Button] = field(default_factory=list)
+    rooms: list[dict] = field(default_factory=list)
+    info: dict = field(default_factory=dict)
+    created: float = 0.0
+
+    @property
+    def entity_count(self) -> int:
+        """Number of entities of all kinds."""
+        return sum(
+            len(getattr(self, model_field.name))
+            for model_field in fields(self)
+            if model_field.name not in ("info", "created")
+        )
+
+    @classmethod
+    def from_results(cls, results: Mapping[str, Any]) -> SiteModel:
+        """Build the site model from the results of the sync phases.
+
+        Args:
+            results: The results by phase name, see DEFAULT_SYNC_PHASES.
+                Missing phases leave their entities empty.
+
+        """
+        loads = results.get("loads", [])
+        states = {
+            item["id"]: item.get("state") for item in results.get("load_states", [])
+        }
+        for load in loads:
+            load.raw_state = states.get(load.id)
+
+        hvac_groups = results.get("hvac_groups", [])
+        states = {
+            item["id"]: item.get("state")
+            for item in results.get("hvac_group_states", [])
+        }
+        for group in hvac_groups:
+            group.raw_state = states.get(group.id)
+
+        return cls(
+            info=results.get("info", {}),
+            loads=loads,
+            sensors=results.get("sensors", []),
+            devices=results.get("devices", []),
+            hvac_groups=hvac_groups,
+            scenes=results.get("scenes", []),
+            jobs=results.get("jobs", []),
+            buttons=results.get("buttons", []),
+            rooms=results.get("rooms", []),
+            created=time.time(),
+        )
+
+    def to_dict(self) -> dict:
+        """Return the raw data of all models, e.g. to store a snapshot."""
+        result: dict[str, Any] = {kind: getattr(self, kind) for kind in RAW_KINDS}
+        for kind in ("sensors", "devices", "scenes", "jobs", "buttons"):
+            result[kind] = [item.raw_data for item in getattr(self, kind)]
+        for kind in STATEFUL_KINDS:
+            result[kind] = [
+                {"data": item.raw_data, "state": item.raw_state}
+                for item in getattr(self, kind)
+            ]
+
+        return result
+
+    @classmethod
+    def from_dict(cls, data: dict, api: WiserByFellerAPI) -> SiteModel:
+        """Hydrate the models from raw data returned by to_dict()."""
+        auth = api.auth
+        loads = []
+        for item in data.get("loads", []):
+            load = api.resolve_class(item["data"])
+            load.raw_state = item["state"]
+            loads.append(load)
+
+        return cls(
+            loads=loads,
+            sensors=[api.resolve_class(item) for item in data.get("sensors", [])],
+            devices=[api.resolve_device(item) for item in data.get("devices", [])],
+            hvac_groups=[
+                HvacGroup(item["data"], auth, item["state"])
+                for item in data.get("hvac_groups", [])
+            ],
+            scenes=[Scene(item, auth) for item in data.get("scenes", [])],
+            jobs=[Job(item, auth) for item in data.get("jobs", [])],
+            buttons=[Button(item, auth) for item in data.get("buttons", [])],
+            rooms=data.get("rooms", []),
+            info=data.get("info", {}),
+            created=data.get("created", 0.0),
+        )
+
+    def merge(self, other: SiteModel) -> ReconcileResult:
+        """Update this model to the data of a newer one.
+
+        Instances of entities known to both models are kept and receive the
+        new data, so references held by the application stay valid. An
+        entity whose class changed (e.g. a load with a new type) is replaced.
+        """
+        result = ReconcileResult()
+        for model_field in fields(self):
+            kind = model_field.name
+            if kind == "created":
+                continue
+            if kind in RAW_KINDS:
+                if getattr(self, kind) != getattr(other, kind):
+                    result.updated += 1
+                    setattr(self, kind, getattr(other, kind))
+                continue
+
+            setattr(
+                self,
+                kind,
+                _merge_items(getattr(self, kind), getattr(other, kind), result),
+            )
+
+        self.created = other.created
+        return result
+
+
+def _merge_items(current: list, new: list, result: ReconcileResult) -> list:
+    """Return new, reusing the current instances of unchanged entities."""
+    known = {item.id: item for item in current if item.id is not None}
+    merged = []
+    for item in new:
+        if item.id is None:
+            # E.g. buttons that are not registered, which cannot be matched.
+            merged.append(item)
+            continue
+
+        existing = known.pop(item.id, None)
+        if existing is None or type(existing) is not type(item):
+            result.added += existing is None
+            result.updated += existing is not None
+            merged.append(item)
+            continue
+
+        stateful = hasattr(item, "raw_state")
+        if existing.raw_data != item.raw_data or (
+            stateful and existing.raw_state != item.raw_state
+        ):
+            existing.raw_data = item.raw_data
+            if stateful:
+                existing.raw_state = item.raw_state
+            result.updated += 1
+
+        merged.append(existing)
+
+    result.removed += len(known)
+    return merged
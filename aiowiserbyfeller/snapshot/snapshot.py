@@ -0,0 +1,224 @@
+"""Warm start from a snapshot of the site model stored on disk."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError
+
+from aiowiserbyfeller.errors import AiowiserbyfellerException
+
+from .model import ReconcileResult, SiteModel
+from .sync import SyncOrchestrator, SyncResult
+
+if TYPE_CHECKING:
+    from aiowiserbyfeller.api import WiserByFellerAPI
+
+SNAPSHOT_VERSION = 1
+LOGGER = logging.getLogger(__name__)
+
+
+def read_snapshot(path: Path) -> dict | None:
+    """Return the content of a snapshot file, or None if there is none."""
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return None
+
+
+def write_snapshot(path: Path, content: dict) -> None:
+    """Replace a snapshot file atomically with compact, compressed JSON."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as file:
+        json.dump(content, file, separators=(",", ":"))
+    tmp_path.replace(path)
+
+
+class SiteSnapshot:
+    """Restore the site model from disk on start and reconcile it in the background.
+
+    Fetching all models of a site takes many requests. A snapshot stores
+    the hydrated models in a compressed file, so a restarted application
+    can use them right away. async_start() restores the snapshot and
+    fetches the current data from the µGateway in the background. The
+    restored instances are updated in place, so they can be used while the
+    reconcile is running.
+
+    Without a usable snapshot (first start, other µGateway, unreadable or
+    outdated file), async_start() fetches the site model before returning.
+
+    Usage:
+        snapshot = SiteSnapshot(api, "/config/wiser_snapshot.json.gz")
+        model = await snapshot.async_start()
+        ...  # use model.loads etc. right away
+        await snapshot.async_wait_reconciled()
+    """
+
+    def __init__(
+        self,
+        api: WiserByFellerAPI,
+        path: str | os.PathLike,
+        *,
+        logger: logging.Logger = LOGGER,
+    ):
+        """Initialize a site snapshot.
+
+        Args:
+            api: The API used to fetch the site model.
+            path: The snapshot file.
+            logger: The logger to use.
+
+        """
+        self._api = api
+        self._path = Path(path)
+        self._logger = logger
+        self._reconcile_task: asyncio.Task | None = None
+        self._saved = False
+        self.model: SiteModel | None = None
+        self.last_sync: SyncResult | None = None
+        self.restored = False
+
+    @property
+    def reconciling(self) -> bool:
+        """True while a background reconcile is running."""
+        return self._reconcile_task is not None and not self._reconcile_task.done()
+
+    async def async_start(self) -> SiteModel:
+        """Return the restored site model and reconcile it in the background.
+
+        Fetches the site model if no snapshot could be restored.
+        """
+        if await self.async_restore() is None:
+            return await self.async_refresh()
+
+        self._reconcile_task = asyncio.get_running_loop().create_task(
+            self._async_reconcile_in_background()
+        )
+        return self.model
+
+    async def async_restore(self) -> SiteModel | None:
+        """Load the site model from the snapshot file, if it is usable."""
+        try:
+            content: Any = await asyncio.to_thread(read_snapshot, self._path)
+        except (OSError, EOFError, ValueError) as e:
+            self._logger.warning("Ignoring snapshot %s: %s", self._path, e)
+            return None
+
+        if content is None:
+            return None
+
+        if (
+            not isinstance(content, dict)
+            or content.get("version") != SNAPSHOT_VERSION
+            or content.get("host") != self._api.auth.host
+        ):
+            self._logger.info("Ignoring outdated snapshot %s", self._path)
+            return None
+
+        try:
+            self.model = SiteModel.from_dict(content["model"], self._api)
+        except (KeyError, TypeError, AttributeError) as e:
+            self._logger.warning("Ignoring invalid snapshot %s: %s", self._path, e)
+            return None
+
+        self.restored = True
+        self._saved = True
+        return self.model
+
+    async def async_refresh(self) -> SiteModel:
+        """Fetch the site model, merge it into the current one and save it."""
+        await self.async_reconcile()
+        return self.model
+
+    async def async_reconcile(self) -> ReconcileResult:
+        """Fetch the site model and update the current one to it.
+
+        The snapshot file is written if anything changed. The timings of the
+        fetch are available in last_sync.
+
+        Raises:
+            The error of the first sync phase that failed, which is not
+            limited to the errors of the API.
+
+        """
+        self.last_sync = await SyncOrchestrator(self._api).async_run()
+        if not self.last_sync.ok:
+            raise next(iter(self.last_sync.errors.values()))
+
+        fetched = self.last_sync.model
+        if self.model is None:
+            self.model = fetched
+            result = ReconcileResult(added=fetched.entity_count)
+        else:
+            result = self.model.merge(fetched)
+
+        if result.changed or not self._saved:
+            await self.async_save()
+
+        return result
+
+    async def async_save(self) -> None:
+        """Write the current site model to the snapshot file."""
+        if self.model is None:
+            return
+
+        content = {
+            "version": SNAPSHOT_VERSION,
+            "host": self._api.auth.host,
+            "model": self.model.to_dict(),
+        }
+        try:
+            await asyncio.to_thread(write_snapshot, self._path, content)
+        except OSError as e:
+            self._logger.warning("Could not write snapshot %s: %s", self._path, e)
+            return
+
+        self._saved = True
+
+    async def async_wait_reconciled(self) -> ReconcileResult | None:
+        """Wait for the background reconcile started by async_start().
+
+        Returns:
+            The changes applied, or None if there was no reconcile or it
+            failed with any error.
+
+        """
+        if self._reconcile_task is None:
+            return None
+
+        return await self._reconcile_task
+
+    async def async_close(self) -> None:
+        """Cancel a running background reconcile."""
+        if self._reconcile_task is None or self._reconcile_task.done():
+            return
+
+        self._reconcile_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._reconcile_task
+
+    async def _async_reconcile_in_background(self) -> ReconcileResult | None:
+        """Reconcile the restored model, logging errors.
+
+        The sync phases may fail with any error, e.g. on an unexpected
+        response, which must not escape the background task.
+        """
+        try:
+            result = await self.async_reconcile()
+        except (AiowiserbyfellerException, ClientError, asyncio.TimeoutError) as e:
+            self._logger.warning("Could not reconcile site snapshot: %s", e)
+            return None
+        except Exception:
+            self._logger.exception("Unexpected error reconciling site snapshot")
+            return None
+
+        self._logger.debug("Reconciled site snapshot: %s", result)
+        return result
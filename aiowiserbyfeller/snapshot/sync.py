@@ -0,0 +1,206 @@
+"""Concurrent initial sync of a site with dependency ordering."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from .model import SiteModel
+
+if TYPE_CHECKING:
+    from aiowiserbyfeller.api import WiserByFellerAPI
+
+
+@dataclass(frozen=True)
+class SyncPhase:
+    """A fetch of the initial sync.
+
+    name is the key of the result in SiteModel.from_results(). A phase
+    starts as soon as all phases it depends on have finished.
+    """
+
+    name: str
+    fetch: Callable[[WiserByFellerAPI], Awaitable[Any]]
+    depends_on: tuple[str, ...] = ()
+
+
+@dataclass
+class PhaseTiming:
+    """Timing of a sync phase.
+
+    started and finished are seconds since the start of the sync. waited
+    is the time the phase waited for the phases it depends on. A phase
+    that was skipped, because a phase it depends on failed, has that error.
+    """
+
+    name: str
+    started: float = 0.0
+    finished: float = 0.0
+    waited: float = 0.0
+    error: Exception | None = None
+    skipped: bool = False
+
+    @property
+    def duration(self) -> float:
+        """Seconds the fetch of the phase took."""
+        return self.finished - self.started
+
+
+@dataclass
+class SyncResult:
+    """Outcome of an initial sync.
+
+    model is None if any phase failed.
+    """
+
+    model: SiteModel | None = None
+    phases: dict[str, PhaseTiming] = field(default_factory=dict)
+    total: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if all phases succeeded."""
+        return self.model is not None
+
+    @property
+    def errors(self) -> dict[str, Exception]:
+        """Errors of the failed phases, excluding skipped ones."""
+        return {
+            name: timing.error
+            for name, timing in self.phases.items()
+            if timing.error is not None and not timing.skipped
+        }
+
+    @property
+    def slowest(self) -> list[PhaseTiming]:
+        """All phases, the longest running first."""
+        return sorted(
+            self.phases.values(), key=lambda timing: timing.duration, reverse=True
+        )
+
+    def format_timings(self) -> str:
+        """Return a table of the phase timings, e.g. for logging."""
+        lines = [f"{'phase':20} {'start':>8} {'duration':>9} {'waited':>8}"]
+        for timing in sorted(self.phases.values(), key=lambda item: item.started):
+            status = ""
+            if timing.skipped:
+                status = "  skipped"
+            elif timing.error is not None:
+                status = f"  failed: {timing.error!r}"
+            lines.append(
+                f"{timing.name:20} {timing.started:8.3f} {timing.duration:9.3f}"
+                f" {timing.waited:8.3f}{status}"
+            )
+        lines.append(f"{'total':20} {'':8} {self.total:9.3f}")
+
+        return "\n".join(lines)
+
+
+DEFAULT_SYNC_PHASES = (
+    SyncPhase("info", lambda api: api.async_get_info()),
+    SyncPhase("loads", lambda api: api.async_get_loads()),
+    SyncPhase("load_states", lambda api: api.async_get_loads_state(), ("loads",)),
+    SyncPhase("sensors", lambda api: api.async_get_sensors()),
+    SyncPhase("devices", lambda api: api.async_get_devices()),
+    SyncPhase("hvac_groups", lambda api: api.async_get_hvac_groups()),
+    SyncPhase(
+        "hvac_group_states",
+        lambda api: api.async_get_hvac_group_states(),
+        ("hvac_groups",),
+    ),
+    SyncPhase("scenes", lambda api: api.async_get_scenes()),
+    SyncPhase("jobs", lambda api: api.async_get_jobs()),
+    SyncPhase("buttons", lambda api: api.async_get_buttons()),
+    SyncPhase("rooms", lambda api: api.async_get_rooms()),
+)
+
+
+class SyncOrchestrator:
+    """Fetch the site model with all independent phases running concurrently.
+
+    Each phase starts as soon as the phases it depends on have finished,
+    e.g. states are fetched after the definitions of their entities. The
+    number of simultaneous requests is limited by the request scheduler of
+    the Auth instance, so running all phases at once does not overload the
+    µGateway.
+
+    Usage:
+        result = await SyncOrchestrator(api).async_run()
+        print(result.format_timings())
+        model = result.model
+    """
+
+    def __init__(
+        self,
+        api: WiserByFellerAPI,
+        phases: Iterable[SyncPhase] = DEFAULT_SYNC_PHASES,
+    ):
+        """Initialize a sync orchestrator.
+
+        Args:
+            api: The API used to fetch the phases.
+            phases: The phases to run. Phases depend only on phases listed
+                before them.
+
+        """
+        self._api = api
+        self._phases = list(phases)
+
+        known: set[str] = set()
+        for phase in self._phases:
+            unknown = set(phase.depends_on) - known
+            if unknown:
+                raise ValueError(
+                    f"Phase {phase.name} depends on unknown or later phases: "
+                    f"{', '.join(sorted(unknown))}"
+                )
+            if phase.name in known:
+                raise ValueError(f"Duplicate phase {phase.name}")
+            known.add(phase.name)
+
+    async def async_run(self) -> SyncResult:
+        """Run all phases and build the site model from their results."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = SyncResult()
+        tasks: dict[str, asyncio.Task] = {}
+
+        async def run(phase: SyncPhase, timing: PhaseTiming) -> Any:
+            dependencies = [tasks[name] for name in phase.depends_on]
+            if dependencies:
+                await asyncio.wait(dependencies)
+            timing.started = loop.time() - start
+            timing.waited = timing.started
+
+            for name in phase.depends_on:
+                error = result.phases[name].error
+                if error is not None:
+                    timing.finished = timing.started
+                    timing.error = error
+                    timing.skipped = True
+                    raise error
+
+            try:
+                return await phase.fetch(self._api)
+            except Exception as e:
+                timing.error = e
+                raise
+            finally:
+                timing.finished = loop.time() - start
+
+        for phase in self._phases:
+            timing = PhaseTiming(phase.name)
+            result.phases[phase.name] = timing
+            tasks[phase.name] = loop.create_task(run(phase, timing))
+
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        result.total = loop.time() - start
+
+        if not result.errors:
+            result.model = SiteModel.from_results(
+                {name: task.result() for name, task in tasks.items()}
+            )
+
+        return result
@@ -0,0 +1,5 @@
+"""Wiser by Feller state store submodule."""
+
+from .store import StateStore
+
+__all__ = ["StateStore"]
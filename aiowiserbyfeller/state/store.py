@@ -0,0 +1,161 @@
+"""Live in-memory state of loads, sensors and HVAC groups."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from aiowiserbyfeller.load import Load
+from aiowiserbyfeller.sensor import Sensor
+
+if TYPE_CHECKING:
+    from aiowiserbyfeller.api import WiserByFellerAPI
+
+
+class StateStore:
+    """In-memory store for the current state of a µGateway site.
+
+    The store is seeded once from the REST API and kept up to date by
+    applying websocket messages. All lookups are served from memory.
+
+    Usage:
+        store = StateStore(api)
+        await store.async_seed()
+        websocket.subscribe(store.on_message)
+    """
+
+    def __init__(self, api: WiserByFellerAPI):
+        """Initialize a state store."""
+        self._api = api
+        self._loads: dict[int, Load] = {}
+        self._loads_by_device: dict[str, dict[int, Load]] = {}
+        self._loads_by_room: dict[int, list[Load]] = {}
+        self._sensors: dict[int, Sensor] = {}
+        self._sensors_by_device: dict[str, list[Sensor]] = {}
+        self._hvac_group_states: dict[int, dict] = {}
+
+    async def async_seed(self) -> None:
+        """Fetch loads, sensors and their states from the µGateway.
+
+        Call again to pick up loads or sensors added after the initial seed.
+        """
+        loads, load_states, sensors, hvac_group_states = await asyncio.gather(
+            self._api.async_get_loads(),
+            self._api.async_get_loads_state(),
+            self._api.async_get_sensors(),
+            self._api.async_get_hvac_group_states(),
+        )
+
+        states = {item["id"]: item.get("state") for item in load_states}
+        for load in loads:
+            load.raw_state = states.get(load.id)
+
+        self._index_loads(loads)
+        self._index_sensors(sensors)
+        self._hvac_group_states = {
+            item["id"]: item.get("state") or {} for item in hvac_group_states
+        }
+
+    def _index_loads(self, loads: list[Load]) -> None:
+        """Build the load lookup tables."""
+        self._loads = {}
+        self._loads_by_device = {}
+        self._loads_by_room = {}
+
+        for load in loads:
+            self._loads[load.id] = load
+            self._loads_by_device.setdefault(load.device, {})[load.channel] = load
+            self._loads_by_room.setdefault(load.room, []).append(load)
+
+    def _index_sensors(self, sensors: list[Sensor]) -> None:
+        """Build the sensor lookup tables."""
+        self._sensors = {}
+        self._sensors_by_device = {}
+
+        for sensor in sensors:
+            self._sensors[sensor.id] = sensor
+            self._sensors_by_device.setdefault(sensor.device, []).append(sensor)
+
+    def on_message(self, data: dict) -> None:
+        """Apply a websocket message to the stored state."""
+        if "load" in data:
+            self.apply_load_state(data["load"].get("id"), data["load"].get("state"))
+        elif "sensor" in data:
+            self.apply_sensor_data(data["sensor"].get("id"), data["sensor"])
+        elif "hvacgroup" in data:
+            self.apply_hvac_group_state(
+                data["hvacgroup"].get("id"), data["hvacgroup"].get("state")
+            )
+
+    def apply_load_state(self, load_id: int, state: dict | None) -> bool:
+        """Merge a state delta into a known load. Returns False if unknown."""
+        load = self._loads.get(load_id)
+        if load is None or state is None:
+            return False
+
+        if load.raw_state is None:
+            load.raw_state = dict(state)
+        else:
+            load.raw_state.update(state)
+
+        return True
+
+    def apply_sensor_data(self, sensor_id: int, data: dict) -> bool:
+        """Merge new values into a known sensor. Returns False if unknown."""
+        sensor = self._sensors.get(sensor_id)
+        if sensor is None:
+            return False
+
+        sensor.raw_data.update(data)
+        return True
+
+    def apply_hvac_group_state(self, group_id: int, state: dict | None) -> bool:
+        """Merge a state delta into a known HVAC group. Returns False if unknown."""
+        if group_id not in self._hvac_group_states or state is None:
+            return False
+
+        self._hvac_group_states[group_id].update(state)
+        return True
+
+    @property
+    def loads(self) -> list[Load]:
+        """All known loads."""
+        return list(self._loads.values())
+
+    @property
+    def sensors(self) -> list[Sensor]:
+        """All known sensors."""
+        return list(self._sensors.values())
+
+    def load(self, load_id: int) -> Load | None:
+        """Return a load by id."""
+        return self._loads.get(load_id)
+
+    def load_state(self, load_id: int) -> dict | None:
+        """Return the current state of a load by id."""
+        load = self._loads.get(load_id)
+        return None if load is None else load.raw_state
+
+    def load_by_channel(self, device_id: str, channel: int) -> Load | None:
+        """Return the load connected to a device output channel."""
+        return self._loads_by_device.get(device_id, {}).get(channel)
+
+    def loads_by_device(self, device_id: str) -> list[Load]:
+        """Return all loads of a device."""
+        return list(self._loads_by_device.get(device_id, {}).values())
+
+    def loads_by_room(self, room_id: int) -> list[Load]:
+        """Return all loads in a room."""
+        return list(self._loads_by_room.get(room_id, []))
+
+    def sensor(self, sensor_id: int) -> Sensor | None:
+        """Return a sensor by id."""
+        return self._sensors.get(sensor_id)
+
+    def sensors_by_device(self, device_id: str) -> list[Sensor]:
+        """Return all sensors of a device."""
+        return list(self._sensors_by_device.get(device_id, []))
+
+    def hvac_group_state(self, group_id: int) -> dict | None:
+        """Return the current state of an HVAC group by id."""
+        return self._hvac_group_states.get(group_id)
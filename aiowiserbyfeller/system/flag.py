@@ -7,6 +7,8 @@ from aiowiserbyfeller.const import HTTP_METHOD_PATCH
 class SystemFlag:
     """Class that represents system flag in the Feller Wiser µGateway API."""
 
+    __slots__ = ("__weakref__", "auth", "raw_data")
+
     def __init__(self, raw_data: dict, auth: Auth):
         """Initialize.
 
@@ -6,6 +6,8 @@ from aiowiserbyfeller.auth import Auth
 class NtpConfig:
     """Representation of an NTP time configuration in the Feller Wiser µGateway API."""
 
+    __slots__ = ("__weakref__", "auth", "raw_data")
+
     def __init__(self, raw_data: dict, auth: Auth):
         """Initialize n NTP config object."""
         self.raw_data = raw_data
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from .const import (
     DEVICE_A_TYPE_DIMMER_DALI,
     DEVICE_A_TYPE_DIMMER_LED,
@@ -24,7 +26,15 @@ from .const import (
     UNIT_TEMPERATURE_CELSIUS,
 )
 from .errors import InvalidArgument
-from .map import DEVICE_A_BLOCK_FWID_BLOCK_MAP, DEVICE_A_BLOCK_HWID_MAP
+from .map import (
+    DEVICE_A_BLOCK_FWID_BLOCK_MAP,
+    DEVICE_A_BLOCK_HWID_NAMES,
+    DEVICE_FWID_BLOCK_NAMES,
+)
+
+# Number of distinct values the device identification helpers remember.
+# A site has a few dozen distinct product references and ids.
+PARSER_CACHE_SIZE = 256
 
 
 def validate_str(value, valid, **kwargs):
@@ -39,6 +49,12 @@ def validate_str(value, valid, **kwargs):
 
 def parse_wiser_device_ref_c(value: str) -> dict:
     """Parse a Feller Wiser control (Bedienaufsatz) product reference."""
+    return dict(_parse_wiser_device_ref_c(value))
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _parse_wiser_device_ref_c(value: str) -> dict:
+    """Parse a control product reference, memoized."""
     result = {
         "type": None,
         "wlan": ".W" in value,
@@ -94,6 +110,12 @@ def parse_wiser_device_ref_c(value: str) -> dict:
 
 def parse_wiser_device_ref_a(value: str) -> dict:
     """Parse a Feller Wiser actuator (Funktionseinsatz) product reference."""
+    return dict(_parse_wiser_device_ref_a(value))
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _parse_wiser_device_ref_a(value: str) -> dict:
+    """Parse an actuator product reference, memoized."""
     result = {"loads": 0, "generation": None}
 
     if "3400" in value:
@@ -146,6 +168,12 @@ def parse_wiser_device_hwid_a(value: str) -> dict[str, int | None]:
     This helper function breaks out each value into a dict.
 
     """
+    return dict(_parse_wiser_device_hwid_a(value))
+
+
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _parse_wiser_device_hwid_a(value: str) -> dict[str, int | None]:
+    """Parse an A block hardware ID, memoized."""
     result = {
         "revision": None,
         "features": None,
@@ -185,7 +213,12 @@ def parse_wiser_device_fwid(value: str) -> dict[str, int | None]:
 
     This helper function breaks out each value into a dict.
     """
+    return dict(_parse_wiser_device_fwid(value))
+
 
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
+def _parse_wiser_device_fwid(value: str) -> dict[str, int | None]:
+    """Parse a firmware ID, memoized."""
     result = {
         "block_type": None,
         "revision": None,
@@ -209,25 +242,22 @@ def parse_wiser_device_fwid(value: str) -> dict[str, int | None]:
     return result
 
 
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
 def get_device_name_by_hwid_a(value: str | None) -> str:
     """Return device name by hardware ID."""
-    best_match = "Unknown"
-
     if value in (None, ""):
-        return best_match
+        return "Unknown"
 
-    info = parse_wiser_device_hwid_a(value)
-    for entry in DEVICE_A_BLOCK_HWID_MAP:
-        if entry["type"] == info["type"]:
-            if entry["feature"] == info["features"]:
-                best_match = entry["name"]
-                break  # Exact match
-            if entry["feature"] is None:
-                best_match = entry["name"]  # Temporarily set, but continue searching
+    info = _parse_wiser_device_hwid_a(value)
+    name = DEVICE_A_BLOCK_HWID_NAMES.get(
+        (info["type"], info["features"]),
+        DEVICE_A_BLOCK_HWID_NAMES.get((info["type"], None), "Unknown"),
+    )
 
-    return best_match + (f" {info['channels']}K" if info["channels"] != 0x0 else "")
+    return name + (f" {info['channels']}K" if info["channels"] != 0x0 else "")
 
 
+@lru_cache(maxsize=PARSER_CACHE_SIZE)
 def get_device_name_by_fwid(
     value: str | None, include_block_suffix: bool = False
 ) -> str:
@@ -236,18 +266,15 @@ def get_device_name_by_fwid(
         return "Unknown"
 
     fw_id = int(value, 16)
-    b = (
-        DEVICE_A_BLOCK_FWID_BLOCK_MAP[0]
-        if (fw_id & 0x8000)
-        else DEVICE_A_BLOCK_FWID_BLOCK_MAP[1]
-    )
+    index = 0 if (fw_id & 0x8000) else 1
+    block = DEVICE_A_BLOCK_FWID_BLOCK_MAP[index]
+    name = DEVICE_FWID_BLOCK_NAMES[index].get(fw_id & block["mask"])
 
-    for map_fwid, name in b["fw_id_map"].items():
-        if (map_fwid & b["mask"]) == (fw_id & b["mask"]):
-            suffix = b["main_name"] if include_block_suffix else ""
-            return f"{name} {suffix}".strip()
+    if name is None:
+        return "Unknown"
 
-    return "Unknown"
+    suffix = block["main_name"] if include_block_suffix else ""
+    return f"{name} {suffix}".strip()
 
 
 def normalize_unit(value):
@@ -1,5 +1,35 @@
 """Wiser by Feller websocket module."""
 
+from .conflator import ConflationStats, MessageConflator
+from .events import (
+    ButtonEvent,
+    FindMeEvent,
+    HvacGroupEvent,
+    LoadEvent,
+    SensorEvent,
+    WebsocketEvent,
+    parse_event,
+)
+from .message import classify_message
+from .resync import StateResync
+from .subscriber import AsyncSubscriber, OverflowPolicy, SubscriberStats
 from .websocket import Websocket, WebsocketWatchdog
 
-__all__ = ["Websocket", "WebsocketWatchdog"]
+__all__ = [
+    "AsyncSubscriber",
+    "ButtonEvent",
+    "ConflationStats",
+    "FindMeEvent",
+    "HvacGroupEvent",
+    "LoadEvent",
+    "MessageConflator",
+    "OverflowPolicy",
+    "SensorEvent",
+    "StateResync",
+    "SubscriberStats",
+    "Websocket",
+    "WebsocketEvent",
+    "WebsocketWatchdog",
+    "classify_message",
+    "parse_event",
+]
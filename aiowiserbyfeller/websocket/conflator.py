@@ -0,0 +1,204 @@
+"""Per-entity conflation of websocket message bursts."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import inspect
+import logging
+from typing import Any
+
+from .message import classify_message
+
+DEFAULT_CONFLATION_INTERVAL = 0.5
+DEFAULT_CONFLATION_QUIET_PERIOD = 0.1
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class ConflationStats:
+    """Counters of a message conflator."""
+
+    received: int = 0
+    delivered: int = 0
+    dropped: int = 0
+    merged: int = 0
+
+
+def merge_message(old: dict, new: dict) -> dict:
+    """Merge two messages field-wise, values of the newer message win."""
+    result = dict(old)
+
+    for key, value in new.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = merge_message(result[key], value)
+        else:
+            result[key] = value
+
+    return result
+
+
+class MessageConflator:
+    """Keep only the newest message per entity and deliver them in ticks.
+
+    Dimming ramps and motor movements produce a flood of intermediate state
+    messages. The conflator keeps one pending message per entity. Newer
+    messages are merged field-wise into the pending one, so partial updates
+    do not lose fields. Pending messages are flushed when the burst goes
+    quiet or at the latest after the configured interval. While an async
+    callback is still busy, messages keep being conflated, so a slow consumer
+    gets one update per entity per tick instead of a backlog.
+
+    Messages without entity (e.g. unknown message kinds) are not conflated
+    but delivered with the next flush.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[dict], Any] | Callable[[dict], Awaitable[Any]],
+        *,
+        interval: float = DEFAULT_CONFLATION_INTERVAL,
+        quiet_period: float = DEFAULT_CONFLATION_QUIET_PERIOD,
+        logger: logging.Logger = LOGGER,
+    ):
+        """Initialize a message conflator.
+
+        Args:
+            callback: Sync or async function called with each conflated message.
+            interval: Maximum seconds a message is held back.
+            quiet_period: Flush after this many seconds without new messages.
+            logger: The logger to use.
+
+        """
+        self._callback = callback
+        self._interval = interval
+        self._quiet_period = quiet_period
+        self._logger = logger
+        self._pending: dict[Any, dict] = {}
+        self._counts: dict[Any, int] = {}
+        self._sequence = 0
+        self._interval_handle: asyncio.TimerHandle | None = None
+        self._quiet_handle: asyncio.TimerHandle | None = None
+        self._delivery: asyncio.Task | None = None
+        self._closed = False
+        self.stats = ConflationStats()
+
+    @property
+    def pending(self) -> int:
+        """Number of messages waiting to be delivered."""
+        return len(self._pending)
+
+    def push(self, data: dict) -> None:
+        """Add a message. Can be used as a websocket subscriber.
+
+        Messages pushed after close() are ignored.
+        """
+        if self._closed:
+            return
+
+        self.stats.received += 1
+        kind, entity_id = classify_message(data)
+
+        if kind is None or entity_id is None:
+            self._sequence += 1
+            key = (None, self._sequence)
+        else:
+            key = (kind, entity_id)
+
+        if key in self._pending:
+            self._pending[key] = merge_message(self._pending[key], data)
+            self._counts[key] += 1
+            self.stats.dropped += 1
+        else:
+            self._pending[key] = data
+            self._counts[key] = 1
+
+        loop = asyncio.get_running_loop()
+        if self._interval_handle is None:
+            self._interval_handle = loop.call_later(self._interval, self.flush)
+
+        if self._quiet_handle is not None:
+            self._quiet_handle.cancel()
+        self._quiet_handle = loop.call_later(self._quiet_period, self.flush)
+
+    def flush(self) -> None:
+        """Deliver all pending messages now."""
+        self._cancel_timers()
+
+        if not self._pending or (
+            self._delivery is not None and not self._delivery.done()
+        ):
+            return
+
+        batch = list(self._pending.items())
+        self._pending = {}
+        counts, self._counts = self._counts, {}
+
+        messages = []
+        for key, message in batch:
+            if counts[key] > 1:
+                self.stats.merged += 1
+            messages.append(message)
+
+        if inspect.iscoroutinefunction(self._callback):
+            self._delivery = asyncio.get_running_loop().create_task(
+                self._async_deliver(messages)
+            )
+            return
+
+        for message in messages:
+            self._deliver(message)
+
+    def _deliver(self, message: dict) -> None:
+        """Call the sync callback for one message."""
+        self.stats.delivered += 1
+        try:
+            self._callback(message)
+        except Exception:
+            self._logger.exception("Error in conflated websocket subscriber")
+
+    async def _async_deliver(self, messages: list[dict]) -> None:
+        """Await the async callback for each message of a batch."""
+        for message in messages:
+            self.stats.delivered += 1
+            try:
+                await self._callback(message)
+            except Exception:
+                self._logger.exception("Error in conflated websocket subscriber")
+
+        if self._pending and self._interval_handle is None:
+            # Messages arrived during a delivery whose timers already fired.
+            self._interval_handle = asyncio.get_running_loop().call_later(0, self.flush)
+
+    async def async_flush(self) -> None:
+        """Deliver all pending messages and wait for the delivery to finish."""
+        while True:
+            if self._delivery is not None and not self._delivery.done():
+                await self._delivery
+                continue
+
+            self.flush()
+
+            if self._delivery is None or self._delivery.done():
+                return
+
+    def close(self) -> None:
+        """Stop the conflator and discard pending and further messages."""
+        self._closed = True
+        self._cancel_timers()
+        self._pending = {}
+        self._counts = {}
+
+        if self._delivery is not None:
+            self._delivery.cancel()
+            self._delivery = None
+
+    def _cancel_timers(self) -> None:
+        """Cancel the flush timers."""
+        for handle in (self._interval_handle, self._quiet_handle):
+            if handle is not None:
+                handle.cancel()
+
+        self._interval_handle = None
+        self._quiet_handle = None
@@ -0,0 +1,174 @@
+"""Typed events parsed from websocket messages."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+
+from aiowiserbyfeller.const import (
+    MESSAGE_KIND_BUTTON,
+    MESSAGE_KIND_FINDME,
+    MESSAGE_KIND_HVAC_GROUP,
+    MESSAGE_KIND_LOAD,
+    MESSAGE_KIND_SENSOR,
+)
+
+from .message import classify_message
+
+DEFAULT_EVENT_QUEUE_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class WebsocketEvent:
+    """A websocket message classified by kind and entity.
+
+    Messages of unknown kind are delivered as plain WebsocketEvent with
+    kind None. The original message is always available as data.
+    """
+
+    kind: str | None
+    entity_id: Any
+    data: dict
+
+    @classmethod
+    def from_payload(cls, kind: str, entity_id: Any, data: dict, payload: Any):
+        """Create an event from a classified message and its payload."""
+        return cls(kind, entity_id, data)
+
+
+@dataclass(frozen=True, slots=True)
+class LoadEvent(WebsocketEvent):
+    """State change of a load."""
+
+    state: dict
+
+    @classmethod
+    def from_payload(cls, kind: str, entity_id: Any, data: dict, payload: Any):
+        """Create a load event."""
+        return cls(kind, entity_id, data, payload.get("state") or {})
+
+
+@dataclass(frozen=True, slots=True)
+class HvacGroupEvent(WebsocketEvent):
+    """State change of an HVAC group."""
+
+    state: dict
+
+    @classmethod
+    def from_payload(cls, kind: str, entity_id: Any, data: dict, payload: Any):
+        """Create an HVAC group event."""
+        return cls(kind, entity_id, data, payload.get("state") or {})
+
+
+@dataclass(frozen=True, slots=True)
+class SensorEvent(WebsocketEvent):
+    """New value of a sensor."""
+
+    value: Any
+
+    @classmethod
+    def from_payload(cls, kind: str, entity_id: Any, data: dict, payload: Any):
+        """Create a sensor event."""
+        return cls(kind, entity_id, data, payload.get("value"))
+
+
+@dataclass(frozen=True, slots=True)
+class FindMeEvent(WebsocketEvent):
+    """Button pressed while the find me mode is on.
+
+    target is the kind of entity that was found, e.g. "load".
+    """
+
+    target: str | None
+
+    @classmethod
+    def from_payload(cls, kind: str, entity_id: Any, data: dict, payload: Any):
+        """Create a find me event."""
+        return cls(kind, entity_id, data, next(iter(payload), None))
+
+
+@dataclass(frozen=True, slots=True)
+class ButtonEvent(WebsocketEvent):
+    """Button event, e.g. of a smart button."""
+
+    payload: dict
+
+    @classmethod
+    def from_payload(cls, kind: str, entity_id: Any, data: dict, payload: Any):
+        """Create a button event."""
+        return cls(kind, entity_id, data, payload)
+
+
+EVENT_CLASSES: dict[str, type[WebsocketEvent]] = {
+    MESSAGE_KIND_LOAD: LoadEvent,
+    MESSAGE_KIND_HVAC_GROUP: HvacGroupEvent,
+    MESSAGE_KIND_SENSOR: SensorEvent,
+    MESSAGE_KIND_FINDME: FindMeEvent,
+    MESSAGE_KIND_BUTTON: ButtonEvent,
+}
+
+
+def parse_event(data: Any) -> WebsocketEvent:
+    """Classify a websocket message and return the matching event."""
+    kind, entity_id = classify_message(data)
+
+    if kind is None:
+        return WebsocketEvent(None, None, data)
+
+    payload = data[kind]
+    if not isinstance(payload, dict):
+        return WebsocketEvent(kind, entity_id, data)
+
+    return EVENT_CLASSES[kind].from_payload(kind, entity_id, data, payload)
+
+
+class EventStream:
+    """Bounded queue of websocket events, consumed by async iteration.
+
+    If the queue is full, message intake waits for the consumer.
+    """
+
+    def __init__(self, queue_size: int = DEFAULT_EVENT_QUEUE_SIZE):
+        """Initialize an event stream.
+
+        Args:
+            queue_size: Maximum number of queued events.
+
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self._queue: asyncio.Queue[WebsocketEvent | None] = asyncio.Queue(queue_size)
+        self._closed = False
+
+    @property
+    def queued(self) -> int:
+        """Number of events waiting to be consumed."""
+        return self._queue.qsize()
+
+    async def put(self, event: WebsocketEvent) -> None:
+        """Queue an event, waiting while the queue is full."""
+        if not self._closed:
+            await self._queue.put(event)
+
+    def close(self) -> None:
+        """End the iteration once the queued events are consumed."""
+        self._closed = True
+        if not self._queue.full():
+            self._queue.put_nowait(None)
+
+    def __aiter__(self) -> EventStream:
+        """Return the event iterator."""
+        return self
+
+    async def __anext__(self) -> WebsocketEvent:
+        """Return the next event."""
+        if self._closed and self._queue.empty():
+            raise StopAsyncIteration
+
+        event = await self._queue.get()
+        if event is None:
+            raise StopAsyncIteration
+
+        return event
@@ -0,0 +1,58 @@
+"""Classification of websocket messages sent by the µGateway."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aiowiserbyfeller.const import (
+    MESSAGE_KIND_BUTTON,
+    MESSAGE_KIND_FINDME,
+    MESSAGE_KIND_HVAC_GROUP,
+    MESSAGE_KIND_LOAD,
+    MESSAGE_KIND_SENSOR,
+)
+
+MESSAGE_KINDS = (
+    MESSAGE_KIND_LOAD,
+    MESSAGE_KIND_SENSOR,
+    MESSAGE_KIND_HVAC_GROUP,
+    MESSAGE_KIND_FINDME,
+    MESSAGE_KIND_BUTTON,
+)
+
+
+def classify_message(data: Any) -> tuple[str | None, Any]:
+    """Return the kind and entity id of a websocket message.
+
+    Unknown messages are classified as (None, None).
+
+    Examples:
+        {"load": {"id": 3, "state": {...}}}   -> ("load", 3)
+        {"sensor": {"id": 5, "value": 21.5}}  -> ("sensor", 5)
+        {"findme": {"load": 345}}             -> ("findme", 345)
+        {"button": {"device": "0000...", ...}} -> ("button", "0000...")
+
+    """
+    if not isinstance(data, dict):
+        return None, None
+
+    for kind in MESSAGE_KINDS:
+        payload = data.get(kind)
+        if payload is None:
+            continue
+
+        if not isinstance(payload, dict):
+            return kind, None
+
+        if kind == MESSAGE_KIND_FINDME:
+            target = next(iter(payload.values()), None)
+            if isinstance(target, dict):
+                target = target.get("id", target.get("device"))
+            return kind, target
+
+        if "id" in payload or kind != MESSAGE_KIND_BUTTON:
+            return kind, payload.get("id")
+
+        return kind, payload.get("device")
+
+    return None, None
@@ -0,0 +1,108 @@
+"""Bulk state resynchronization after websocket reconnects."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import TYPE_CHECKING, Any
+
+from aiowiserbyfeller.const import (
+    MESSAGE_KIND_HVAC_GROUP,
+    MESSAGE_KIND_LOAD,
+    MESSAGE_KIND_SENSOR,
+)
+
+if TYPE_CHECKING:
+    from aiowiserbyfeller.api import WiserByFellerAPI
+
+
+class StateResync:
+    """Recover state changes missed while the websocket was disconnected.
+
+    The resync keeps the last known state of every load, HVAC group and
+    sensor, updated from live websocket messages. After a reconnect it
+    fetches the current states in bulk and returns synthetic websocket
+    messages for the entities whose state differs from the last known one.
+    Subscribers receive them like regular messages, so they end up with a
+    consistent view without reloading everything themselves.
+
+    Usage:
+        websocket = Websocket(host, token, resync=StateResync(api))
+    """
+
+    def __init__(self, api: WiserByFellerAPI):
+        """Initialize a state resync."""
+        self._api = api
+        self._known: dict[str, dict[Any, dict]] = {
+            MESSAGE_KIND_LOAD: {},
+            MESSAGE_KIND_HVAC_GROUP: {},
+            MESSAGE_KIND_SENSOR: {},
+        }
+        self.seeded = False
+
+    def track(self, data: dict) -> None:
+        """Remember the state contained in a websocket message."""
+        if MESSAGE_KIND_SENSOR in data:
+            sensor = data[MESSAGE_KIND_SENSOR]
+            known = self._known[MESSAGE_KIND_SENSOR].setdefault(sensor.get("id"), {})
+            known.update(copy.deepcopy(sensor))
+            return
+
+        for kind in (MESSAGE_KIND_LOAD, MESSAGE_KIND_HVAC_GROUP):
+            if kind in data and data[kind].get("state") is not None:
+                entity = data[kind]
+                known = self._known[kind].setdefault(entity.get("id"), {})
+                known.update(copy.deepcopy(entity["state"]))
+                return
+
+    async def _async_fetch(self) -> dict[str, dict[Any, dict]]:
+        """Fetch the current state of all entities."""
+        load_states, hvac_group_states, sensors = await asyncio.gather(
+            self._api.async_get_loads_state(),
+            self._api.async_get_hvac_group_states(),
+            self._api.async_get_sensors(),
+        )
+
+        return {
+            MESSAGE_KIND_LOAD: {
+                item["id"]: item.get("state") or {} for item in load_states
+            },
+            MESSAGE_KIND_HVAC_GROUP: {
+                item["id"]: item.get("state") or {} for item in hvac_group_states
+            },
+            MESSAGE_KIND_SENSOR: {sensor.id: sensor.raw_data for sensor in sensors},
+        }
+
+    async def async_seed(self) -> None:
+        """Fetch the current state as baseline without emitting messages."""
+        self._known = await self._async_fetch()
+        self.seeded = True
+
+    async def async_resync(self) -> list[dict]:
+        """Fetch the current state and return messages for changed entities.
+
+        Returns:
+            Synthetic websocket messages in the format sent by the µGateway,
+            one per entity whose state changed since it was last seen.
+
+        """
+        current = await self._async_fetch()
+        messages = []
+
+        for kind, entities in current.items():
+            known = self._known[kind]
+            for entity_id, state in entities.items():
+                if known.get(entity_id) == state:
+                    continue
+
+                if kind == MESSAGE_KIND_SENSOR:
+                    messages.append({kind: copy.deepcopy(state)})
+                else:
+                    messages.append(
+                        {kind: {"id": entity_id, "state": copy.deepcopy(state)}}
+                    )
+
+        self._known = current
+        self.seeded = True
+
+        return messages
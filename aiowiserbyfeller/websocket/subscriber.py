@@ -0,0 +1,158 @@
+"""Isolated async websocket subscribers with bounded queues."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import Enum
+import itertools
+import logging
+from typing import Any
+
+from .message import classify_message
+
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 1000
+LOGGER = logging.getLogger(__name__)
+
+
+class OverflowPolicy(Enum):
+    """Behavior of a subscriber queue when it is full."""
+
+    BLOCK = "block"  # Wait for the subscriber, slowing down message intake
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest queued message
+    CONFLATE = "conflate"  # Replace queued messages of the same entity
+
+
+@dataclass
+class SubscriberStats:
+    """Counters of an async subscriber."""
+
+    delivered: int = 0
+    dropped: int = 0
+    conflated: int = 0
+    errors: int = 0
+
+
+class AsyncSubscriber:
+    """Deliver messages to an async callback from its own queue and worker task.
+
+    A slow callback only delays its own messages. Exceptions raised by the
+    callback are logged, counted and passed to the optional error handler,
+    but never stop the worker.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[Any], Awaitable],
+        *,
+        queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+        on_error: Callable[[Exception, Any], None] | None = None,
+        logger: logging.Logger = LOGGER,
+    ):
+        """Initialize an async subscriber.
+
+        Args:
+            callback: The coroutine function to call for each message.
+            queue_size: Maximum number of queued messages.
+            overflow: What to do with new messages if the queue is full.
+            on_error: Called with the exception and message if the callback fails.
+            logger: The logger to use.
+
+        """
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+
+        self.callback = callback
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._on_error = on_error
+        self._logger = logger
+        self._items: OrderedDict[Any, Any] = OrderedDict()
+        self._sequence = itertools.count()
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task: asyncio.Task | None = None
+        self._stopped = False
+        self.stats = SubscriberStats()
+
+    @property
+    def queued(self) -> int:
+        """Number of messages waiting for delivery."""
+        return len(self._items)
+
+    def _key(self, data: Any) -> Any:
+        """Return the queue key of a message."""
+        if self._overflow is OverflowPolicy.CONFLATE:
+            kind, entity_id = classify_message(data)
+            if kind is not None and entity_id is not None:
+                return (kind, entity_id)
+
+        return (None, next(self._sequence))
+
+    async def put(self, data: Any) -> None:
+        """Queue a message for delivery, unless the subscriber was stopped."""
+        if self._stopped:
+            return
+
+        key = self._key(data)
+
+        if key in self._items:
+            self._items[key] = data
+            self.stats.conflated += 1
+            return
+
+        while len(self._items) >= self._queue_size:
+            if self._overflow is OverflowPolicy.BLOCK:
+                self._not_full.clear()
+                await self._not_full.wait()
+            else:
+                self._items.popitem(last=False)
+                self.stats.dropped += 1
+
+        self._items[key] = data
+        self._idle.clear()
+        self._not_empty.set()
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        """Deliver queued messages one by one."""
+        while True:
+            while not self._items:
+                self._idle.set()
+                self._not_empty.clear()
+                await self._not_empty.wait()
+
+            _, data = self._items.popitem(last=False)
+            self._not_full.set()
+
+            try:
+                await self.callback(data)
+            except Exception as e:
+                self.stats.errors += 1
+                self._logger.exception("Error in async websocket subscriber")
+                if self._on_error is not None:
+                    self._on_error(e, data)
+            else:
+                self.stats.delivered += 1
+
+    async def join(self) -> None:
+        """Wait until all queued messages are delivered."""
+        await self._idle.wait()
+
+    def stop(self) -> None:
+        """Stop the worker task and discard queued and further messages."""
+        self._stopped = True
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+        self._items.clear()
+        self._not_full.set()
+        self._idle.set()
@@ -3,18 +3,40 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
-import json
+from collections.abc import AsyncIterator, Awaitable, Callable
 import logging
+import random
+from typing import Any
 
 import websockets.client
 
+from aiowiserbyfeller.codec import DEFAULT_CODEC, JsonCodec
+
+from .conflator import (
+    DEFAULT_CONFLATION_INTERVAL,
+    DEFAULT_CONFLATION_QUIET_PERIOD,
+    MessageConflator,
+)
+from .events import DEFAULT_EVENT_QUEUE_SIZE, EventStream, WebsocketEvent, parse_event
+from .resync import StateResync
+from .subscriber import DEFAULT_SUBSCRIBER_QUEUE_SIZE, AsyncSubscriber, OverflowPolicy
+
 DEFAULT_WATCHDOG_TIMEOUT = 900
+DEFAULT_RECONNECT_DELAY = 1.0
+DEFAULT_MAX_RECONNECT_DELAY = 60.0
+DEFAULT_MAX_RECONNECT_ATTEMPTS = 10
+DEFAULT_PING_TIMEOUT = 10.0
 LOGGER = logging.getLogger(__name__)
 
 
 class WebsocketWatchdog:
-    """Watchdog to ensure websocket connection health."""
+    """Watchdog to ensure websocket connection health.
+
+    Activity only stores a timestamp. A single deadline timer checks it when
+    it fires and re-arms itself for the remaining time if there was activity
+    in the meantime, so resetting the watchdog is cheap even at high message
+    rates.
+    """
 
     def __init__(
         self,
@@ -35,6 +57,12 @@ class WebsocketWatchdog:
         self._logger = logger
         self._timeout = timeout_seconds
         self._timer_task: asyncio.TimerHandle | None = None
+        self._last_activity = 0.0
+
+    @property
+    def last_activity(self) -> float:
+        """Event loop time of the last activity."""
+        return self._last_activity
 
     def cancel(self) -> None:
         """Cancel the watchdog."""
@@ -50,18 +78,55 @@ class WebsocketWatchdog:
         )
         await self._action()
 
+    def touch(self) -> None:
+        """Record activity, postponing the expiration."""
+        loop = asyncio.get_running_loop()
+        self._last_activity = loop.time()
+
+        if self._timer_task is None:
+            self._timer_task = loop.call_at(
+                self._last_activity + self._timeout, self._check_deadline
+            )
+
     async def trigger(self) -> None:
         """Reset the watchdog timeout."""
         self._logger.debug(
             "Watchdog triggered - sleeping for %s seconds", self._timeout
         )
+        self.touch()
 
-        if self._timer_task:
-            self._timer_task.cancel()
+    def _check_deadline(self) -> None:
+        """Expire or re-arm the timer depending on the last activity."""
+        loop = asyncio.get_running_loop()
+        deadline = self._last_activity + self._timeout
 
-        self._timer_task = asyncio.get_running_loop().call_later(
-            self._timeout, lambda: asyncio.create_task(self.on_expire())
-        )
+        if loop.time() < deadline:
+            self._timer_task = loop.call_at(deadline, self._check_deadline)
+            return
+
+        self._timer_task = None
+        loop.create_task(self.on_expire())  # noqa: RUF006
+
+
+def reconnect_delay(
+    attempt: int,
+    base: float = DEFAULT_RECONNECT_DELAY,
+    maximum: float = DEFAULT_MAX_RECONNECT_DELAY,
+) -> float:
+    """Return the delay before a reconnect attempt.
+
+    The delay doubles with every attempt up to maximum. Half of it is
+    randomized, so clients do not reconnect in lockstep after the
+    µGateway restarts.
+
+    Args:
+        attempt: Number of the reconnect attempt, starting at 1.
+        base: Delay before the first attempt in seconds.
+        maximum: Upper limit of the delay in seconds.
+
+    """
+    delay = min(maximum, base * 2 ** (attempt - 1))
+    return delay / 2 + random.uniform(0, delay / 2)
 
 
 class Websocket:
@@ -69,40 +134,227 @@ class Websocket:
 
     # pylint: disable=too-many-instance-attributes
 
-    def __init__(self, host: str, token: str, logger: logging.Logger = LOGGER):
+    def __init__(
+        self,
+        host: str,
+        token: str,
+        logger: logging.Logger = LOGGER,
+        *,
+        on_subscriber_error: Callable[[Exception, Any], None] | None = None,
+        resync: StateResync | None = None,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+        max_reconnect_delay: float = DEFAULT_MAX_RECONNECT_DELAY,
+        max_reconnect_attempts: int | None = DEFAULT_MAX_RECONNECT_ATTEMPTS,
+        ping_interval: float | None = None,
+        ping_timeout: float = DEFAULT_PING_TIMEOUT,
+        codec: JsonCodec = DEFAULT_CODEC,
+    ):
         """Initialize.
 
         Args:
             host: Hostname or IP of µGateway
             token: Secret token for connetion (see Auth.claim())
             logger: The logger to use.
+            on_subscriber_error: Called with the exception and message if a
+                subscriber raises an exception.
+            resync: Fetches missed state changes after a reconnect and
+                delivers them to the subscribers as synthetic messages.
+            reconnect_delay: Delay before the first reconnect in seconds.
+                Doubles with every failed attempt (with jitter).
+            max_reconnect_delay: Upper limit of the reconnect delay in seconds.
+            max_reconnect_attempts: Give up after this many consecutive
+                connections closed without receiving a message. None retries
+                forever.
+            ping_interval: Measure the round-trip time with a ping every this
+                many seconds (see ping_rtt). None disables pinging.
+            ping_timeout: Seconds to wait for the pong of a ping.
+            codec: Decodes the messages, the fastest installed one by default.
 
         """
         self._host = host
         self._token = token
         self._ws = None
         self._subscribers = []
-        self._async_subscribers = []
+        self._async_subscribers: list[AsyncSubscriber] = []
+        self._topic_subscribers: dict[tuple[str, Any], list[Callable]] = {}
+        self._async_topic_subscribers: dict[tuple[str, Any], list[AsyncSubscriber]] = {}
+        self._on_subscriber_error = on_subscriber_error
+        self._conflators: list[MessageConflator] = []
+        self._event_streams: list[EventStream] = []
         self._watchdog = WebsocketWatchdog(logger, self.on_watchdog_timeout)
         self._logger = logger
+        self._resync = resync
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._max_reconnect_attempts = max_reconnect_attempts
+        self._ping_interval = ping_interval
+        self._ping_timeout = ping_timeout
+        self._ping_rtt: float | None = None
+        self._codec = codec
         self._errcount = 0
+        self._connections = 0
         self._idle = True
+        self._closing = False
 
     def subscribe(self, callback):
         """Add callback to be called when new data arrives."""
         self._subscribers.append(callback)
 
-    def async_subscribe(self, callback):
-        """Add async callback to be called when new data arrives."""
-        self._async_subscribers.append(callback)
+    def async_subscribe(
+        self,
+        callback,
+        *,
+        queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> AsyncSubscriber:
+        """Add async callback to be called when new data arrives.
+
+        Each async callback is run by its own worker task from a bounded
+        queue, so a slow callback does not delay other subscribers. If the
+        queue is full, new messages are handled according to overflow:
+        BLOCK waits for the callback (slowing down message intake),
+        DROP_OLDEST discards the oldest queued message and CONFLATE
+        replaces queued messages of the same entity.
+        """
+        subscriber = self._create_async_subscriber(callback, queue_size, overflow)
+        self._async_subscribers.append(subscriber)
+
+        return subscriber
+
+    def _create_async_subscriber(
+        self, callback, queue_size: int, overflow: OverflowPolicy
+    ) -> AsyncSubscriber:
+        """Create an async subscriber reporting to this websocket."""
+        return AsyncSubscriber(
+            callback,
+            queue_size=queue_size,
+            overflow=overflow,
+            on_error=self._on_subscriber_error,
+            logger=self._logger,
+        )
+
+    def subscribe_topic(
+        self, kind: str, callback: Callable, entity_id: Any = None
+    ) -> Callable[[], None]:
+        """Add callback to be called for messages of one kind only.
+
+        Args:
+            kind: Message kind, e.g. "load", "sensor", "hvacgroup", "findme"
+                  or "button" (see MESSAGE_KIND_* constants).
+            callback: Called with the message dict.
+            entity_id: Only deliver messages for this entity id.
+
+        Returns:
+            A function that removes the subscription again.
+
+        """
+        return self._add_topic_subscriber(
+            self._topic_subscribers, (kind, entity_id), callback
+        )
+
+    def async_subscribe_topic(
+        self,
+        kind: str,
+        callback: Callable[..., Awaitable],
+        entity_id: Any = None,
+        *,
+        queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+        overflow: OverflowPolicy = OverflowPolicy.BLOCK,
+    ) -> Callable[[], None]:
+        """Add async callback to be called for messages of one kind only.
+
+        See subscribe_topic() and async_subscribe() for details.
+        """
+        subscriber = self._create_async_subscriber(callback, queue_size, overflow)
+        unsubscribe = self._add_topic_subscriber(
+            self._async_topic_subscribers, (kind, entity_id), subscriber
+        )
+
+        def unsubscribe_and_stop() -> None:
+            unsubscribe()
+            subscriber.stop()
+
+        return unsubscribe_and_stop
+
+    def subscribe_conflated(
+        self,
+        callback: Callable,
+        *,
+        interval: float = DEFAULT_CONFLATION_INTERVAL,
+        quiet_period: float = DEFAULT_CONFLATION_QUIET_PERIOD,
+    ) -> MessageConflator:
+        """Add a sync or async callback that receives conflated messages.
+
+        Only the newest message per entity is delivered, at the latest after
+        interval seconds or when no new message arrived for quiet_period
+        seconds. The returned conflator exposes dropped and merged counts.
+        """
+        conflator = MessageConflator(
+            callback,
+            interval=interval,
+            quiet_period=quiet_period,
+            logger=self._logger,
+        )
+        self._conflators.append(conflator)
+        self.subscribe(conflator.push)
+
+        return conflator
+
+    async def events(
+        self, *, queue_size: int = DEFAULT_EVENT_QUEUE_SIZE
+    ) -> AsyncIterator[WebsocketEvent]:
+        """Iterate over typed events parsed from the incoming messages.
+
+        Each message is parsed once, no matter how many iterators are
+        active. Events are buffered in a bounded queue. If the consumer falls
+        behind and the queue is full, message intake waits for it. The
+        iteration ends when the websocket is closed.
+
+        Usage:
+            async for event in websocket.events():
+                if isinstance(event, LoadEvent):
+                    ...
+        """
+        stream = EventStream(queue_size)
+        self._event_streams.append(stream)
+
+        try:
+            async for event in stream:
+                yield event
+        finally:
+            if stream in self._event_streams:
+                self._event_streams.remove(stream)
+            stream.close()
+
+    @staticmethod
+    def _add_topic_subscriber(
+        registry: dict[tuple[str, Any], list], topic: tuple[str, Any], callback
+    ) -> Callable[[], None]:
+        """Register a topic subscriber and return its unsubscribe function."""
+        registry.setdefault(topic, []).append(callback)
+
+        def unsubscribe() -> None:
+            callbacks = registry.get(topic, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks:
+                registry.pop(topic, None)
+
+        return unsubscribe
 
     def init(self):
         """Connect to µGateway."""
         asyncio.create_task(self.connect())  # noqa: RUF006
 
     async def connect(self):
-        """Initiate connection and start message processing loop."""
+        """Initiate connection and start message processing loop.
+
+        Closed connections are reopened with exponential backoff. After each
+        reconnect, missed state changes are fetched if a resync is configured.
+        The loop ends without reconnecting once async_close() was called.
+        """
         self._idle = False
+        self._closing = False
         await self._watchdog.trigger()
 
         while True:
@@ -111,40 +363,199 @@ class Websocket:
                     f"ws://{self._host}/api",
                     extra_headers={"Authorization": f"Bearer {self._token}"},
                 ):
+                    if self._closing:
+                        await ws.close()
+                        break
+
+                    self._ws = ws
+                    self._connections += 1
+                    received = False
+                    pinger = self._start_pinger(ws)
+
                     try:
+                        await self._async_sync_state()
                         async for message in ws:
+                            received = True
                             await self.on_message(message)
+
+                        # Iteration ends without error on a normal close.
+                        if self._closing:
+                            break
                     except websockets.ConnectionClosed:
+                        # Disconnected until the next connection is open.
+                        self._ws = None
+                        if self._closing:
+                            break
+
+                        if received:
+                            self.reset_error_count()
+
                         self._errcount += 1
-                        if self._errcount > 10:
+                        if (
+                            self._max_reconnect_attempts is not None
+                            and self._errcount > self._max_reconnect_attempts
+                        ):
                             self._logger.error(
                                 "µGateway websocket connection closed "
-                                "10 times. Exiting connection..."
+                                "%s times. Exiting connection...",
+                                self._max_reconnect_attempts,
                             )
                             break
 
+                        delay = reconnect_delay(
+                            self._errcount,
+                            self._reconnect_delay,
+                            self._max_reconnect_delay,
+                        )
                         self._logger.warning(
-                            "µGateway websocket connection closed. Reconnecting..."
+                            "µGateway websocket connection closed. "
+                            "Reconnecting in %.1f seconds...",
+                            delay,
                         )
+                        await asyncio.sleep(delay)
+                        if self._closing:
+                            break
                         continue
                     except (websockets.WebSocketException, ValueError) as e:
+                        if self._closing:
+                            break
                         self.on_error(e)
+                    finally:
+                        if pinger is not None:
+                            pinger.cancel()
 
+                self._ws = None
                 self._idle = True
                 break
 
             except (websockets.WebSocketException, ValueError) as e:
-                self.on_error(e)
+                if not self._closing:
+                    self.on_error(e)
                 break
 
+    def _start_pinger(self, ws) -> asyncio.Task | None:
+        """Start measuring the round-trip time of a connection if enabled."""
+        if self._ping_interval is None:
+            return None
+
+        return asyncio.get_running_loop().create_task(self._ping_loop(ws))
+
+    async def _ping_loop(self, ws) -> None:
+        """Periodically ping the µGateway and measure the round-trip time."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await asyncio.sleep(self._ping_interval)
+            sent = loop.time()
+
+            try:
+                pong = await ws.ping()
+                await asyncio.wait_for(pong, self._ping_timeout)
+            except asyncio.TimeoutError:
+                self._logger.warning(
+                    "No pong received from µGateway within %s seconds",
+                    self._ping_timeout,
+                )
+                continue
+            except websockets.ConnectionClosed:
+                return
+
+            self._ping_rtt = loop.time() - sent
+            self._watchdog.touch()
+
+    @property
+    def ping_rtt(self) -> float | None:
+        """Last measured ping round-trip time in seconds, if enabled."""
+        return self._ping_rtt
+
+    async def _async_sync_state(self) -> None:
+        """Seed the resync baseline or deliver changes missed while offline."""
+        if self._resync is None:
+            return
+
+        try:
+            if not self._resync.seeded:
+                await self._resync.async_seed()
+                return
+
+            if self._connections == 1:
+                return
+
+            messages = await self._resync.async_resync()
+        except Exception:
+            self._logger.exception("Error resyncing state after reconnect")
+            return
+
+        self._logger.debug("Resync found %s changed entities", len(messages))
+        for data in messages:
+            await self._dispatch(data)
+
     async def on_message(self, message):
         """Process new message."""
-        data = json.loads(message)
-        await self._watchdog.trigger()
+        data = self._codec.loads(message)
+        self._watchdog.touch()
+        await self._dispatch(data)
+
+    async def _dispatch(self, data) -> None:
+        """Deliver a message to all subscribers."""
+        if self._resync is not None:
+            self._resync.track(data)
+
         for fn in self._subscribers:
+            self._call_subscriber(fn, data)
+        for subscriber in self._async_subscribers:
+            await subscriber.put(data)
+
+        if not (
+            self._topic_subscribers
+            or self._async_topic_subscribers
+            or self._event_streams
+        ):
+            return
+
+        # Classify once for topic subscribers and event streams
+        event = parse_event(data)
+        await self._dispatch_topic(data, event.kind, event.entity_id)
+
+        for stream in list(self._event_streams):
+            await stream.put(event)
+
+    async def _dispatch_topic(self, data, kind: str | None, entity_id: Any) -> None:
+        """Deliver a message to the subscribers of its kind and entity."""
+        if kind is None:
+            return
+
+        topics = [(kind, None)]
+        if entity_id is not None:
+            topics.append((kind, entity_id))
+
+        for topic in topics:
+            for fn in list(self._topic_subscribers.get(topic, ())):
+                self._call_subscriber(fn, data)
+            for subscriber in list(self._async_topic_subscribers.get(topic, ())):
+                await subscriber.put(data)
+
+    def _call_subscriber(self, fn, data) -> None:
+        """Call a sync subscriber, isolating its errors from the receive loop."""
+        try:
             fn(data)
-        for fn in self._async_subscribers:
-            await fn(data)
+        except Exception as e:
+            self._logger.exception("Error in websocket subscriber")
+            if self._on_subscriber_error is not None:
+                self._on_subscriber_error(e, data)
+
+    def _all_async_subscribers(self) -> list[AsyncSubscriber]:
+        """Return all broadcast and topic async subscribers."""
+        return self._async_subscribers + [
+            subscriber
+            for subscribers in self._async_topic_subscribers.values()
+            for subscriber in subscribers
+        ]
+
+    async def async_join(self) -> None:
+        """Wait until all async subscribers processed their queued messages."""
+        for subscriber in self._all_async_subscribers():
+            await subscriber.join()
 
     def on_error(self, exception: Exception):
         """Process error."""
@@ -156,12 +567,26 @@ class Websocket:
         """Return True if the websocket connection is idle/disconnected."""
         return self._idle
 
+    @property
+    def connected(self) -> bool:
+        """True while a connection to the µGateway is open.
+
+        Unlike is_idle(), this is False while waiting to reconnect.
+        """
+        return self._ws is not None
+
     def reset_error_count(self) -> None:
         """Reset the connection error count to zero."""
         self._errcount = 0
 
     async def async_close(self) -> None:
-        """Close the websocket connection if it exists."""
+        """Close the websocket connection if it exists.
+
+        A running connect() returns instead of reconnecting. Async
+        subscribers, conflators and event streams are stopped and ignore
+        further messages.
+        """
+        self._closing = True
         if self._ws is not None:
             try:
                 await self._ws.close()
@@ -170,6 +595,16 @@ class Websocket:
             self._ws = None
         self._watchdog.cancel()
 
+        for conflator in self._conflators:
+            conflator.close()
+
+        for subscriber in self._all_async_subscribers():
+            subscriber.stop()
+
+        for stream in self._event_streams:
+            stream.close()
+        self._event_streams = []
+
     async def on_watchdog_timeout(self):
         """Warn about watchdog timeout.
 
@@ -8,6 +8,8 @@ from aiowiserbyfeller.auth import Auth
 class WestGroup:
     """Representation of a WEST-Group in the Feller Wiser µGateway API."""
 
+    __slots__ = ("__weakref__", "auth", "raw_data")
+
     def __init__(self, raw_data: dict, auth: Auth):
         """Initialize a WEST-Group object."""
         self.raw_data = raw_data
@@ -0,0 +1,124 @@
+"""Coalescing of rapid successive writes to the same resource."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import copy
+from typing import Any
+
+DEFAULT_WRITE_COALESCING_WINDOW = 0.05
+
+
+class PendingWrite:
+    """Merged data and waiting callers of a write that was not sent yet."""
+
+    def __init__(self, send: Callable[[dict], Awaitable[Any]]):
+        """Initialize a pending write."""
+        self.send = send
+        self.data: dict = {}
+        self.futures: list[asyncio.Future] = []
+
+
+class WriteCoalescer:
+    """Merge writes to the same key arriving within a short window.
+
+    The first write for a key opens a window. Writes arriving before it
+    closes are merged field-wise into the pending data (last write wins)
+    and only the merged data is sent. All callers receive the result of
+    that single request. Writes to a key are sent in order: a window that
+    closes while the previous request is still in flight waits for it.
+    """
+
+    def __init__(self, window: float = DEFAULT_WRITE_COALESCING_WINDOW):
+        """Initialize a write coalescer.
+
+        Args:
+            window: Seconds to wait for further writes before sending.
+
+        """
+        self._window = window
+        self._pending: dict[Hashable, PendingWrite] = {}
+        self._sending: dict[Hashable, asyncio.Task] = {}
+        self.received = 0
+        self.sent = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of keys with writes waiting for their window to close."""
+        return len(self._pending)
+
+    async def write(
+        self, key: Hashable, data: dict, send: Callable[[dict], Awaitable[Any]]
+    ) -> Any:
+        """Queue data for key and return the result of the merged write.
+
+        Args:
+            key: Identifies the written resource, e.g. the request path.
+            data: The (partial) data to write.
+            send: Coroutine function sending the merged data.
+
+        """
+        loop = asyncio.get_running_loop()
+        pending = self._pending.get(key)
+
+        if pending is None:
+            pending = PendingWrite(send)
+            self._pending[key] = pending
+            loop.call_later(self._window, self._flush, key, pending)
+
+        pending.send = send
+        pending.data.update(data)
+        future = loop.create_future()
+        pending.futures.append(future)
+        self.received += 1
+
+        return await future
+
+    def _flush(self, key: Hashable, pending: PendingWrite) -> None:
+        """Start sending the pending write of a key."""
+        if self._pending.get(key) is not pending:
+            return
+
+        del self._pending[key]
+        previous = self._sending.get(key)
+        task = asyncio.get_running_loop().create_task(self._send(pending, previous))
+        self._sending[key] = task
+        task.add_done_callback(lambda t: self._on_sent(key, t))
+
+    def _on_sent(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget a finished write."""
+        if self._sending.get(key) is task:
+            del self._sending[key]
+
+    async def _send(self, pending: PendingWrite, previous: asyncio.Task | None):
+        """Send merged data after the previous write and resolve all callers."""
+        if previous is not None:
+            await asyncio.wait([previous])
+
+        self.sent += 1
+        try:
+            result = await pending.send(dict(pending.data))
+        except asyncio.CancelledError:
+            for future in pending.futures:
+                future.cancel()
+            raise
+        except Exception as e:  # noqa: BLE001
+            for future in pending.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        first = True
+        for future in pending.futures:
+            if not future.done():
+                future.set_result(result if first else copy.deepcopy(result))
+                first = False
+
+    async def async_flush(self) -> None:
+        """Send all pending writes now and wait until they are done."""
+        for key, pending in list(self._pending.items()):
+            self._flush(key, pending)
+
+        if self._sending:
+            await asyncio.wait(list(self._sending.values()))
@@ -0,0 +1,119 @@
+"""Benchmark of identifying the devices of a 500-device site.
+
+Identifies every device by name, hardware ID and product references, like
+building the Device models of each async_get_devices poll does. Compares
+the previous helpers (parsing every value and scanning the device maps on
+each call) with the compiled lookup tables and memoized parsers.
+
+Run with: python -m benchmarks.device_identification
+"""
+
+import time
+
+from aiowiserbyfeller import util
+from aiowiserbyfeller.map import DEVICE_A_BLOCK_FWID_BLOCK_MAP, DEVICE_A_BLOCK_HWID_MAP
+
+DEVICES = 500
+ROUNDS = 20
+MODELS = [
+    ("0x1113", "0x0100", "3401.B", "0x8402", "926-3401.4.S.A.F"),
+    ("0x1203", "0x0200", "3406.B", "0x8402", "926-3406.4.S.A.F"),
+    ("0x2303", "0x0300", "3405.B", "0x8402", "926-3405.4.S.A.F"),
+    ("0x2212", "0x0210", "3411.B", "0x9200", "926-3407.4.VS.A.F"),
+    ("0x6413", "0x0410", "3470.HK.6.B", "0xAA00", "3470.HK.6.B"),
+    ("0x0040", "0x0100", "3440.MS.B", "0xA000", "3440.MS.B"),
+]
+
+# The parsers without their memoization.
+parse_hwid_a = util._parse_wiser_device_hwid_a.__wrapped__  # noqa: SLF001
+parse_ref_a = util._parse_wiser_device_ref_a.__wrapped__  # noqa: SLF001
+parse_ref_c = util._parse_wiser_device_ref_c.__wrapped__  # noqa: SLF001
+
+
+def name_by_hwid_a(value: str | None) -> str:
+    """Return the device name by hardware ID by scanning the map."""
+    best_match = "Unknown"
+
+    if value in (None, ""):
+        return best_match
+
+    info = parse_hwid_a(value)
+    for entry in DEVICE_A_BLOCK_HWID_MAP:
+        if entry["type"] == info["type"]:
+            if entry["feature"] == info["features"]:
+                best_match = entry["name"]
+                break
+            if entry["feature"] is None:
+                best_match = entry["name"]
+
+    return best_match + (f" {info['channels']}K" if info["channels"] != 0x0 else "")
+
+
+def name_by_fwid(value: str | None) -> str:
+    """Return the device name by firmware ID by scanning the map."""
+    if value in (None, ""):
+        return "Unknown"
+
+    fw_id = int(value, 16)
+    b = (
+        DEVICE_A_BLOCK_FWID_BLOCK_MAP[0]
+        if (fw_id & 0x8000)
+        else DEVICE_A_BLOCK_FWID_BLOCK_MAP[1]
+    )
+
+    for map_fwid, name in b["fw_id_map"].items():
+        if (map_fwid & b["mask"]) == (fw_id & b["mask"]):
+            return name
+
+    return "Unknown"
+
+
+def identify_uncached(device: tuple) -> tuple:
+    """Identify a device like before the lookup tables."""
+    hw_id, _, ref_a, fw_id_c, ref_c = device
+    return (
+        name_by_hwid_a(hw_id),
+        name_by_fwid(fw_id_c),
+        parse_ref_a(ref_a),
+        parse_ref_c(ref_c),
+    )
+
+
+def identify(device: tuple) -> tuple:
+    """Identify a device with the current helpers."""
+    hw_id, _, ref_a, fw_id_c, ref_c = device
+    return (
+        util.get_device_name_by_hwid_a(hw_id),
+        util.get_device_name_by_fwid(fw_id_c),
+        util.parse_wiser_device_ref_a(ref_a),
+        util.parse_wiser_device_ref_c(ref_c),
+    )
+
+
+def run(func, devices: list[tuple]) -> float:
+    """Return the best seconds to identify all devices over all rounds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for device in devices:
+            func(device)
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    devices = [MODELS[i % len(MODELS)] for i in range(DEVICES)]
+
+    before = run(identify_uncached, devices)
+    after = run(identify, devices)
+
+    print(f"identifying a {DEVICES}-device site")  # noqa: T201
+    print(f"scanning maps: {before * 1e3:8.3f} ms")  # noqa: T201
+    print(f"compiled:      {after * 1e3:8.3f} ms")  # noqa: T201
+    print(f"speedup:       {before / after:8.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark of the JSON codecs on typical µGateway payloads.
+
+Decodes a loads response and a batch of websocket state messages, and
+encodes a target state request body with every installed backend. The
+"aiohttp" row decodes the response like ClientResponse.json() did before
+the codec was introduced: decoding the body to str, then json.loads().
+
+Run with: python -m benchmarks.json_codec
+"""
+
+import json
+import timeit
+
+from aiowiserbyfeller.codec import CODEC_BACKENDS, get_codec
+
+LOADS = 200
+MESSAGES = 1_000
+REPEAT = 5
+
+
+def loads_response() -> bytes:
+    """Return the body of a loads response."""
+    data = [
+        {
+            "id": index,
+            "name": f"Load {index}",
+            "room": index // 4,
+            "type": "dim",
+            "sub_type": "",
+            "device": f"{index:08x}",
+            "channel": index % 2,
+            "unused": False,
+            "kind": 0,
+        }
+        for index in range(LOADS)
+    ]
+    return json.dumps({"status": "success", "data": data}).encode()
+
+
+def websocket_messages() -> list[str]:
+    """Return load state messages as received by the websocket."""
+    return [
+        json.dumps(
+            {"load": {"id": index % LOADS, "state": {"bri": index * 10, "flags": {}}}}
+        )
+        for index in range(MESSAGES)
+    ]
+
+
+def best(statement, number: int) -> float:
+    """Return the best time of a statement in microseconds per call."""
+    return min(timeit.repeat(statement, number=number, repeat=REPEAT)) / number * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    body = loads_response()
+    messages = websocket_messages()
+    request = {"bri": 10000, "flags": {"fine": True}}
+
+    print(  # noqa: T201
+        f"µs per call: loads response ({len(body) / 1024:.0f} KiB),"
+        f" {MESSAGES} websocket messages, request body\n"
+        f"{'codec':8} {'loads':>9} {'messages':>9} {'request':>9}"
+    )
+    aiohttp = best(lambda: json.loads(body.decode("utf-8")), 200)
+    print(f"{'aiohttp':8} {aiohttp:9.1f} {'':>9} {'':>9}")  # noqa: T201
+
+    for name in CODEC_BACKENDS:
+        try:
+            codec = get_codec(name)
+        except ImportError:
+            print(f"{name:8} not installed")  # noqa: T201
+            continue
+
+        response = best(lambda codec=codec: codec.loads(body), 200)
+        stream = best(
+            lambda codec=codec: [codec.loads(message) for message in messages], 20
+        )
+        encode = best(lambda codec=codec: codec.dumps(request), 10_000)
+        print(f"{name:8} {response:9.1f} {stream:9.1f} {encode:9.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Benchmark of the per-entity memory of the model classes.
+
+Compares the slotted models with unslotted copies, whose attributes live in
+an instance __dict__ (and, for devices, with eagerly computed names), like
+the models before __slots__ were introduced. The raw data is allocated up
+front, so only the memory of the model instances themselves is measured.
+
+Run with: python -m benchmarks.model_memory
+"""
+
+import gc
+import tracemalloc
+import types
+
+from aiowiserbyfeller import Device, Dim, Temperature
+
+
+def unslotted(cls: type) -> type:
+    """Return a copy of a model class without __slots__ anywhere in its MRO.
+
+    The class hierarchy is flattened into a single class. Methods calling
+    super() do not work on the copy, which is only meant to be instantiated.
+    """
+    namespace = {}
+    for klass in reversed(cls.__mro__[:-1]):
+        for name, value in vars(klass).items():
+            if name in {"__slots__", "__dict__", "__weakref__"} or isinstance(
+                value, types.MemberDescriptorType
+            ):
+                continue
+            namespace[name] = value
+
+    return type(f"Dict{cls.__name__}", (), namespace)
+
+
+ENTITIES = 10_000
+
+DictDim = unslotted(Dim)
+DictTemperature = unslotted(Temperature)
+_DictDevice = unslotted(Device)
+
+
+class DictDevice(_DictDevice):
+    """Unslotted device with eagerly computed names."""
+
+    def __init__(self, raw_data: dict, auth) -> None:
+        """Initialize the device and compute its names."""
+        _DictDevice.__init__(self, raw_data, auth)
+        _ = self.a_name, self.c_name
+
+
+def load_data(index: int) -> dict:
+    """Return raw data of a load."""
+    return {
+        "id": index,
+        "name": f"Load {index}",
+        "type": "dim",
+        "sub_type": "",
+        "device": f"{index:08x}",
+        "channel": 0,
+        "unused": False,
+        "kind": 0,
+    }
+
+
+def sensor_data(index: int) -> dict:
+    """Return raw data of a sensor."""
+    return {
+        "id": index,
+        "name": f"Sensor {index}",
+        "type": "temperature",
+        "device": f"{index:08x}",
+        "channel": 0,
+        "unit": "°C",
+        "value": 21.5,
+    }
+
+
+def device_data(index: int) -> dict:
+    """Return raw data of a device."""
+    return {
+        "id": f"{index:08x}",
+        "last_seen": 25,
+        "a": {"fw_id": "0x0200", "hw_id": "0x1202", "serial_nr": f"a{index}"},
+        "c": {"fw_id": "0x8402", "hw_id": "0x8443", "serial_nr": f"c{index}"},
+        "inputs": [{"type": "up down"}],
+        "outputs": [{"load": index, "type": "dim", "sub_type": ""}],
+    }
+
+
+def measure(cls: type, data: list[dict]) -> float:
+    """Return the bytes allocated per instance of cls."""
+    gc.collect()
+    tracemalloc.start()
+    instances = [cls(raw_data, None) for raw_data in data]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del instances
+    return current / len(data)
+
+
+def measure_accessed(cls: type, data: list[dict]) -> float:
+    """Return the bytes per device instance after its names were accessed."""
+    gc.collect()
+    tracemalloc.start()
+    instances = [cls(raw_data, None) for raw_data in data]
+    for instance in instances:
+        _ = instance.a_name, instance.c_name, instance.a_device_family
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del instances
+    return current / len(data)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    cases = [
+        ("load", DictDim, Dim, [load_data(i) for i in range(ENTITIES)]),
+        (
+            "sensor",
+            DictTemperature,
+            Temperature,
+            [sensor_data(i) for i in range(ENTITIES)],
+        ),
+        ("device", DictDevice, Device, [device_data(i) for i in range(ENTITIES)]),
+    ]
+
+    print(f"bytes per entity at {ENTITIES} entities")  # noqa: T201
+    for name, before_cls, after_cls, data in cases:
+        before = measure(before_cls, data)
+        after = measure(after_cls, data)
+        print(  # noqa: T201
+            f"{name:8} __dict__: {before:6.0f}  __slots__: {after:6.0f}"
+            f"  saved: {1 - after / before:4.0%}"
+        )
+
+    data = cases[2][3]
+    before = measure_accessed(DictDevice, data)
+    after = measure_accessed(Device, data)
+    print(  # noqa: T201
+        f"{'device*':8} __dict__: {before:6.0f}  __slots__: {after:6.0f}"
+        f"  saved: {1 - after / before:4.0%}  (* names accessed)"
+    )
+
+
+if __name__ == "__main__":
+    main()
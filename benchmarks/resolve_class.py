@@ -0,0 +1,128 @@
+"""Benchmark of hydrating loads and sensors into their model classes.
+
+Compares the previous if-chain of WiserByFellerAPI.resolve_class with the
+lookup in the model registry, hydrating 10k mixed loads and sensors.
+
+Run with: python -m benchmarks.resolve_class
+"""
+
+import time
+
+from aiowiserbyfeller import (
+    Brightness,
+    Co2,
+    Dali,
+    DaliRgbw,
+    DaliTw,
+    Dim,
+    Hail,
+    Humidity,
+    Hvac,
+    Load,
+    Motor,
+    OnOff,
+    Rain,
+    Temperature,
+    Wind,
+    Window,
+    WiserByFellerAPI,
+)
+from aiowiserbyfeller.const import (
+    LOAD_SUBTYPE_DALI_RGB,
+    LOAD_SUBTYPE_DALI_TW,
+    LOAD_SUBTYPE_NONE,
+    LOAD_TYPE_DALI,
+    LOAD_TYPE_DIM,
+    LOAD_TYPE_HVAC,
+    LOAD_TYPE_MOTOR,
+    LOAD_TYPE_ONOFF,
+    SENSOR_TYPE_BRIGHTNESS,
+    SENSOR_TYPE_CO2,
+    SENSOR_TYPE_HAIL,
+    SENSOR_TYPE_HUMIDITY,
+    SENSOR_TYPE_RAIN,
+    SENSOR_TYPE_TEMPERATURE,
+    SENSOR_TYPE_WIND,
+    SENSOR_TYPE_WINDOW,
+)
+
+ENTITIES = 10_000
+ROUNDS = 20
+TYPES = [
+    {"type": LOAD_TYPE_ONOFF, "sub_type": ""},
+    {"type": LOAD_TYPE_DIM, "sub_type": ""},
+    {"type": LOAD_TYPE_DALI, "sub_type": ""},
+    {"type": LOAD_TYPE_DALI, "sub_type": LOAD_SUBTYPE_DALI_TW},
+    {"type": LOAD_TYPE_DALI, "sub_type": LOAD_SUBTYPE_DALI_RGB},
+    {"type": LOAD_TYPE_MOTOR, "sub_type": ""},
+    {"type": LOAD_TYPE_HVAC, "sub_type": ""},
+    {"type": SENSOR_TYPE_TEMPERATURE},
+    {"type": SENSOR_TYPE_HUMIDITY},
+    {"type": SENSOR_TYPE_WINDOW},
+]
+
+
+def resolve_chain(data: dict, auth):
+    """Resolve the model class like before the model registry."""
+    if data["type"] == LOAD_TYPE_ONOFF:
+        return OnOff(data, auth)
+    if data["type"] == LOAD_TYPE_DIM:
+        return Dim(data, auth)
+    if data["type"] == LOAD_TYPE_DALI and data["sub_type"] == LOAD_SUBTYPE_NONE:
+        return Dali(data, auth)
+    if data["type"] == LOAD_TYPE_DALI and data["sub_type"] == LOAD_SUBTYPE_DALI_TW:
+        return DaliTw(data, auth)
+    if data["type"] == LOAD_TYPE_DALI and data["sub_type"] == LOAD_SUBTYPE_DALI_RGB:
+        return DaliRgbw(data, auth)
+    if data["type"] == LOAD_TYPE_MOTOR:
+        return Motor(data, auth)
+    if data["type"] == LOAD_TYPE_HVAC:
+        return Hvac(data, auth)
+    if data["type"] == SENSOR_TYPE_BRIGHTNESS:
+        return Brightness(data, auth)
+    if data["type"] == SENSOR_TYPE_HAIL:
+        return Hail(data, auth)
+    if data["type"] == SENSOR_TYPE_RAIN:
+        return Rain(data, auth)
+    if data["type"] == SENSOR_TYPE_TEMPERATURE:
+        return Temperature(data, auth)
+    if data["type"] == SENSOR_TYPE_WIND:
+        return Wind(data, auth)
+    if data["type"] == SENSOR_TYPE_HUMIDITY:
+        return Humidity(data, auth)
+    if data["type"] == SENSOR_TYPE_CO2:
+        return Co2(data, auth)
+    if data["type"] == SENSOR_TYPE_WINDOW:
+        return Window(data, auth)
+
+    return Load(data, auth)
+
+
+def run(resolve, entities: list[dict]) -> float:
+    """Return the best seconds per entity over all rounds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for data in entities:
+            resolve(data)
+        best = min(best, time.perf_counter() - start)
+
+    return best / len(entities)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    entities = [{"id": i, **TYPES[i % len(TYPES)]} for i in range(ENTITIES)]
+    api = WiserByFellerAPI(None)
+
+    before = run(lambda data: resolve_chain(data, None), entities)
+    after = run(api.resolve_class, entities)
+
+    print(f"hydrating {ENTITIES} mixed entities")  # noqa: T201
+    print(f"if-chain per entity: {before * 1e9:8.0f} ns")  # noqa: T201
+    print(f"registry per entity: {after * 1e9:8.0f} ns")  # noqa: T201
+    print(f"speedup:             {before / after:8.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
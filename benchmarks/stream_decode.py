@@ -0,0 +1,120 @@
+"""Benchmark of decoding a large response at once and incrementally.
+
+Decodes a devices/* response of many devices like Auth.request (buffering
+the body and decoding it with json.loads) and like Auth.stream (feeding
+chunks to a JsonArrayStream and dropping each element once it was
+handled). Reports the peak memory, the time until the first element is
+available and the total time. The times are the best of several runs
+without tracemalloc, which slows down every allocation.
+
+Run with: python -m benchmarks.stream_decode
+"""
+
+import json
+import time
+import tracemalloc
+
+from aiowiserbyfeller.json_stream import DEFAULT_STREAM_CHUNK_SIZE, JsonArrayStream
+
+DEVICES = 2_000
+ROUNDS = 10
+
+
+def device_data(index: int) -> dict:
+    """Return raw details of a device."""
+    return {
+        "id": f"{index:08x}",
+        "last_seen": 25,
+        "a": {
+            "fw_id": "0x0200",
+            "hw_id": "0x1202",
+            "fw_version": "0x00501a30",
+            "comm_ref": "3401A",
+            "address": f"0x{index:08x}",
+            "nubes_id": 4294967294,
+            "comm_name": "Druckschalter 1K",
+            "serial_nr": f"011110_B_{index:06}",
+        },
+        "c": {
+            "fw_id": "0x8402",
+            "hw_id": "0x8443",
+            "fw_version": "0x00500a28",
+            "comm_ref": "926-3406.4.S.A.F",
+            "cmd_matrix": "0x0002",
+            "nubes_id": 999,
+            "comm_name": "Druckschalter 1K Sz",
+            "serial_nr": f"018443_B_{index:06}",
+        },
+        "inputs": [{"type": "up down"}],
+        "outputs": [{"load": index, "type": "dim", "sub_type": ""}],
+    }
+
+
+def chunks(body: bytes):
+    """Yield the body in chunks like they are read from the connection."""
+    for start in range(0, len(body), DEFAULT_STREAM_CHUNK_SIZE):
+        yield body[start : start + DEFAULT_STREAM_CHUNK_SIZE]
+
+
+def decode_buffered(body: bytes) -> tuple[float, int]:
+    """Buffer the body, then decode it. Returns first element time and count."""
+    start = time.perf_counter()
+    buffered = b"".join(chunks(body))
+    data = json.loads(buffered)["data"]
+    first = time.perf_counter() - start
+    count = sum(1 for _ in data)
+
+    return first, count
+
+
+def decode_streamed(body: bytes) -> tuple[float, int]:
+    """Decode the body chunk by chunk. Returns first element time and count."""
+    start = time.perf_counter()
+    first = 0.0
+    count = 0
+    stream = JsonArrayStream()
+    for chunk in chunks(body):
+        for _ in stream.feed(chunk):
+            if not count:
+                first = time.perf_counter() - start
+            count += 1
+    count += len(stream.close())
+
+    return first, count
+
+
+def measure(decode, body: bytes) -> tuple[float, float, float]:
+    """Return peak memory in MiB, first element time and total time in ms."""
+    tracemalloc.start()
+    _, count = decode(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert count == DEVICES
+
+    first = total = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        first_round, _ = decode(body)
+        first = min(first, first_round)
+        total = min(total, time.perf_counter() - start)
+
+    return peak / 2**20, first * 1000, total * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    body = json.dumps(
+        {"status": "success", "data": [device_data(i) for i in range(DEVICES)]}
+    ).encode()
+
+    print(  # noqa: T201
+        f"{DEVICES} devices, {len(body) / 2**20:.1f} MiB response\n"
+        f"{'':9} {'peak MiB':>9} {'first ms':>9} {'total ms':>9}"
+    )
+    for name, decode in (("buffered", decode_buffered), ("streamed", decode_streamed)):
+        peak, first, total = measure(decode, body)
+        print(f"{name:9} {peak:9.2f} {first:9.2f} {total:9.2f}")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Micro-benchmark of the per-message websocket watchdog overhead.
+
+Compares the previous reset path (cancel and reschedule a timer handle and
+log a debug line for every message) with the current one, which only stores
+the last activity timestamp.
+
+Run with: python -m benchmarks.websocket_watchdog
+"""
+
+import asyncio
+import logging
+import time
+
+from aiowiserbyfeller import WebsocketWatchdog
+
+MESSAGES = 200_000
+LOGGER = logging.getLogger(__name__)
+
+
+class RescheduleWatchdog(WebsocketWatchdog):
+    """Watchdog resetting the timeout like before the deadline timer."""
+
+    async def trigger(self) -> None:
+        """Reset the watchdog timeout by rescheduling the timer."""
+        self._logger.debug(
+            "Watchdog triggered - sleeping for %s seconds", self._timeout
+        )
+
+        if self._timer_task:
+            self._timer_task.cancel()
+
+        self._timer_task = asyncio.get_running_loop().call_later(
+            self._timeout, lambda: asyncio.create_task(self.on_expire())
+        )
+
+
+async def noop() -> None:
+    """Do nothing on expiration."""
+
+
+async def run_reschedule() -> float:
+    """Return the seconds per message of the previous reset path."""
+    watchdog = RescheduleWatchdog(LOGGER, noop)
+    start = time.perf_counter()
+    for _ in range(MESSAGES):
+        await watchdog.trigger()
+    elapsed = time.perf_counter() - start
+    watchdog.cancel()
+    return elapsed / MESSAGES
+
+
+async def run_touch() -> float:
+    """Return the seconds per message of the deadline timer reset path."""
+    watchdog = WebsocketWatchdog(LOGGER, noop)
+    start = time.perf_counter()
+    for _ in range(MESSAGES):
+        watchdog.touch()
+    elapsed = time.perf_counter() - start
+    watchdog.cancel()
+    return elapsed / MESSAGES
+
+
+async def main() -> None:
+    """Run the benchmark and print the results."""
+    before = await run_reschedule()
+    after = await run_touch()
+
+    print(f"reschedule per message: {before * 1e9:8.0f} ns")  # noqa: T201
+    print(f"touch per message:      {after * 1e9:8.0f} ns")  # noqa: T201
+    print(f"speedup:                {before / after:8.1f}x")  # noqa: T201
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
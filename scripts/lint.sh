@@ -4,5 +4,5 @@ set -e
 
 cd "$(dirname "$0")/.."
 
-ruff format aiowiserbyfeller tests
-ruff check aiowiserbyfeller tests --fix
+ruff format aiowiserbyfeller tests benchmarks
+ruff check aiowiserbyfeller tests benchmarks --fix
@@ -1,6 +1,7 @@
 """Prepare for unit tests."""
 
 import inspect
+import json
 import logging
 from unittest.mock import Mock
 
@@ -69,11 +70,20 @@ async def client_api_auth():
         yield result
 
 
+def request_json(kwargs: dict):
+    """Return the JSON body of a mocked request, encoded by the codec of Auth."""
+    headers = kwargs.get("headers") or {}
+    if headers.get("content-type") != "application/json":
+        return kwargs.get("json")
+
+    return json.loads(kwargs["data"])
+
+
 async def prepare_test(mock, url, method, response, request=None):
     """Return a mock callback for an unauthenticated test case."""
 
     def mock_callback(callback_url, **kwargs):
-        assert kwargs.get("json") == request
+        assert request_json(kwargs) == request
 
     mock.add(url, method, payload=response, callback=mock_callback)
 
@@ -82,7 +92,7 @@ async def prepare_test_authenticated(mock, url, method, response, request=None):
     """Return a mock callback for an authenticated test case."""
 
     def mock_callback(callback_url, **kwargs):
-        assert kwargs.get("json") == request
+        assert request_json(kwargs) == request
         auth_header = kwargs.get("headers")["authorization"]
         assert auth_header == f"Bearer: {TEST_API_TOKEN}"
 
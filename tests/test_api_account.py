@@ -2,7 +2,7 @@
 
 import pytest
 
-from .conftest import BASE_URL, prepare_test_authenticated  # noqa: TID251
+from .conftest import BASE_URL, prepare_test_authenticated, request_json  # noqa: TID251
 
 
 @pytest.mark.asyncio
@@ -65,7 +65,7 @@ async def test_async_clone_account_partial_kwargs(client_api_auth, mock_aiorespo
     captured = {}
 
     def mock_callback(callback_url, **kwargs):
-        captured["json"] = kwargs.get("json")
+        captured["json"] = request_json(kwargs)
 
     mock_aioresponse.add(
         f"{BASE_URL}/account/clone",
@@ -253,7 +253,7 @@ async def test_async_config_reset_account_default(client_api_auth, mock_aiorespo
     captured = {}
 
     def mock_callback(callback_url, **kwargs):
-        captured["json"] = kwargs.get("json")
+        captured["json"] = request_json(kwargs)
 
     mock_aioresponse.add(
         f"{BASE_URL}/account/config-reset",
@@ -284,7 +284,7 @@ async def test_async_config_reset_account_magnet_binding(
     captured = {}
 
     def mock_callback(callback_url, **kwargs):
-        captured["json"] = kwargs.get("json")
+        captured["json"] = request_json(kwargs)
 
     mock_aioresponse.add(
         f"{BASE_URL}/account/config-reset",
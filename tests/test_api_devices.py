@@ -4,9 +4,10 @@ import json
 from pathlib import Path
 
 import pytest
+from yarl import URL
 
-from aiowiserbyfeller import Device
-from aiowiserbyfeller.errors import UnexpectedGatewayResponse
+from aiowiserbyfeller import Device, status_data
+from aiowiserbyfeller.errors import UnexpectedGatewayResponse, UnsuccessfulRequest
 
 from .conftest import (  # noqa: TID251
     BASE_DATA_PATH,
@@ -159,6 +160,31 @@ async def test_async_get_devices_detail(client_api_auth, mock_aioresponse):
     assert actual[0].combined_serial_number == a_sn
 
 
+@pytest.mark.asyncio
+async def test_async_iter_devices_detail(client_api_auth, mock_aioresponse):
+    """Test async_iter_devices_detail."""
+    device_data = {
+        "id": "000006d7",
+        "last_seen": 39,
+        "a": {"hw_id": "0x1110", "comm_ref": "3401A"},
+        "c": {"hw_id": "0x8443", "comm_ref": "926-3406.4.S.A.F"},
+    }
+    response_json = {
+        "status": "success",
+        "data": [device_data, {"id": "00000000", "a": {}, "c": {}}],
+    }
+    await prepare_test_authenticated(
+        mock_aioresponse, f"{BASE_URL}/devices/*", "get", response_json
+    )
+
+    actual = [device async for device in client_api_auth.async_iter_devices_detail()]
+
+    assert len(actual) == 1
+    assert isinstance(actual[0], Device)
+    assert actual[0].raw_data == device_data
+    assert actual[0].a_name == "On/Off 1K"
+
+
 def device_family_data() -> list[list]:
     """Provide data for test_device_family."""
     with Path(BASE_DATA_PATH + "/valid/simple_switch.json").open("r") as f:
@@ -936,6 +962,153 @@ async def test_async_status(
     await device.async_status(0, "#552030", 100, foreground_param)
 
 
+async def prepare_status_session(mock_aioresponse, device_id, config_id, inputs):
+    """Prepare the config and apply responses of a status light session."""
+    config = {"id": config_id, "inputs": inputs, "outputs": []}
+
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices/{device_id}/config",
+        "get",
+        {"status": "success", "data": config},
+    )
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices/config/{config_id}",
+        "put",
+        {"status": "success", "data": config},
+    )
+
+
+async def prepare_status_input(mock_aioresponse, config_id, channel, data):
+    """Prepare the response of a status light input update."""
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices/config/{config_id}/inputs/{channel}",
+        "put",
+        {"status": "success", "data": data},
+        data,
+    )
+
+
+async def prepare_status_config(mock_aioresponse, inputs):
+    """Prepare only the config response of a status light session."""
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices/00000679/config",
+        "get",
+        {"status": "success", "data": {"id": 42, "inputs": inputs}},
+    )
+
+
+async def prepare_status_discard(mock_aioresponse):
+    """Prepare the discard response of a status light session."""
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices/config/42",
+        "delete",
+        {"status": "success", "data": {"id": 42}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_status_batch(client_api_auth, mock_aioresponse):
+    """Test that several channels are updated in one configuration session."""
+    unchanged = status_data("#552030", 100)
+    inputs = [{"type": "toggle"} | unchanged, {"type": "toggle"}, {"type": "toggle"}]
+    await prepare_status_session(mock_aioresponse, "00000679", 42, inputs)
+    await prepare_status_input(mock_aioresponse, 42, 1, status_data("#ffffff", 50))
+    await prepare_status_input(mock_aioresponse, 42, 2, status_data("#000000", 0))
+
+    device = Device(DEVICE_RAW_DATA, client_api_auth.auth)
+    requests = await device.async_status_batch(
+        {
+            0: unchanged,
+            1: status_data("#ffffff", 50),
+            2: status_data("#000000", 0),
+        }
+    )
+
+    assert requests == 4
+
+
+@pytest.mark.asyncio
+async def test_async_status_batch_unchanged(client_api_auth, mock_aioresponse):
+    """Test that the configuration is discarded if nothing changed."""
+    data = status_data("#552030", 100, 50)
+    await prepare_status_config(mock_aioresponse, [{"type": "toggle"} | data])
+    await prepare_status_discard(mock_aioresponse)
+
+    device = Device(DEVICE_RAW_DATA, client_api_auth.auth)
+
+    assert await device.async_status_batch({0: data}) == 2
+    assert ("delete", URL(f"{BASE_URL}/devices/config/42")) in (
+        mock_aioresponse.requests
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_status_batch_failed_write(client_api_auth, mock_aioresponse):
+    """Test that the configuration is discarded if writing an input fails."""
+    await prepare_status_config(mock_aioresponse, [{"type": "toggle"}] * 2)
+    await prepare_status_input(mock_aioresponse, 42, 0, status_data("#ffffff", 50))
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices/config/42/inputs/1",
+        "put",
+        {"status": "error", "message": "Invalid input"},
+        status_data("#000000", 0),
+    )
+    await prepare_status_discard(mock_aioresponse)
+
+    device = Device(DEVICE_RAW_DATA, client_api_auth.auth)
+
+    with pytest.raises(UnsuccessfulRequest, match="Invalid input"):
+        await device.async_status_batch(
+            {0: status_data("#ffffff", 50), 1: status_data("#000000", 0)}
+        )
+
+    assert ("delete", URL(f"{BASE_URL}/devices/config/42")) in (
+        mock_aioresponse.requests
+    )
+    assert ("put", URL(f"{BASE_URL}/devices/config/42")) not in (
+        mock_aioresponse.requests
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_set_status_lights(client_api_auth, mock_aioresponse):
+    """Test updating the status lights of several devices."""
+    await prepare_status_session(mock_aioresponse, "00000001", 1, [{}, {}])
+    await prepare_status_input(mock_aioresponse, 1, 0, status_data("#ff0000", 10))
+    await prepare_status_input(mock_aioresponse, 1, 1, status_data("#00ff00", 10))
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices/00000002/config",
+        "get",
+        {"status": "error", "message": "Device not reachable"},
+    )
+
+    result = await client_api_auth.async_set_status_lights(
+        {
+            "00000001": {
+                0: status_data("#ff0000", 10),
+                1: status_data("#00ff00", 10),
+            },
+            Device({"id": "00000002"}, client_api_auth.auth): {
+                0: status_data("#0000ff", 10),
+            },
+        },
+        concurrency=1,
+    )
+
+    assert not result.ok
+    assert list(result.failed) == ["00000002"]
+    assert result.channels == 2
+    assert result.requests == 4
+    assert result.requests_saved == 2
+
+
 @pytest.mark.asyncio
 async def test_async_status_with_separate_colors(client_api_auth, mock_aioresponse):
     """Test async_status with explicit foreground_color and background_color."""
@@ -1005,3 +1178,18 @@ async def test_async_status_with_separate_colors(client_api_auth, mock_aiorespon
     await device.async_status(
         0, "#1abcf2", 50, 50, foreground_color="#1cf22b", background_color="#f21c1c"
     )
+
+
+def test_device_slots_and_lazy_names():
+    """Test that devices have no instance dict and derive names lazily."""
+    device = Device({"id": "000006d7", "a": {"hw_id": "0x1110"}, "c": {}}, None)
+
+    assert not hasattr(device, "__dict__")
+    assert device._a_name is not device.a_name  # noqa: SLF001
+
+    name = device.a_name
+    family = device.a_device_family
+    device.raw_data = {"id": "000006d7", "a": {"hw_id": "0x1210"}, "c": {}}
+
+    assert device.a_name != name
+    assert device.a_device_family != family
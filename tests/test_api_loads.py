@@ -1,5 +1,6 @@
 """aiowiserbyfeller Api class loads tests."""
 
+from aiohttp import ClientResponseError
 import pytest
 
 from aiowiserbyfeller import (
@@ -11,6 +12,8 @@ from aiowiserbyfeller import (
     Load,
     Motor,
     OnOff,
+    UnauthorizedUser,
+    UnsuccessfulRequest,
 )
 from aiowiserbyfeller.const import KIND_LIGHT, KIND_VENETIAN_BLINDS
 from aiowiserbyfeller.enum import BlinkPattern
@@ -86,6 +89,32 @@ async def test_async_get_loads(client_api_auth, mock_aioresponse):
     assert actual[0].name == "Deckenspots"
 
 
+@pytest.mark.asyncio
+async def test_async_iter_loads(client_api_auth, mock_aioresponse):
+    """Test async_iter_loads."""
+    response_json = {
+        "status": "success",
+        "data": [
+            {"id": 1, "name": "Deckenspots", "type": "dim", "sub_type": ""},
+            {"id": 2, "name": "Esstisch Lampe", "type": "onoff", "sub_type": ""},
+        ],
+    }
+    await prepare_test_authenticated(
+        mock_aioresponse, f"{BASE_URL}/loads", "get", response_json
+    )
+
+    loads = client_api_auth.async_iter_loads()
+    first = await anext(loads)
+
+    assert isinstance(first, Dim)
+    assert first.name == "Deckenspots"
+
+    rest = [load async for load in loads]
+
+    assert len(rest) == 1
+    assert isinstance(rest[0], OnOff)
+
+
 @pytest.mark.asyncio
 async def test_async_get_used_loads(client_api_auth, mock_aioresponse):
     """Test async_get_used_loads."""
@@ -341,6 +370,100 @@ async def test_load_async_set_target_state(client_api_auth, mock_aioresponse):
     assert load.raw_state == response_json["data"]["target_state"]
 
 
+@pytest.mark.asyncio
+async def test_async_set_target_states(client_api_auth, mock_aioresponse):
+    """Test WiserByFellerAPI::async_set_target_states."""
+    load = Dim(
+        {"id": 2, "type": "dim", "sub_type": ""},
+        client_api_auth.auth,
+        raw_state={"bri": 10000},
+    )
+
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/2/target_state",
+        "put",
+        {"status": "success", "data": {"id": 2, "target_state": {"bri": 0}}},
+        {"bri": 0},
+    )
+
+    # Load 3 fails once with a server error and succeeds on retry
+    mock_aioresponse.put(f"{BASE_URL}/loads/3/target_state", status=500)
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/3/target_state",
+        "put",
+        {"status": "success", "data": {"id": 3, "target_state": {"bri": 0}}},
+        {"bri": 0},
+    )
+
+    # Load 4 is rejected by the µGateway and not retried
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/4/target_state",
+        "put",
+        {"status": "error", "message": "Load not found"},
+        {"bri": 0},
+    )
+
+    result = await client_api_auth.async_set_target_states(
+        {load: {"bri": 0}, 3: {"bri": 0}, 4: {"bri": 0}},
+        concurrency=2,
+        retry_delay=0,
+    )
+
+    assert not result.ok
+    assert result.succeeded == {2: {"bri": 0}, 3: {"bri": 0}}
+    assert list(result.failed) == [4]
+    assert isinstance(result.failed[4], UnsuccessfulRequest)
+    assert result.attempts == 4
+    assert load.raw_state == {"bri": 0}
+
+
+@pytest.mark.asyncio
+async def test_async_set_target_states_gives_up(client_api_auth, mock_aioresponse):
+    """Test that failing loads are retried a limited number of times."""
+    for _ in range(2):
+        mock_aioresponse.put(f"{BASE_URL}/loads/5/target_state", status=503)
+
+    result = await client_api_auth.async_set_target_states(
+        {5: {"bri": 0}}, retries=1, retry_delay=0
+    )
+
+    assert result.succeeded == {}
+    assert list(result.failed) == [5]
+    assert result.attempts == 2
+
+
+@pytest.mark.asyncio
+async def test_async_set_target_states_client_errors(client_api_auth, mock_aioresponse):
+    """Test that client and authorization errors are recorded, not retried."""
+    mock_aioresponse.put(f"{BASE_URL}/loads/6/target_state", status=404)
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/7/target_state",
+        "put",
+        {"status": "error", "message": "unauthorized user"},
+        {"bri": 0},
+    )
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/8/target_state",
+        "put",
+        {"status": "success", "data": {"id": 8, "target_state": {"bri": 0}}},
+        {"bri": 0},
+    )
+
+    result = await client_api_auth.async_set_target_states(
+        {6: {"bri": 0}, 7: {"bri": 0}, 8: {"bri": 0}}, retry_delay=0
+    )
+
+    assert result.succeeded == {8: {"bri": 0}}
+    assert isinstance(result.failed[6], ClientResponseError)
+    assert isinstance(result.failed[7], UnauthorizedUser)
+    assert result.attempts == 3
+
+
 @pytest.mark.asyncio
 async def test_load_async_ctrl(client_api_auth, mock_aioresponse):
     """Test Load::async_ctrl."""
@@ -179,6 +179,24 @@ async def test_async_get_sensors(
     assert actual[15].history[1].value is True
 
 
+@pytest.mark.asyncio
+async def test_async_iter_sensors(client_api_auth, mock_aioresponse):
+    """Test async_iter_sensors."""
+    data = validate_data_valid()
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/sensors",
+        "get",
+        {"status": "success", "data": data},
+    )
+
+    actual = [sensor async for sensor in client_api_auth.async_iter_sensors()]
+
+    assert [sensor.raw_data for sensor in actual] == data
+    assert isinstance(actual[0], Brightness)
+    assert len(actual[1].history) == 3
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("data", "expected_unit"),
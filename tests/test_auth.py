@@ -10,7 +10,7 @@ from aiowiserbyfeller.errors import (
     UnsuccessfulRequest,
 )
 
-from .conftest import BASE_URL, prepare_test  # noqa: TID251
+from .conftest import BASE_URL, prepare_test, request_json  # noqa: TID251
 
 
 @pytest.mark.asyncio
@@ -176,7 +176,7 @@ async def test_claim_without_source(client_auth, mock_aioresponse):
     captured = {}
 
     def mock_callback(callback_url, **kwargs):
-        captured["json"] = kwargs.get("json")
+        captured["json"] = request_json(kwargs)
 
     mock_aioresponse.post(
         f"{BASE_URL}/account/claim",
@@ -191,3 +191,41 @@ async def test_claim_without_source(client_auth, mock_aioresponse):
         "source should not be sent when source=None"
     )
     assert captured["json"] == {"user": "enduser"}
+
+
+@pytest.mark.asyncio
+async def test_stream(client_auth, mock_aioresponse):
+    """Test that stream yields the elements of the data array."""
+    client_auth.access_token = "abc123"
+    data = [{"id": item, "name": f"Load {item}"} for item in range(10)]
+    mock_aioresponse.get(
+        f"{BASE_URL}/loads", payload={"status": "success", "data": data}
+    )
+
+    actual = [item async for item in client_auth.stream("get", "loads", chunk_size=7)]
+
+    assert actual == data
+    assert client_auth.scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_errors(client_auth, mock_aioresponse):
+    """Test error handling of streamed requests."""
+    with pytest.raises(TokenMissing):
+        await anext(client_auth.stream("get", "loads"))
+
+    client_auth.access_token = "abc123"
+    mock_aioresponse.get(
+        f"{BASE_URL}/loads", payload={"status": "error", "message": "Not found"}
+    )
+    mock_aioresponse.get(
+        f"{BASE_URL}/loads", payload={"status": "success", "data": {"id": 1}}
+    )
+    mock_aioresponse.get(f"{BASE_URL}/loads", body="<html></html>")
+
+    with pytest.raises(UnsuccessfulRequest, match="Not found"):
+        await anext(client_auth.stream("get", "loads"))
+
+    for _ in range(2):
+        with pytest.raises(InvalidJson):
+            await anext(client_auth.stream("get", "loads"))
@@ -1,10 +1,17 @@
 """Tests for Wiser button LED API."""
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, call
 
 import pytest
 
-from aiowiserbyfeller import Button
+from aiowiserbyfeller import (
+    Button,
+    ButtonLedRenderer,
+    LedState,
+    UnsuccessfulRequest,
+    status_data,
+)
 from aiowiserbyfeller.enum import BlinkPattern
 
 
@@ -54,3 +61,96 @@ async def test_button_async_set_led(client_api):
             "color": "#00FF00",
         },
     )
+
+
+@pytest.mark.asyncio
+async def test_led_renderer_sends_only_changes(client_api):
+    """Test that only LEDs differing from the applied state are sent."""
+    client_api.auth.request = AsyncMock(return_value={})
+    renderer = ButtonLedRenderer(client_api.auth, min_interval=0)
+    button = Button({"id": 12, "device": "00000679"}, client_api.auth)
+    red = LedState(True, color="#ff0000")
+    off = LedState(False)
+
+    result = await renderer.async_render({(button, 0): red, (button, 1): off})
+    assert result.sent == 2
+    assert client_api.auth.request.await_count == 2
+
+    client_api.auth.request.reset_mock()
+    result = await renderer.async_render({(button, 0): red, (13, 0): red})
+
+    assert result.sent == 1
+    assert result.unchanged == 1
+    client_api.auth.request.assert_awaited_once_with(
+        "put",
+        "buttons/13/leds/0",
+        json={"on": True, "pattern": "permanent", "color": "#ff0000"},
+    )
+    assert renderer.applied_led(12, 0) == red
+
+
+@pytest.mark.asyncio
+async def test_led_renderer_status_lights(client_api):
+    """Test that changed status lights of a device share one session."""
+    client_api.auth.request = AsyncMock(return_value={"id": 42, "inputs": []})
+    renderer = ButtonLedRenderer(client_api.auth, min_interval=0)
+    red = status_data("#ff0000", 100)
+    green = status_data("#00ff00", 100)
+
+    await renderer.async_render(
+        status_lights={("00000679", 0): red, ("00000679", 1): red}
+    )
+    assert client_api.auth.request.await_count == 4
+
+    client_api.auth.request.reset_mock()
+    result = await renderer.async_render(
+        status_lights={("00000679", 0): red, ("00000679", 1): green}
+    )
+
+    assert result.sent == 1
+    assert result.unchanged == 1
+    assert client_api.auth.request.await_args_list == [
+        call("get", "devices/00000679/config"),
+        call("put", "devices/config/42/inputs/1", json=green),
+        call("put", "devices/config/42"),
+    ]
+
+    renderer.invalidate("00000679")
+    assert renderer.applied_status_light("00000679", 1) is None
+
+
+@pytest.mark.asyncio
+async def test_led_renderer_failures_are_retried(client_api):
+    """Test that failed LEDs are reported and sent again on the next render."""
+    client_api.auth.request = AsyncMock(side_effect=UnsuccessfulRequest("busy"))
+    renderer = ButtonLedRenderer(client_api.auth, min_interval=0)
+    state = LedState(True)
+
+    result = await renderer.async_render({(12, 0): state})
+    assert list(result.failed) == [(12, 0)]
+    assert renderer.applied_led(12, 0) is None
+
+    client_api.auth.request = AsyncMock(return_value={})
+    result = await renderer.async_render({(12, 0): state})
+    assert result.sent == 1
+
+
+@pytest.mark.asyncio
+async def test_led_renderer_rate_limits_per_device(client_api):
+    """Test that requests to one device are spaced by the minimum interval."""
+    loop = asyncio.get_running_loop()
+    sent = []
+
+    async def request(*args, **kwargs):
+        sent.append(loop.time())
+        return {}
+
+    client_api.auth.request = request
+    renderer = ButtonLedRenderer(client_api.auth, min_interval=0.05)
+    button = Button({"id": 12, "device": "00000679"}, client_api.auth)
+
+    await renderer.async_render({(button, index): LedState(True) for index in range(3)})
+
+    assert len(sent) == 3
+    assert sent[1] - sent[0] >= 0.045
+    assert sent[2] - sent[1] >= 0.045
@@ -0,0 +1,103 @@
+"""aiowiserbyfeller JSON codec tests."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from aiowiserbyfeller import Auth, JsonCodec, Websocket
+from aiowiserbyfeller.codec import (
+    CODEC_BACKENDS,
+    DEFAULT_CODEC,
+    get_codec,
+    select_codec,
+)
+from aiowiserbyfeller.errors import InvalidJson
+
+from .conftest import BASE_URL, prepare_test, request_json  # noqa: TID251
+
+
+def counting_codec() -> JsonCodec:
+    """Return the json module codec with mocked functions counting calls."""
+    codec = get_codec("json")
+    return JsonCodec(
+        "counting", Mock(side_effect=codec.loads), Mock(side_effect=codec.dumps)
+    )
+
+
+@pytest.mark.parametrize("name", CODEC_BACKENDS)
+def test_codec_round_trip(name: str):
+    """Test that all installed backends encode and decode alike."""
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+    data = {"status": "success", "data": [{"id": 1, "name": "µGateway", "on": True}]}
+
+    assert codec.name == name
+    assert codec.loads(codec.dumps(data)) == data
+    assert codec.loads(b'{"bri": 10000}') == {"bri": 10000}
+    assert codec.loads('{"bri": 10000}') == {"bri": 10000}
+
+    with pytest.raises(ValueError, match=r"."):
+        codec.loads(b"<!doctype html>")
+
+
+def test_select_codec():
+    """Test that the first installed backend is selected."""
+    pytest.importorskip("orjson")
+
+    assert select_codec().name == "orjson"
+    assert DEFAULT_CODEC.name == "orjson"
+
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_codec("yaml")
+
+
+@pytest.mark.asyncio
+async def test_auth_uses_codec(client_auth, mock_aioresponse):
+    """Test that requests are encoded and responses decoded by the codec."""
+    codec = counting_codec()
+    auth = Auth(client_auth.http, "192.168.0.1", codec=codec)
+    await prepare_test(
+        mock_aioresponse,
+        f"{BASE_URL}/account/claim",
+        "post",
+        {"status": "success", "data": {"secret": "abc123"}},
+        {"user": "enduser", "source": "installer"},
+    )
+
+    def mock_callback(callback_url, **kwargs):
+        assert kwargs["headers"]["content-type"] == "application/json"
+        assert request_json(kwargs) == {"on": True}
+
+    # The content type is not checked.
+    mock_aioresponse.put(
+        f"{BASE_URL}/loads/1/ctrl",
+        body=b'{"status": "success", "data": {"on": true}}',
+        content_type="text/plain",
+        callback=mock_callback,
+    )
+    mock_aioresponse.get(f"{BASE_URL}/loads", body=b"", content_type="text/plain")
+
+    assert await auth.claim("enduser") == "abc123"
+    assert await auth.request("put", "loads/1/ctrl", json={"on": True}) == {"on": True}
+    assert codec.dumps.call_count == 2
+    assert codec.loads.call_count == 2
+
+    with pytest.raises(InvalidJson):
+        await auth.request("get", "loads")
+
+
+@pytest.mark.asyncio
+async def test_websocket_uses_codec():
+    """Test that websocket messages are decoded by the codec."""
+    codec = counting_codec()
+    ws = Websocket("host", "token", codec=codec)
+    callback = Mock()
+    ws.subscribe(callback)
+
+    await ws.on_message('{"load": {"id": 1, "state": {"bri": 10000}}}')
+
+    codec.loads.assert_called_once()
+    callback.assert_called_once_with({"load": {"id": 1, "state": {"bri": 10000}}})
@@ -0,0 +1,196 @@
+"""aiowiserbyfeller command completion tests."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from aiowiserbyfeller import Motor, StateNotReached
+from aiowiserbyfeller.completion import target_reached
+
+from .conftest import BASE_URL, prepare_test_authenticated  # noqa: TID251
+
+
+def attach_websocket(auth, connected=True) -> Mock:
+    """Attach a fake websocket to auth."""
+    websocket = Mock(connected=connected)
+    auth.attach_websocket(websocket)
+
+    return websocket
+
+
+async def prepare_set_level(mock_aioresponse, level):
+    """Prepare the response of a motor level change."""
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/2/target_state",
+        "put",
+        {"status": "success", "data": {"id": 2, "target_state": {"level": level}}},
+        {"level": level},
+    )
+
+
+async def prepare_state(mock_aioresponse, state):
+    """Prepare the response of a load state request."""
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/2/state",
+        "get",
+        {"status": "success", "data": {"id": 2, "state": state}},
+    )
+
+
+def test_target_reached():
+    """Test the target state predicate."""
+    assert target_reached({"level": 5000, "moving": "stop"}, {"level": 5000})
+    assert not target_reached({"level": 5000, "moving": "up"}, {"level": 5000})
+    assert not target_reached({"level": 4000, "moving": "stop"}, {"level": 5000})
+    assert not target_reached({"level": 5000}, {"level": 5000})
+    assert target_reached({"bri": 100}, {"bri": 100})
+
+
+@pytest.mark.asyncio
+async def test_set_level_wait_websocket(client_api_auth, mock_aioresponse):
+    """Test that waiting resolves from websocket state messages."""
+    auth = client_api_auth.auth
+    websocket = attach_websocket(auth)
+    on_message = websocket.subscribe.call_args.args[0]
+    await prepare_set_level(mock_aioresponse, 5000)
+
+    motor = Motor({"id": 2}, auth, raw_state={"level": 0, "moving": "stop"})
+    task = asyncio.create_task(motor.async_set_level(5000, wait=True, timeout=1))
+    await asyncio.sleep(0.01)
+
+    on_message({"load": {"id": 2, "state": {"level": 2500, "moving": "up"}}})
+    on_message({"load": {"id": 3, "state": {"level": 5000, "moving": "stop"}}})
+    assert not task.done()
+
+    on_message({"load": {"id": 2, "state": {"level": 5000, "moving": "stop"}}})
+    state = await task
+
+    assert state == {"level": 5000, "moving": "stop"}
+    assert motor.raw_state == state
+    assert auth.completion.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_set_level_wait_polls_without_websocket(
+    client_api_auth, mock_aioresponse
+):
+    """Test that the state is polled if no websocket is connected."""
+    auth = client_api_auth.auth
+    attach_websocket(auth, connected=False)
+    auth.completion.poll_interval = 0.01
+    await prepare_set_level(mock_aioresponse, 5000)
+    await prepare_state(mock_aioresponse, {"level": 3000, "moving": "up"})
+    await prepare_state(mock_aioresponse, {"level": 5000, "moving": "stop"})
+
+    motor = Motor({"id": 2}, auth)
+    state = await motor.async_set_level(5000, wait=True, timeout=1)
+
+    assert state == {"level": 5000, "moving": "stop"}
+
+
+@pytest.mark.asyncio
+async def test_set_level_wait_already_reached(client_api_auth, mock_aioresponse):
+    """Test that the state is polled if no message arrives for a command."""
+    auth = client_api_auth.auth
+    attach_websocket(auth)
+    auth.completion.poll_interval = 0.01
+    await prepare_set_level(mock_aioresponse, 5000)
+    await prepare_state(mock_aioresponse, {"level": 5000, "moving": "stop"})
+
+    motor = Motor({"id": 2}, auth, raw_state={"level": 5000, "moving": "stop"})
+    state = await motor.async_set_level(5000, wait=True, timeout=1)
+
+    assert state == {"level": 5000, "moving": "stop"}
+    assert auth.completion.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_set_level_wait_ignores_assumed_state(client_api_auth, mock_aioresponse):
+    """Test that the target state assumed by an earlier call is not reached."""
+    auth = client_api_auth.auth
+    websocket = attach_websocket(auth)
+    on_message = websocket.subscribe.call_args.args[0]
+    await prepare_set_level(mock_aioresponse, 5000)
+    await prepare_set_level(mock_aioresponse, 5000)
+
+    motor = Motor({"id": 2}, auth, raw_state={"level": 0, "moving": "stop"})
+    await motor.async_set_level(5000)
+    task = asyncio.create_task(motor.async_set_level(5000, wait=True, timeout=1))
+    await asyncio.sleep(0.01)
+
+    assert not task.done()
+
+    on_message({"load": {"id": 2, "state": {"level": 3000, "moving": "up"}}})
+    await asyncio.sleep(0)
+    assert not task.done()
+
+    on_message({"load": {"id": 2, "state": {"level": 5000, "moving": "stop"}}})
+
+    assert await task == {"level": 5000, "moving": "stop"}
+
+
+@pytest.mark.asyncio
+async def test_set_level_wait_timeout(client_api_auth, mock_aioresponse):
+    """Test that a state not reached in time raises."""
+    auth = client_api_auth.auth
+    attach_websocket(auth)
+    await prepare_set_level(mock_aioresponse, 5000)
+
+    motor = Motor({"id": 2}, auth)
+
+    with pytest.raises(StateNotReached):
+        await motor.async_set_level(5000, wait=True, timeout=0.05)
+
+    assert auth.completion.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_motor_stop_confirmed_by_websocket(client_api_auth, mock_aioresponse):
+    """Test that stopping does not fetch the state if a websocket is connected."""
+    auth = client_api_auth.auth
+    websocket = attach_websocket(auth)
+    on_message = websocket.subscribe.call_args.args[0]
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/2/ctrl",
+        "put",
+        {"status": "success", "data": {"id": 2}},
+        {"button": "stop", "event": "click"},
+    )
+
+    motor = Motor({"id": 2}, auth, raw_state={"level": 10000, "moving": "down"})
+    task = asyncio.create_task(motor.async_stop())
+    await asyncio.sleep(0.01)
+    on_message({"load": {"id": 2, "state": {"level": 8000, "moving": "stop"}}})
+    await task
+
+    assert motor.state == {"level": 8000, "moving": "stop"}
+
+
+@pytest.mark.asyncio
+async def test_motor_stop_ignores_stale_state(client_api_auth, mock_aioresponse):
+    """Test that a stale stopped state does not confirm the stop."""
+    auth = client_api_auth.auth
+    websocket = attach_websocket(auth)
+    on_message = websocket.subscribe.call_args.args[0]
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/2/ctrl",
+        "put",
+        {"status": "success", "data": {"id": 2}},
+        {"button": "stop", "event": "click"},
+    )
+
+    motor = Motor({"id": 2}, auth, raw_state={"level": 0, "moving": "stop"})
+    task = asyncio.create_task(motor.async_stop())
+    await asyncio.sleep(0.01)
+
+    assert not task.done()
+
+    on_message({"load": {"id": 2, "state": {"level": 4000, "moving": "stop"}}})
+    await task
+
+    assert motor.state == {"level": 4000, "moving": "stop"}
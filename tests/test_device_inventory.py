@@ -0,0 +1,190 @@
+"""aiowiserbyfeller device inventory tests."""
+
+import asyncio
+import json
+
+import pytest
+
+from aiowiserbyfeller import DeviceInventory
+
+from .conftest import BASE_URL, prepare_test_authenticated  # noqa: TID251
+
+
+def block(fw_version: str, serial_nr: str) -> dict:
+    """Return the data of an A or C block."""
+    return {
+        "fw_id": "0x0100",
+        "hw_id": "0x1110",
+        "fw_version": fw_version,
+        "comm_ref": "3401.B",
+        "address": "0x00000679",
+        "comm_name": "Druckschalter 1K",
+        "serial_nr": serial_nr,
+    }
+
+
+def detail(device_id: str, fw_version: str = "0x00501a30") -> dict:
+    """Return the details of a device."""
+    return {
+        "id": device_id,
+        "last_seen": 10,
+        "a": block(fw_version, f"a-{device_id}"),
+        "c": block(fw_version, f"c-{device_id}"),
+    }
+
+
+def summary(device_id: str, fw_version: str = "0x00501a30") -> dict:
+    """Return the devices summary entry of a device."""
+    data = detail(device_id, fw_version)
+    for key in ("a", "c"):
+        del data[key]["comm_name"]
+        del data[key]["serial_nr"]
+
+    return data
+
+
+async def prepare_summary(mock_aioresponse, devices: list[dict]):
+    """Prepare the devices summary response."""
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices",
+        "get",
+        {"status": "success", "data": devices},
+    )
+
+
+async def prepare_detail(mock_aioresponse, data: dict):
+    """Prepare the details response of a device."""
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices/{data['id']}",
+        "get",
+        {"status": "success", "data": data},
+    )
+
+
+@pytest.mark.asyncio
+async def test_load_fetches_and_caches(client_api_auth, mock_aioresponse, tmp_path):
+    """Test that details are fetched once and loaded from disk afterwards."""
+    cache_path = tmp_path / "devices.json"
+
+    await prepare_summary(mock_aioresponse, [summary("00000001"), summary("00000002")])
+    await prepare_detail(mock_aioresponse, detail("00000001"))
+    await prepare_detail(mock_aioresponse, detail("00000002"))
+
+    devices = await DeviceInventory(client_api_auth, cache_path).async_load()
+
+    assert [device.id for device in devices] == ["00000001", "00000002"]
+    assert devices[0].a["serial_nr"] == "a-00000001"
+    assert set(json.loads(cache_path.read_text())["devices"]) == {
+        "00000001",
+        "00000002",
+    }
+
+    # Second start: only the device with a new firmware is fetched.
+    await prepare_summary(
+        mock_aioresponse, [summary("00000001"), summary("00000002", "0x00600000")]
+    )
+    await prepare_detail(mock_aioresponse, detail("00000002", "0x00600000"))
+
+    inventory = DeviceInventory(client_api_auth, cache_path)
+    devices = await inventory.async_load()
+
+    assert inventory.stats.cached == 1
+    assert inventory.stats.fetched == 1
+    assert devices[0].c["serial_nr"] == "c-00000001"
+    assert devices[1].a["fw_version"] == "0x00600000"
+
+    # Third start: nothing changed, removed devices are dropped.
+    await prepare_summary(mock_aioresponse, [summary("00000002", "0x00600000")])
+
+    inventory = DeviceInventory(client_api_auth, cache_path)
+    devices = await inventory.async_load()
+
+    assert inventory.stats.cached == 1
+    assert inventory.stats.fetched == 0
+    assert list(json.loads(cache_path.read_text())["devices"]) == ["00000002"]
+
+
+@pytest.mark.asyncio
+async def test_load_failed_and_invalid_details(client_api_auth, mock_aioresponse):
+    """Test that failed devices use summary data and invalid ones are not cached."""
+    invalid = detail("00000002")
+    invalid["a"]["serial_nr"] = ""
+
+    await prepare_summary(mock_aioresponse, [summary("00000001"), summary("00000002")])
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/devices/00000001",
+        "get",
+        {"status": "error", "message": "Device not reachable"},
+    )
+    await prepare_detail(mock_aioresponse, invalid)
+
+    inventory = DeviceInventory(client_api_auth, concurrency=1)
+    devices = await inventory.async_load()
+
+    assert "serial_nr" not in devices[0].a
+    assert devices[1].a["serial_nr"] == ""
+    assert list(inventory.stats.failed) == ["00000001"]
+    assert inventory.stats.fetched == 1
+
+    # Both are fetched again.
+    await prepare_summary(mock_aioresponse, [summary("00000001"), summary("00000002")])
+    await prepare_detail(mock_aioresponse, detail("00000001"))
+    await prepare_detail(mock_aioresponse, detail("00000002"))
+
+    devices = await inventory.async_load()
+
+    assert inventory.stats.fetched == 2
+    assert devices[1].a["serial_nr"] == "a-00000002"
+
+
+@pytest.mark.asyncio
+async def test_load_ignores_invalid_cache(client_api_auth, mock_aioresponse, tmp_path):
+    """Test that an unreadable cache file is ignored and replaced."""
+    cache_path = tmp_path / "devices.json"
+    cache_path.write_text("not json")
+
+    await prepare_summary(mock_aioresponse, [summary("00000001")])
+    await prepare_detail(mock_aioresponse, detail("00000001"))
+
+    inventory = DeviceInventory(client_api_auth, cache_path)
+    await inventory.async_load()
+
+    assert inventory.stats.fetched == 1
+    assert json.loads(cache_path.read_text())["version"] == 1
+
+    await inventory.async_clear()
+    assert not cache_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_fetch_stores_details(client_api_auth, mock_aioresponse, tmp_path):
+    """Test that fetching devices directly writes the cache file."""
+    cache_path = tmp_path / "devices.json"
+
+    await prepare_detail(mock_aioresponse, detail("00000001"))
+
+    inventory = DeviceInventory(client_api_auth, cache_path)
+    devices = await inventory.async_fetch(["00000001"])
+
+    assert list(devices) == ["00000001"]
+    assert list(json.loads(cache_path.read_text())["devices"]) == ["00000001"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_timeout(client_api_auth, mock_aioresponse, tmp_path):
+    """Test that a timed out device is recorded as failed."""
+    cache_path = tmp_path / "devices.json"
+
+    mock_aioresponse.get(
+        f"{BASE_URL}/devices/00000001", exception=asyncio.TimeoutError()
+    )
+
+    inventory = DeviceInventory(client_api_auth, cache_path)
+    devices = await inventory.async_fetch(["00000001"])
+
+    assert devices == {}
+    assert isinstance(inventory.stats.failed["00000001"], asyncio.TimeoutError)
+    assert not cache_path.exists()
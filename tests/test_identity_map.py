@@ -0,0 +1,188 @@
+"""aiowiserbyfeller identity map tests."""
+
+import gc
+
+import pytest
+
+from aiowiserbyfeller import Device, Dim, IdentityMap, OnOff, WiserByFellerAPI
+
+from .conftest import BASE_URL, prepare_test_authenticated  # noqa: TID251
+
+
+def load_data(load_id: int, name: str, load_type: str = "dim") -> dict:
+    """Return raw data of a load."""
+    return {
+        "id": load_id,
+        "name": name,
+        "type": load_type,
+        "sub_type": "",
+        "device": "000004d7",
+        "channel": 0,
+    }
+
+
+class Model:
+    """Minimal model with raw data."""
+
+    def __init__(self, raw_data: dict):
+        """Initialize a model."""
+        self.raw_data = raw_data
+
+
+class OtherModel(Model):
+    """Minimal model of another class."""
+
+
+def test_resolve_returns_same_instance():
+    """Test that resolving the same entity returns the same updated instance."""
+    identity_map = IdentityMap()
+
+    first = identity_map.resolve("load", {"id": 1, "name": "A"}, Model)
+    second = identity_map.resolve("load", {"id": 1, "name": "B"}, Model)
+
+    assert first is second
+    assert first.raw_data == {"id": 1, "name": "B"}
+    assert identity_map.get("load", 1) is first
+    assert identity_map.get("sensor", 1) is None
+    assert identity_map.hits == 1
+    assert identity_map.misses == 1
+
+
+def test_resolve_replaces_instance_of_other_class():
+    """Test that an instance is replaced if the resolved class changed."""
+    identity_map = IdentityMap()
+
+    first = identity_map.resolve("load", {"id": 1}, Model, Model)
+    second = identity_map.resolve("load", {"id": 1}, OtherModel, OtherModel)
+
+    assert first is not second
+    assert identity_map.get("load", 1) is second
+
+
+def test_resolve_without_id():
+    """Test that data without id is not registered."""
+    identity_map = IdentityMap()
+
+    identity_map.resolve("load", {"name": "A"}, Model)
+
+    assert len(identity_map) == 0
+
+
+def test_unused_instances_are_released():
+    """Test that instances are only kept alive by the recently used ones."""
+    identity_map = IdentityMap(max_size=1)
+
+    identity_map.resolve("load", {"id": 1}, Model)
+    kept = identity_map.resolve("load", {"id": 2}, Model)
+    identity_map.resolve("load", {"id": 3}, Model)
+    gc.collect()
+
+    assert identity_map.get("load", 3) is not None
+    assert identity_map.get("load", 1) is None
+    assert identity_map.get("load", 2) is kept
+
+
+def test_evict():
+    """Test evicting instances."""
+    identity_map = IdentityMap()
+    identity_map.resolve("load", {"id": 1}, Model)
+    identity_map.resolve("load", {"id": 2}, Model)
+    identity_map.resolve("device", {"id": "1"}, Model)
+
+    identity_map.evict("load", 1)
+    assert identity_map.get("load", 1) is None
+    assert len(identity_map) == 2
+
+    identity_map.evict("load")
+    assert len(identity_map) == 1
+
+    identity_map.evict()
+    assert len(identity_map) == 0
+
+
+@pytest.mark.asyncio
+async def test_api_loads_share_instances(client_api_auth, mock_aioresponse):
+    """Test that loads from different API calls are the same instance."""
+    api = WiserByFellerAPI(client_api_auth.auth, IdentityMap())
+
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads",
+        "get",
+        {"status": "success", "data": [load_data(1, "A"), load_data(2, "B")]},
+    )
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/1",
+        "get",
+        {"status": "success", "data": load_data(1, "Renamed")},
+    )
+
+    loads = await api.async_get_loads()
+    load = await api.async_get_load(1)
+
+    assert isinstance(load, Dim)
+    assert load is loads[0]
+    assert loads[0].name == "Renamed"
+
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/1",
+        "get",
+        {"status": "success", "data": load_data(1, "Switch", "onoff")},
+    )
+
+    replaced = await api.async_get_load(1)
+
+    assert isinstance(replaced, OnOff)
+    assert replaced is not load
+
+
+@pytest.mark.asyncio
+async def test_api_load_shortcuts_update_shared_instance(
+    client_api_auth, mock_aioresponse
+):
+    """Test that id based shortcuts update the shared instance."""
+    api = WiserByFellerAPI(client_api_auth.auth, IdentityMap())
+
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/1",
+        "get",
+        {"status": "success", "data": load_data(1, "A")},
+    )
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/1/target_state",
+        "put",
+        {"status": "success", "data": {"id": 1, "target_state": {"bri": 100}}},
+        {"bri": 100},
+    )
+
+    load = await api.async_get_load(1)
+    await api.async_load_set_target_state(1, {"bri": 100})
+
+    assert load.raw_state == {"bri": 100}
+
+
+@pytest.mark.asyncio
+async def test_api_devices_share_instances(client_api_auth, mock_aioresponse):
+    """Test that devices are shared and their names follow updated data."""
+    api = WiserByFellerAPI(client_api_auth.auth, IdentityMap())
+    device_data = {"id": "000006d7", "a": {"hw_id": "0x1110"}, "c": {}}
+
+    for hw_id in ("0x1110", "0x1210"):
+        await prepare_test_authenticated(
+            mock_aioresponse,
+            f"{BASE_URL}/devices/000006d7",
+            "get",
+            {"status": "success", "data": {**device_data, "a": {"hw_id": hw_id}}},
+        )
+
+    device = await api.async_get_device("000006d7")
+    name = device.a_name
+    again = await api.async_get_device("000006d7")
+
+    assert isinstance(device, Device)
+    assert again is device
+    assert device.a_name != name
@@ -0,0 +1,118 @@
+"""aiowiserbyfeller transient job compiler tests."""
+
+import pytest
+
+from aiowiserbyfeller import Dim, JobCompiler
+from aiowiserbyfeller.job.compiler import states_hash
+
+from .conftest import BASE_URL, prepare_test_authenticated  # noqa: TID251
+
+
+async def prepare_create(mock_aioresponse, job_id, states):
+    """Prepare the response of a job creation."""
+    target_states = [{"load": load, "state": state} for load, state in states]
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/jobs",
+        "post",
+        {"status": "success", "data": {"id": job_id, "target_states": target_states}},
+        {"target_states": target_states},
+    )
+
+
+async def prepare_run(mock_aioresponse, job_id, status="success"):
+    """Prepare the response of a job run."""
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/jobs/{job_id}/run",
+        "get",
+        {"status": status, "data": {"id": job_id}, "message": "Job not found"},
+    )
+
+
+async def prepare_delete(mock_aioresponse, job_id):
+    """Prepare the response of a job deletion."""
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/jobs/{job_id}",
+        "delete",
+        {"status": "success", "data": {"id": job_id}},
+    )
+
+
+def test_states_hash():
+    """Test that the hash does not depend on the order of loads."""
+    assert states_hash({1: {"bri": 0}, 2: {"bri": 100}}) == states_hash(
+        {2: {"bri": 100}, 1: {"bri": 0}}
+    )
+    assert states_hash({1: {"bri": 0}}) != states_hash({1: {"bri": 100}})
+
+
+@pytest.mark.asyncio
+async def test_job_compiler_reuses_jobs(client_api_auth, mock_aioresponse):
+    """Test that identical state sets are run through the same job."""
+    compiler = JobCompiler(client_api_auth)
+    load = Dim({"id": 1}, client_api_auth.auth, raw_state={"bri": 10000})
+
+    await prepare_create(mock_aioresponse, 10, [(1, {"bri": 0}), (2, {"bri": 0})])
+    await prepare_run(mock_aioresponse, 10)
+    await prepare_run(mock_aioresponse, 10)
+
+    job = await compiler.async_apply({load: {"bri": 0}, 2: {"bri": 0}})
+    assert job.id == 10
+    assert load.raw_state == {"bri": 0}
+
+    await compiler.async_apply({2: {"bri": 0}, 1: {"bri": 0}})
+
+    assert compiler.stats.created == 1
+    assert compiler.stats.reused == 1
+    assert compiler.job_ids == [10]
+
+
+@pytest.mark.asyncio
+async def test_job_compiler_evicts_jobs(client_api_auth, mock_aioresponse):
+    """Test that least recently used jobs are deleted."""
+    compiler = JobCompiler(client_api_auth, max_jobs=1)
+
+    await prepare_create(mock_aioresponse, 10, [(1, {"bri": 0})])
+    await prepare_run(mock_aioresponse, 10)
+    await prepare_create(mock_aioresponse, 11, [(1, {"bri": 10000})])
+    await prepare_delete(mock_aioresponse, 10)
+    await prepare_run(mock_aioresponse, 11)
+
+    await compiler.async_apply({1: {"bri": 0}})
+    await compiler.async_apply({1: {"bri": 10000}})
+
+    assert compiler.job_ids == [11]
+    assert compiler.stats.deleted == 1
+
+    await prepare_delete(mock_aioresponse, 11)
+    await compiler.async_clear()
+
+    assert compiler.job_ids == []
+    assert compiler.stats.deleted == 2
+
+
+@pytest.mark.asyncio
+async def test_job_compiler_recreates_missing_job(client_api_auth, mock_aioresponse):
+    """Test that a job deleted on the µGateway is created again."""
+    compiler = JobCompiler(client_api_auth)
+
+    await prepare_create(mock_aioresponse, 10, [(1, {"bri": 0})])
+    await prepare_run(mock_aioresponse, 10)
+    await prepare_run(mock_aioresponse, 10, status="error")
+    await prepare_create(mock_aioresponse, 12, [(1, {"bri": 0})])
+    await prepare_run(mock_aioresponse, 12)
+
+    await compiler.async_apply({1: {"bri": 0}})
+    job = await compiler.async_apply({1: {"bri": 0}})
+
+    assert job.id == 12
+    assert compiler.job_ids == [12]
+    assert compiler.stats.created == 2
+
+
+def test_invalid_max_jobs(client_api_auth):
+    """Test that at least one job must be kept."""
+    with pytest.raises(ValueError):
+        JobCompiler(client_api_auth, max_jobs=0)
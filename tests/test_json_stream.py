@@ -0,0 +1,91 @@
+"""aiowiserbyfeller incremental JSON array parsing tests."""
+
+import json
+
+import pytest
+
+from aiowiserbyfeller.json_stream import JsonArrayStream
+
+RESPONSE = {
+    "status": "success",
+    "data": [
+        {"id": 1, "name": 'Spots "Küche" [{,:}] \\', "a": {"b": [1, {"c": None}]}},
+        {"id": 2, "name": "Lamp"},
+        [],
+        "µGateway",
+        -1.5e10,
+        None,
+    ],
+}
+
+
+def parse(body: bytes, chunk_size: int) -> tuple[list, JsonArrayStream]:
+    """Feed body in chunks, returning the parsed elements and the stream."""
+    stream = JsonArrayStream()
+    items = []
+    for start in range(0, len(body), chunk_size):
+        items += stream.feed(body[start : start + chunk_size])
+    items += stream.close()
+
+    return items, stream
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 64, 4096])
+@pytest.mark.parametrize(
+    "body",
+    [
+        json.dumps(RESPONSE),
+        json.dumps(RESPONSE, indent=2, ensure_ascii=False),
+        json.dumps({"data": RESPONSE["data"], "status": "success"}),
+    ],
+)
+def test_parse_chunked(body: str, chunk_size: int):
+    """Test that elements are parsed regardless of chunk boundaries."""
+    items, stream = parse(body.encode(), chunk_size)
+
+    assert items == RESPONSE["data"]
+    assert stream.envelope == {"status": "success"}
+    assert stream.count == len(RESPONSE["data"])
+
+
+def test_yield_elements_as_completed():
+    """Test that an element is returned as soon as it is complete."""
+    stream = JsonArrayStream()
+
+    assert stream.feed(b'{"status": "success", "data": [{"id": 1}') == []
+    assert stream.feed(b', {"id"') == [{"id": 1}]
+    assert stream.feed(b": 2}]}") == [{"id": 2}]
+    assert stream.close() == []
+
+
+@pytest.mark.parametrize(
+    ("body", "envelope"),
+    [
+        (b'{"status": "success", "data": []}', {"status": "success"}),
+        (b'{"status": "error", "message": "x"}', {"status": "error", "message": "x"}),
+        (b'{"data": {"id": 1}}', {"data": {"id": 1}}),
+    ],
+)
+def test_parse_without_elements(body: bytes, envelope: dict):
+    """Test responses without array elements."""
+    items, stream = parse(body, 3)
+
+    assert items == []
+    assert stream.envelope == envelope
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"",
+        b"[1, 2]",
+        b'{"data": [1, 2',
+        b'{"data": [1, x',
+        b'{"data": [1] x',
+        b'{"data": []} x',
+    ],
+)
+def test_parse_invalid(body: bytes):
+    """Test that invalid or incomplete responses raise a ValueError."""
+    with pytest.raises(ValueError):
+        parse(body, 4)
@@ -0,0 +1,81 @@
+"""aiowiserbyfeller model registry tests."""
+
+import pytest
+
+from aiowiserbyfeller import (
+    MODEL_REGISTRY,
+    Co2,
+    Dali,
+    DaliRgbw,
+    DaliTw,
+    Dim,
+    Load,
+    ModelRegistry,
+    Motor,
+    WiserByFellerAPI,
+)
+
+
+class Valve(Load):
+    """Load type unknown to the library."""
+
+    __slots__ = ()
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ({"type": "dim", "sub_type": ""}, Dim),
+        ({"type": "motor", "sub_type": "relay"}, Motor),
+        ({"type": "dali", "sub_type": ""}, Dali),
+        ({"type": "dali", "sub_type": "tw"}, DaliTw),
+        ({"type": "dali", "sub_type": "rgb"}, DaliRgbw),
+        ({"type": "dali", "sub_type": "unknown"}, Load),
+        ({"type": "CO2"}, Co2),
+        ({"type": "unknown"}, Load),
+    ],
+)
+def test_default_registry_lookup(data, expected):
+    """Test the classes of the default registry."""
+    assert MODEL_REGISTRY.lookup(data) is expected
+
+
+def test_register_and_unregister():
+    """Test registering classes for a type and for a single sub type."""
+    registry = MODEL_REGISTRY.copy()
+
+    registry.register(Valve, "valve")
+    registry.register(Valve, "dali", "dt8")
+
+    assert registry.lookup({"type": "valve", "sub_type": "any"}) is Valve
+    assert registry.lookup({"type": "dali", "sub_type": "dt8"}) is Valve
+    assert registry.lookup({"type": "dali", "sub_type": "tw"}) is DaliTw
+    assert MODEL_REGISTRY.lookup({"type": "valve"}) is Load
+
+    registry.unregister("valve")
+    assert registry.lookup({"type": "valve"}) is Load
+
+
+def test_api_uses_custom_registry(client_api_auth):
+    """Test that the API resolves models through its registry."""
+    registry = ModelRegistry()
+    registry.register(Valve, "valve")
+    api = WiserByFellerAPI(client_api_auth.auth, registry=registry)
+
+    assert isinstance(api.resolve_class({"type": "valve", "sub_type": ""}), Valve)
+    assert type(api.resolve_class({"type": "dim", "sub_type": ""})) is Load
+
+
+def test_registration_replaces_resolved_classes(client_api_auth):
+    """Test that classes resolved before a registration change are not reused."""
+    registry = ModelRegistry()
+    api = WiserByFellerAPI(client_api_auth.auth, registry=registry)
+    data = {"type": "valve", "sub_type": ""}
+
+    assert type(api.resolve_class(data)) is Load
+
+    registry.register(Valve, "valve")
+    assert isinstance(api.resolve_class(data), Valve)
+
+    registry.unregister("valve")
+    assert type(api.resolve_class(data)) is Load
@@ -0,0 +1,162 @@
+"""aiowiserbyfeller request coalescing tests."""
+
+import asyncio
+
+import pytest
+
+from aiowiserbyfeller import Job
+from aiowiserbyfeller.errors import UnsuccessfulRequest
+from aiowiserbyfeller.request_coalescer import (
+    RequestCoalescer,
+    is_coalescable,
+    request_key,
+)
+
+from .conftest import BASE_URL  # noqa: TID251
+
+
+def test_request_key():
+    """Test that keys are independent of parameter order."""
+    assert request_key("loads", {"a": 1, "b": 2}, True) == request_key(
+        "loads", {"b": 2, "a": 1}, True
+    )
+    assert request_key("loads", None, True) != request_key("loads", None, False)
+    assert request_key("loads", [("a", 1)], True) == request_key(
+        "loads", {"a": 1}, True
+    )
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("loads", True),
+        ("loads/state", True),
+        ("jobs/5", True),
+        ("devices/config/4", True),
+        ("jobs/5/run", False),
+        ("jobs/5/ctrl/click/toggle", False),
+        ("jobs/5/trigger", False),
+        ("jobs/5/execute", False),
+        ("jobs/5/setflags", False),
+        ("devices/00000679/ping", False),
+        ("devices/00000679/config", False),
+        ("devices/motor/calibration", False),
+        ("smartbuttons/notify", False),
+        ("scripts/hello.py/start", False),
+    ],
+)
+def test_is_coalescable(path: str, expected: bool):
+    """Test that commands sent as GET requests are not coalesced."""
+    assert is_coalescable(path) is expected
+
+
+@pytest.mark.asyncio
+async def test_coalescer_shares_result():
+    """Test that concurrent calls with the same key share one call."""
+    coalescer = RequestCoalescer()
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return [{"id": 1}]
+
+    results = await asyncio.gather(*(coalescer.run("loads", factory) for _ in range(3)))
+
+    assert calls == 1
+    assert results == [[{"id": 1}]] * 3
+    assert results[0] is not results[1]
+    assert coalescer.hits == 2
+    assert coalescer.misses == 1
+    assert coalescer.in_flight == 0
+
+    await coalescer.run("loads", factory)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescer_shares_exception():
+    """Test that an exception is raised for all waiting callers."""
+    coalescer = RequestCoalescer()
+
+    async def factory():
+        await asyncio.sleep(0.01)
+        raise UnsuccessfulRequest("boom")
+
+    results = await asyncio.gather(
+        coalescer.run("x", factory), coalescer.run("x", factory), return_exceptions=True
+    )
+
+    assert all(isinstance(r, UnsuccessfulRequest) for r in results)
+    assert coalescer.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_coalescer_leader_cancelled():
+    """Test that cancelling the first caller does not affect the others."""
+    coalescer = RequestCoalescer()
+
+    async def factory():
+        await asyncio.sleep(0.01)
+        return "data"
+
+    leader = asyncio.create_task(coalescer.run("x", factory))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(coalescer.run("x", factory))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "data"
+
+
+@pytest.mark.asyncio
+async def test_auth_coalesces_get_requests(client_api_auth, mock_aioresponse):
+    """Test that concurrent identical GET requests hit the µGateway once."""
+    response_json = {"status": "success", "data": [{"id": 1, "state": {"bri": 0}}]}
+    mock_aioresponse.get(f"{BASE_URL}/loads/state", payload=response_json)
+
+    results = await asyncio.gather(
+        client_api_auth.async_get_loads_state(),
+        client_api_auth.async_get_loads_state(),
+    )
+
+    assert results[0] == results[1] == response_json["data"]
+    assert client_api_auth.auth.coalescer.hits == 1
+    assert client_api_auth.auth.coalescer.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_auth_does_not_coalesce_writes(client_api_auth, mock_aioresponse):
+    """Test that write requests are always sent."""
+    response_json = {"status": "success", "data": {"id": 1}}
+    url = f"{BASE_URL}/loads/1"
+    mock_aioresponse.patch(url, payload=response_json)
+    mock_aioresponse.patch(url, payload=response_json)
+
+    await asyncio.gather(
+        client_api_auth.async_patch_load(1, {"name": "a"}),
+        client_api_auth.async_patch_load(1, {"name": "a"}),
+    )
+
+    assert client_api_auth.auth.coalescer.hits == 0
+    assert client_api_auth.auth.coalescer.misses == 0
+
+
+@pytest.mark.asyncio
+async def test_auth_does_not_coalesce_commands(client_api_auth, mock_aioresponse):
+    """Test that concurrent job triggers each reach the µGateway."""
+    response_json = {"status": "success", "data": {"id": 5}}
+    url = f"{BASE_URL}/jobs/5/ctrl/click/toggle"
+    mock_aioresponse.get(url, payload=response_json)
+    mock_aioresponse.get(url, payload=response_json)
+    job = Job({"id": 5}, client_api_auth.auth)
+
+    await asyncio.gather(
+        job.async_trigger_button("click", "toggle"),
+        job.async_trigger_button("click", "toggle"),
+    )
+
+    requests = [key for key in mock_aioresponse.requests if str(key[1]) == url]
+    assert len(mock_aioresponse.requests[requests[0]]) == 2
+    assert client_api_auth.auth.coalescer.misses == 0
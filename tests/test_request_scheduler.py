@@ -0,0 +1,146 @@
+"""aiowiserbyfeller request scheduler tests."""
+
+import asyncio
+
+import pytest
+
+from aiowiserbyfeller import RequestPriority, RequestScheduler
+from aiowiserbyfeller.request_scheduler import request_priority
+
+from .conftest import BASE_URL  # noqa: TID251
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("loads/1/target_state", RequestPriority.HIGH),
+        ("loads/12/ctrl", RequestPriority.HIGH),
+        ("hvacgroups/3/target_state", RequestPriority.HIGH),
+        ("jobs/4/run", RequestPriority.HIGH),
+        ("jobs/4/ctrl/click/on", RequestPriority.HIGH),
+        ("loads", RequestPriority.NORMAL),
+        ("loads/state", RequestPriority.NORMAL),
+        ("loads/1/state", RequestPriority.NORMAL),
+        ("hvacgroups/state", RequestPriority.NORMAL),
+        ("devices/*", RequestPriority.NORMAL),
+    ],
+)
+def test_request_priority(path, expected):
+    """Test default priority classification of request paths."""
+    assert request_priority(path) == expected
+
+
+def test_invalid_max_concurrency():
+    """Test that at least one concurrent request is required."""
+    with pytest.raises(ValueError):
+        RequestScheduler(0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_limits_concurrency():
+    """Test that no more than max_concurrency requests run at once."""
+    scheduler = RequestScheduler(2)
+    running = 0
+    peak = 0
+
+    async def job():
+        nonlocal running, peak
+        async with scheduler.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    await asyncio.gather(*(job() for _ in range(6)))
+
+    assert peak == 2
+    assert scheduler.in_flight == 0
+    assert scheduler.queue_depth() == 0
+    assert scheduler.stats.requests == 6
+    assert scheduler.stats.queued == 4
+    assert scheduler.stats.wait_time_max > 0
+    assert scheduler.stats.wait_time_avg > 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_serves_high_priority_first():
+    """Test that queued high priority requests preempt normal ones."""
+    scheduler = RequestScheduler(1)
+    order = []
+
+    await scheduler.acquire()
+
+    async def job(name, priority):
+        async with scheduler.slot(priority):
+            order.append(name)
+
+    tasks = [
+        asyncio.create_task(job("poll-1", RequestPriority.NORMAL)),
+        asyncio.create_task(job("poll-2", RequestPriority.NORMAL)),
+        asyncio.create_task(job("command", RequestPriority.HIGH)),
+    ]
+    await asyncio.sleep(0)
+
+    assert scheduler.queue_depth() == 3
+    assert scheduler.queue_depth(RequestPriority.HIGH) == 1
+
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order == ["command", "poll-1", "poll-2"]
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cancelled_waiter():
+    """Test that a cancelled waiter neither blocks nor leaks a slot."""
+    scheduler = RequestScheduler(1)
+    await scheduler.acquire()
+
+    waiter = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert scheduler.queue_depth() == 0
+
+    scheduler.release()
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cancelled_after_handover():
+    """Test that a slot handed to a cancelled waiter is passed on."""
+    scheduler = RequestScheduler(1)
+    await scheduler.acquire()
+
+    first = asyncio.create_task(scheduler.acquire())
+    second = asyncio.create_task(scheduler.acquire())
+    await asyncio.sleep(0)
+
+    scheduler.release()
+    first.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    await second
+    assert scheduler.in_flight == 1
+
+    scheduler.release()
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_auth_request_uses_scheduler(client_api_auth, mock_aioresponse):
+    """Test that Auth.request acquires and releases a scheduler slot."""
+    response_json = {"status": "success", "data": []}
+    mock_aioresponse.get(f"{BASE_URL}/loads", payload=response_json)
+
+    auth = client_api_auth.auth
+    await auth.request("get", "loads")
+
+    assert auth.scheduler.stats.requests == 1
+    assert auth.scheduler.in_flight == 0
@@ -0,0 +1,188 @@
+"""aiowiserbyfeller response cache tests."""
+
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+import pytest_asyncio
+
+from aiowiserbyfeller import Auth, ResponseCache, Websocket, WiserByFellerAPI
+
+from .conftest import BASE_URL, TEST_API_TOKEN  # noqa: TID251
+
+LOADS_RESPONSE = {
+    "status": "success",
+    "data": [
+        {
+            "id": 1,
+            "name": "Deckenspots",
+            "type": "dim",
+            "sub_type": "",
+            "unused": False,
+        },
+        {"id": 2, "name": "Leer", "type": "onoff", "sub_type": "", "unused": True},
+    ],
+}
+
+
+@pytest_asyncio.fixture
+async def cached_api():
+    """Initialize authenticated Api instance with response cache."""
+    async with aiohttp.ClientSession() as http:
+        auth = Auth(http, "192.168.0.1", token=TEST_API_TOKEN, cache=ResponseCache())
+        yield WiserByFellerAPI(auth)
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("loads", True),
+        ("loads/3", True),
+        ("devices/*", True),
+        ("site", True),
+        ("loads/state", False),
+        ("loads/3/state", False),
+        ("devices/0000/config", False),
+        ("hvacgroups/state", False),
+        ("time/now", False),
+    ],
+)
+def test_is_cacheable(path, expected):
+    """Test which paths are cached by default."""
+    assert ResponseCache().is_cacheable(path) is expected
+
+
+def test_cache_expires():
+    """Test that entries expire after their TTL."""
+    cache = ResponseCache({"loads": 10})
+    cache.set("k", "loads", [1], cache.generation("loads"))
+
+    assert cache.get("k") == (True, [1])
+
+    with patch("aiowiserbyfeller.response_cache.time.monotonic", return_value=1e12):
+        assert cache.get("k") == (False, None)
+
+    assert len(cache) == 0
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_cache_evicts_least_recently_used():
+    """Test size-bounded eviction."""
+    cache = ResponseCache({"loads": 10}, max_entries=2)
+    cache.set("a", "loads/1", 1, 0)
+    cache.set("b", "loads/2", 2, 0)
+    cache.get("a")
+    cache.set("c", "loads/3", 3, 0)
+
+    assert cache.get("a") == (True, 1)
+    assert cache.get("b") == (False, None)
+    assert cache.evictions == 1
+
+
+def test_cache_returns_copies():
+    """Test that callers cannot modify cached data."""
+    cache = ResponseCache({"loads": 10})
+    data = [{"id": 1}]
+    cache.set("k", "loads", data, 0)
+    data[0]["id"] = 2
+
+    _, cached = cache.get("k")
+    cached[0]["id"] = 3
+
+    assert cache.get("k") == (True, [{"id": 1}])
+
+
+def test_cache_ignores_stale_set():
+    """Test that a response fetched before an invalidation is not stored."""
+    cache = ResponseCache({"loads": 10})
+    generation = cache.generation("loads")
+    cache.invalidate("loads")
+    cache.set("k", "loads", [1], generation)
+
+    assert len(cache) == 0
+
+
+def test_cache_websocket_invalidation():
+    """Test that websocket messages invalidate matching resources."""
+    cache = ResponseCache({"loads": 10, "sensors": 10})
+    cache.set("l", "loads", [1], 0)
+    cache.set("s", "sensors", [2], 0)
+
+    cache.on_websocket_message({"load": {"id": 1, "state": {"bri": 0}}})
+    assert cache.get("l") == (True, [1])
+
+    cache.on_websocket_message({"load": {"id": 1, "name": "Neu"}})
+    assert cache.get("l") == (False, None)
+    assert cache.get("s") == (True, [2])
+
+    cache.on_websocket_message({"sensor": {"id": 1, "value": 21.5}})
+    assert cache.get("s") == (False, None)
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_reads(cached_api, mock_aioresponse):
+    """Test that repeated reads are answered from the cache."""
+    mock_aioresponse.get(f"{BASE_URL}/loads", payload=LOADS_RESPONSE)
+
+    used = await cached_api.async_get_used_loads()
+    unused = await cached_api.async_get_unused_loads()
+
+    assert [load.id for load in used] == [1]
+    assert [load.id for load in unused] == [2]
+    assert cached_api.auth.cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_write_invalidates_cache(cached_api, mock_aioresponse):
+    """Test that a successful write invalidates the resource."""
+    mock_aioresponse.get(f"{BASE_URL}/loads", payload=LOADS_RESPONSE)
+    mock_aioresponse.patch(
+        f"{BASE_URL}/loads/1", payload={"status": "success", "data": {"id": 1}}
+    )
+    mock_aioresponse.get(f"{BASE_URL}/loads", payload=LOADS_RESPONSE)
+
+    await cached_api.async_get_loads()
+    await cached_api.async_patch_load(1, {"name": "Neu"})
+    await cached_api.async_get_loads()
+
+    assert cached_api.auth.cache.hits == 0
+    assert cached_api.auth.cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_target_state_keeps_cache(cached_api, mock_aioresponse):
+    """Test that interactive commands do not invalidate definitions."""
+    mock_aioresponse.get(f"{BASE_URL}/loads", payload=LOADS_RESPONSE)
+    mock_aioresponse.put(
+        f"{BASE_URL}/loads/1/target_state",
+        payload={"status": "success", "data": {"id": 1, "target_state": {"bri": 0}}},
+    )
+
+    await cached_api.async_get_loads()
+    await cached_api.async_load_set_target_state(1, {"bri": 0})
+    await cached_api.async_get_loads()
+
+    assert cached_api.auth.cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_attached_websocket_invalidates_cache(cached_api, mock_aioresponse):
+    """Test that attaching a websocket wires up the cache invalidation."""
+    websocket = Websocket("192.168.0.1", TEST_API_TOKEN)
+    cached_api.auth.attach_websocket(websocket)
+    mock_aioresponse.get(f"{BASE_URL}/loads", payload=LOADS_RESPONSE, repeat=True)
+
+    await cached_api.async_get_loads()
+    await websocket.on_message('{"load": {"id": 1, "state": {"bri": 0}}}')
+    await cached_api.async_get_loads()
+
+    assert cached_api.auth.cache.hits == 1
+
+    await websocket.on_message('{"load": {"id": 1, "name": "Neu"}}')
+    await cached_api.async_get_loads()
+
+    assert cached_api.auth.cache.misses == 2
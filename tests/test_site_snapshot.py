@@ -0,0 +1,185 @@
+"""aiowiserbyfeller site snapshot tests."""
+
+import pytest
+
+from aiowiserbyfeller import (
+    Dim,
+    HvacGroup,
+    OnOff,
+    SiteModel,
+    SiteSnapshot,
+    SyncOrchestrator,
+)
+
+from .conftest import BASE_URL, prepare_test_authenticated  # noqa: TID251
+
+
+def load(load_id: int, name: str, load_type: str = "dim") -> dict:
+    """Return raw data of a load."""
+    return {"id": load_id, "name": name, "type": load_type, "sub_type": ""}
+
+
+def site(loads: list[dict], bri: int = 0) -> dict[str, list]:
+    """Return the responses of the site model endpoints."""
+    return {
+        "info": {"sn": "19100018", "sw": "2.0.0"},
+        "loads": loads,
+        "loads/state": [{"id": item["id"], "state": {"bri": bri}} for item in loads],
+        "sensors": [{"id": 1, "type": "temperature", "value": 21.5}],
+        "devices": [{"id": "00000679", "a": {"hw_id": "0x1202"}, "c": {}}],
+        "hvacgroups": [{"id": 4, "name": "Living", "loads": [7]}],
+        "hvacgroups/state": [{"id": 4, "state": {"on": True}}],
+        "scenes": [{"id": 2, "name": "Evening", "type": 0, "kind": 0, "job": 5}],
+        "jobs": [{"id": 5, "target_states": []}],
+        "buttons": [{"id": 8, "device": "00000679", "channel": 0}],
+        "rooms": [{"id": 9, "name": "Kitchen"}],
+    }
+
+
+async def prepare_site(mock_aioresponse, responses: dict[str, list]):
+    """Prepare the responses of the site model endpoints."""
+    for path, data in responses.items():
+        await prepare_test_authenticated(
+            mock_aioresponse,
+            f"{BASE_URL}/{path}",
+            "get",
+            {"status": "success", "data": data},
+        )
+
+
+@pytest.mark.asyncio
+async def test_site_model_fetch_and_round_trip(client_api_auth, mock_aioresponse):
+    """Test fetching a site model and hydrating it from its raw data."""
+    await prepare_site(mock_aioresponse, site([load(1, "Spots")], bri=100))
+
+    model = (await SyncOrchestrator(client_api_auth).async_run()).model
+
+    assert isinstance(model.loads[0], Dim)
+    assert model.loads[0].raw_state == {"bri": 100}
+    assert isinstance(model.hvac_groups[0], HvacGroup)
+    assert model.hvac_groups[0].raw_state == {"on": True}
+    assert model.rooms == [{"id": 9, "name": "Kitchen"}]
+    assert model.info["sn"] == "19100018"
+    assert model.entity_count == 8
+
+    restored = SiteModel.from_dict(model.to_dict(), client_api_auth)
+
+    assert restored.to_dict() == model.to_dict()
+    assert restored.devices[0].a_name == model.devices[0].a_name
+
+
+@pytest.mark.asyncio
+async def test_start_without_snapshot_fetches(
+    client_api_auth, mock_aioresponse, tmp_path
+):
+    """Test that the first start fetches the site model and saves it."""
+    path = tmp_path / "snapshot.json.gz"
+    await prepare_site(mock_aioresponse, site([load(1, "Spots")]))
+
+    snapshot = SiteSnapshot(client_api_auth, path)
+    model = await snapshot.async_start()
+
+    assert not snapshot.restored
+    assert await snapshot.async_wait_reconciled() is None
+    assert model.loads[0].name == "Spots"
+    assert path.exists()
+
+
+@pytest.mark.asyncio
+async def test_start_restores_and_reconciles(
+    client_api_auth, mock_aioresponse, tmp_path
+):
+    """Test that a restart restores the snapshot, then reconciles in place."""
+    path = tmp_path / "snapshot.json.gz"
+    await prepare_site(mock_aioresponse, site([load(1, "Spots"), load(2, "Lamp")]))
+    await SiteSnapshot(client_api_auth, path).async_start()
+
+    await prepare_site(
+        mock_aioresponse,
+        site([load(1, "Spots renamed"), load(3, "Switch", "onoff")], bri=50),
+    )
+    snapshot = SiteSnapshot(client_api_auth, path)
+    model = await snapshot.async_start()
+    spots = model.loads[0]
+
+    assert snapshot.restored
+    assert spots.name == "Spots"
+    assert [item.id for item in model.loads] == [1, 2]
+
+    result = await snapshot.async_wait_reconciled()
+
+    assert (result.added, result.removed, result.updated) == (1, 1, 1)
+    assert model.loads[0] is spots
+    assert spots.name == "Spots renamed"
+    assert spots.raw_state == {"bri": 50}
+    assert isinstance(model.loads[1], OnOff)
+
+    # The reconciled model was saved.
+    restored = await SiteSnapshot(client_api_auth, path).async_restore()
+    assert [item.name for item in restored.loads] == ["Spots renamed", "Switch"]
+
+
+@pytest.mark.asyncio
+async def test_restore_ignores_unusable_snapshots(client_api_auth, tmp_path):
+    """Test that invalid snapshots and those of other hosts are ignored."""
+    path = tmp_path / "snapshot.json.gz"
+    path.write_text("not gzip")
+
+    assert await SiteSnapshot(client_api_auth, path).async_restore() is None
+
+    snapshot = SiteSnapshot(client_api_auth, path)
+    snapshot.model = SiteModel()
+    await snapshot.async_save()
+    client_api_auth.auth.host = "192.168.0.2"
+
+    assert await SiteSnapshot(client_api_auth, path).async_restore() is None
+
+
+@pytest.mark.asyncio
+async def test_failed_reconcile_keeps_restored_model(
+    client_api_auth, mock_aioresponse, tmp_path
+):
+    """Test that a failing background reconcile keeps the restored model."""
+    path = tmp_path / "snapshot.json.gz"
+    await prepare_site(mock_aioresponse, site([load(1, "Spots")]))
+    await SiteSnapshot(client_api_auth, path).async_start()
+
+    responses = site([load(1, "Spots")])
+    del responses["loads"]
+    await prepare_site(mock_aioresponse, responses)
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads",
+        "get",
+        {"status": "error", "message": "Internal error"},
+    )
+
+    snapshot = SiteSnapshot(client_api_auth, path)
+    model = await snapshot.async_start()
+
+    assert await snapshot.async_wait_reconciled() is None
+    assert model.loads[0].name == "Spots"
+    assert list(snapshot.last_sync.errors) == ["loads"]
+    assert snapshot.last_sync.phases["load_states"].skipped
+
+
+@pytest.mark.asyncio
+async def test_unexpected_reconcile_error_is_logged(
+    client_api_auth, mock_aioresponse, tmp_path
+):
+    """Test that an unexpected error of a sync phase does not escape."""
+    path = tmp_path / "snapshot.json.gz"
+    await prepare_site(mock_aioresponse, site([load(1, "Spots")]))
+    await SiteSnapshot(client_api_auth, path).async_start()
+
+    responses = site([load(1, "Spots")])
+    del responses["loads"]
+    await prepare_site(mock_aioresponse, responses)
+    mock_aioresponse.get(f"{BASE_URL}/loads", exception=RuntimeError("Unexpected"))
+
+    snapshot = SiteSnapshot(client_api_auth, path)
+    model = await snapshot.async_start()
+
+    assert await snapshot.async_wait_reconciled() is None
+    assert model.loads[0].name == "Spots"
+    assert isinstance(snapshot.last_sync.errors["loads"], RuntimeError)
@@ -0,0 +1,116 @@
+"""aiowiserbyfeller state store tests."""
+
+import pytest
+
+from aiowiserbyfeller import Dim, Motor, StateStore, Temperature
+
+from .conftest import BASE_URL, prepare_test_authenticated  # noqa: TID251
+
+
+async def seed_store(client_api_auth, mock_aioresponse) -> StateStore:
+    """Prepare mocks and seed a state store."""
+    loads = [
+        {
+            "id": 1,
+            "name": "Deckenspots",
+            "room": 10,
+            "type": "dim",
+            "sub_type": "",
+            "device": "000004d7",
+            "channel": 0,
+            "unused": False,
+        },
+        {
+            "id": 2,
+            "name": "Storen",
+            "room": 10,
+            "type": "motor",
+            "sub_type": "",
+            "device": "000004d7",
+            "channel": 1,
+            "unused": False,
+        },
+    ]
+    load_states = [
+        {"id": 1, "state": {"bri": 0}},
+        {"id": 2, "state": {"level": 0, "tilt": 0, "moving": "stop"}},
+    ]
+    sensors = [
+        {
+            "id": 5,
+            "type": "temperature",
+            "value": 21.5,
+            "unit": "℃",
+            "device": "00008a2f",
+            "channel": 0,
+        }
+    ]
+    hvac_group_states = [{"id": 7, "state": {"on": True, "target_temperature": 21}}]
+
+    for path, data in (
+        ("loads", loads),
+        ("loads/state", load_states),
+        ("sensors", sensors),
+        ("hvacgroups/state", hvac_group_states),
+    ):
+        await prepare_test_authenticated(
+            mock_aioresponse,
+            f"{BASE_URL}/{path}",
+            "get",
+            {"status": "success", "data": data},
+        )
+
+    store = StateStore(client_api_auth)
+    await store.async_seed()
+
+    return store
+
+
+@pytest.mark.asyncio
+async def test_state_store_seed(client_api_auth, mock_aioresponse):
+    """Test seeding and lookups."""
+    store = await seed_store(client_api_auth, mock_aioresponse)
+
+    assert isinstance(store.load(1), Dim)
+    assert isinstance(store.load(2), Motor)
+    assert store.load(3) is None
+    assert store.load_state(1) == {"bri": 0}
+    assert store.load_state(3) is None
+    assert store.load_by_channel("000004d7", 1) is store.load(2)
+    assert store.load_by_channel("000004d7", 2) is None
+    assert store.loads_by_device("000004d7") == [store.load(1), store.load(2)]
+    assert store.loads_by_room(10) == store.loads
+    assert store.loads_by_room(11) == []
+    assert isinstance(store.sensor(5), Temperature)
+    assert store.sensors_by_device("00008a2f") == store.sensors
+    assert store.hvac_group_state(7) == {"on": True, "target_temperature": 21}
+
+
+@pytest.mark.asyncio
+async def test_state_store_applies_messages(client_api_auth, mock_aioresponse):
+    """Test that websocket messages update the store in place."""
+    store = await seed_store(client_api_auth, mock_aioresponse)
+    load = store.load(1)
+
+    store.on_message({"load": {"id": 1, "state": {"bri": 10000}}})
+    store.on_message({"load": {"id": 2, "state": {"moving": "down"}}})
+    store.on_message({"sensor": {"id": 5, "value": 22.0}})
+    store.on_message({"hvacgroup": {"id": 7, "state": {"target_temperature": 22}}})
+    store.on_message({"load": {"id": 99, "state": {"bri": 1}}})
+    store.on_message({"findme": {"load": 1}})
+
+    assert store.load(1) is load
+    assert load.state_bri == 10000
+    assert store.load_state(2) == {"level": 0, "tilt": 0, "moving": "down"}
+    assert store.sensor(5).value_temperature == 22.0
+    assert store.hvac_group_state(7)["target_temperature"] == 22
+    assert store.load(99) is None
+
+
+def test_state_store_apply_unknown(client_api_auth):
+    """Test that deltas for unknown entities are rejected."""
+    store = StateStore(client_api_auth)
+
+    assert store.apply_load_state(1, {"bri": 0}) is False
+    assert store.apply_sensor_data(1, {"value": 1}) is False
+    assert store.apply_hvac_group_state(1, {"on": True}) is False
@@ -0,0 +1,89 @@
+"""aiowiserbyfeller initial sync orchestrator tests."""
+
+import asyncio
+
+import pytest
+
+from aiowiserbyfeller import SyncOrchestrator, SyncPhase
+
+
+def phase(name: str, log: list, delay: float = 0, depends_on=(), error=None):
+    """Return a phase logging its start and end, returning an empty list."""
+
+    async def fetch(api):
+        log.append(f"start {name}")
+        await asyncio.sleep(delay)
+        log.append(f"end {name}")
+        if error is not None:
+            raise error
+        return []
+
+    return SyncPhase(name, fetch, depends_on)
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_in_dependency_order(client_api_auth):
+    """Test that independent phases overlap and dependents wait."""
+    log = []
+    orchestrator = SyncOrchestrator(
+        client_api_auth,
+        [
+            phase("loads", log, 0.02),
+            phase("load_states", log, depends_on=("loads",)),
+            phase("rooms", log, 0.01),
+            phase("buttons", log),
+        ],
+    )
+
+    result = await orchestrator.async_run()
+
+    assert result.ok
+    assert log[:3] == ["start loads", "start rooms", "start buttons"]
+    assert log.index("start load_states") > log.index("end loads")
+    assert result.model.rooms == []
+
+    timings = result.phases
+    assert timings["load_states"].waited >= timings["loads"].finished
+    assert timings["loads"].duration >= 0.02
+    assert result.slowest[0].name == "loads"
+    assert result.total >= timings["load_states"].finished
+    assert "load_states" in result.format_timings()
+
+
+@pytest.mark.asyncio
+async def test_failed_phase_skips_dependents(client_api_auth):
+    """Test that a failed phase skips its dependents and yields no model."""
+    log = []
+    error = RuntimeError("boom")
+    orchestrator = SyncOrchestrator(
+        client_api_auth,
+        [
+            phase("hvac_groups", log, error=error),
+            phase("hvac_group_states", log, depends_on=("hvac_groups",)),
+            phase("scenes", log),
+        ],
+    )
+
+    result = await orchestrator.async_run()
+
+    assert not result.ok
+    assert result.model is None
+    assert result.errors == {"hvac_groups": error}
+    assert result.phases["hvac_group_states"].skipped
+    assert "start hvac_group_states" not in log
+    assert "end scenes" in log
+    assert "skipped" in result.format_timings()
+
+
+def test_invalid_phases(client_api_auth):
+    """Test that unknown, later and duplicate dependencies are rejected."""
+    log = []
+
+    with pytest.raises(ValueError, match="unknown or later"):
+        SyncOrchestrator(
+            client_api_auth,
+            [phase("load_states", log, depends_on=("loads",)), phase("loads", log)],
+        )
+
+    with pytest.raises(ValueError, match="Duplicate"):
+        SyncOrchestrator(client_api_auth, [phase("loads", log), phase("loads", log)])
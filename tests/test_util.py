@@ -725,3 +725,14 @@ def test_get_device_name_by_fwid_with_blocktype(data: list):
 def test_normalize_unit(value, expected):
     """Test normalize_unit with all relevant inputs."""
     assert normalize_unit(value) == expected
+
+
+def test_memoized_parsers_return_independent_results():
+    """Test that modifying a parsed result does not affect later calls."""
+    first = parse_wiser_device_ref_c("926-3406.4.S.A.F")
+    first["type"] = "modified"
+    second = parse_wiser_device_hwid_a("0x1203")
+    second["type"] = -1
+
+    assert parse_wiser_device_ref_c("926-3406.4.S.A.F")["type"] != "modified"
+    assert parse_wiser_device_hwid_a("0x1203")["type"] == 2
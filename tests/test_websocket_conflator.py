@@ -0,0 +1,143 @@
+"""aiowiserbyfeller websocket conflation tests."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aiowiserbyfeller import Websocket
+from aiowiserbyfeller.websocket import MessageConflator
+from aiowiserbyfeller.websocket.conflator import merge_message
+
+
+def test_merge_message():
+    """Test that messages are merged field-wise."""
+    old = {"load": {"id": 1, "state": {"level": 100, "moving": "down"}}}
+    new = {"load": {"id": 1, "state": {"level": 200}}}
+
+    assert merge_message(old, new) == {
+        "load": {"id": 1, "state": {"level": 200, "moving": "down"}}
+    }
+    assert old["load"]["state"]["level"] == 100
+
+
+@pytest.mark.asyncio
+async def test_conflator_keeps_newest_per_entity():
+    """Test that only the newest message per entity is delivered."""
+    callback = Mock()
+    conflator = MessageConflator(callback, interval=10, quiet_period=10)
+
+    for bri in range(0, 10000, 1000):
+        conflator.push({"load": {"id": 1, "state": {"bri": bri}}})
+    conflator.push({"load": {"id": 2, "state": {"bri": 5}}})
+    conflator.push({"status": "ok"})
+
+    assert conflator.pending == 3
+    callback.assert_not_called()
+
+    await conflator.async_flush()
+
+    assert [c.args[0] for c in callback.call_args_list] == [
+        {"load": {"id": 1, "state": {"bri": 9000}}},
+        {"load": {"id": 2, "state": {"bri": 5}}},
+        {"status": "ok"},
+    ]
+    assert conflator.stats.received == 12
+    assert conflator.stats.delivered == 3
+    assert conflator.stats.dropped == 9
+    assert conflator.stats.merged == 1
+    assert conflator.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_conflator_flushes_when_quiet():
+    """Test that a burst is flushed after the quiet period."""
+    callback = Mock()
+    conflator = MessageConflator(callback, interval=10, quiet_period=0.01)
+
+    conflator.push({"load": {"id": 1, "state": {"bri": 1}}})
+    conflator.push({"load": {"id": 1, "state": {"bri": 2}}})
+    await asyncio.sleep(0.05)
+
+    callback.assert_called_once_with({"load": {"id": 1, "state": {"bri": 2}}})
+
+
+@pytest.mark.asyncio
+async def test_conflator_flushes_at_interval():
+    """Test that a continuous stream is flushed at the latest after the interval."""
+    callback = Mock()
+    conflator = MessageConflator(callback, interval=0.03, quiet_period=0.02)
+
+    for bri in range(10):
+        conflator.push({"load": {"id": 1, "state": {"bri": bri}}})
+        await asyncio.sleep(0.01)
+
+    assert 1 <= callback.call_count < 10
+    conflator.close()
+
+
+@pytest.mark.asyncio
+async def test_conflator_slow_async_consumer():
+    """Test that messages arriving during a slow delivery are conflated."""
+    delivered = []
+    release = asyncio.Event()
+
+    async def callback(data):
+        delivered.append(data["load"]["state"]["bri"])
+        await release.wait()
+
+    conflator = MessageConflator(callback, interval=0.01, quiet_period=0.01)
+    conflator.push({"load": {"id": 1, "state": {"bri": 0}}})
+    await asyncio.sleep(0.03)
+
+    for bri in range(1, 6):
+        conflator.push({"load": {"id": 1, "state": {"bri": bri}}})
+        await asyncio.sleep(0.02)
+
+    assert delivered == [0]
+
+    release.set()
+    await conflator.async_flush()
+
+    assert delivered == [0, 5]
+
+
+@pytest.mark.asyncio
+async def test_conflator_isolates_errors(test_logger):
+    """Test that callback errors are logged and do not stop delivery."""
+    callback = Mock(side_effect=[ValueError("boom"), None])
+    conflator = MessageConflator(
+        callback, interval=10, quiet_period=10, logger=test_logger
+    )
+
+    conflator.push({"load": {"id": 1, "state": {}}})
+    conflator.push({"load": {"id": 2, "state": {}}})
+    await conflator.async_flush()
+
+    assert callback.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_websocket_subscribe_conflated():
+    """Test the websocket integration of the conflator."""
+    ws = Websocket("host", "token")
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
+    callback = AsyncMock()
+
+    conflator = ws.subscribe_conflated(callback, interval=10, quiet_period=10)
+
+    await ws.on_message('{"load": {"id": 1, "state": {"bri": 1}}}')
+    await ws.on_message('{"load": {"id": 1, "state": {"bri": 2}}}')
+    await conflator.async_flush()
+
+    callback.assert_awaited_once_with({"load": {"id": 1, "state": {"bri": 2}}})
+
+    await ws.on_message('{"load": {"id": 1, "state": {"bri": 3}}}')
+    await ws.async_close()
+
+    assert conflator.pending == 0
+
+    # Messages after closing are ignored.
+    await ws.on_message('{"load": {"id": 1, "state": {"bri": 4}}}')
+
+    assert conflator.pending == 0
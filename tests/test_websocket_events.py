@@ -0,0 +1,91 @@
+"""aiowiserbyfeller websocket event tests."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aiowiserbyfeller import Websocket
+from aiowiserbyfeller.websocket import (
+    ButtonEvent,
+    FindMeEvent,
+    HvacGroupEvent,
+    LoadEvent,
+    SensorEvent,
+    WebsocketEvent,
+    parse_event,
+)
+from aiowiserbyfeller.websocket.events import EventStream
+
+
+def test_parse_event():
+    """Test that messages are parsed into typed events."""
+    event = parse_event({"load": {"id": 3, "state": {"bri": 500}}})
+    assert isinstance(event, LoadEvent)
+    assert event.kind == "load"
+    assert event.entity_id == 3
+    assert event.state == {"bri": 500}
+
+    event = parse_event({"sensor": {"id": 5, "value": 21.5}})
+    assert isinstance(event, SensorEvent)
+    assert event.value == 21.5
+
+    event = parse_event({"hvacgroup": {"id": 7, "state": {"on": True}}})
+    assert isinstance(event, HvacGroupEvent)
+    assert event.state == {"on": True}
+
+    event = parse_event({"findme": {"load": 345}})
+    assert isinstance(event, FindMeEvent)
+    assert event.target == "load"
+    assert event.entity_id == 345
+
+    event = parse_event({"button": {"device": "00001234", "event": "click"}})
+    assert isinstance(event, ButtonEvent)
+    assert event.entity_id == "00001234"
+    assert event.payload == {"device": "00001234", "event": "click"}
+
+    event = parse_event({"status": "ok"})
+    assert type(event) is WebsocketEvent
+    assert event.kind is None
+    assert event.data == {"status": "ok"}
+
+
+@pytest.mark.asyncio
+async def test_event_stream_backpressure():
+    """Test that a full stream makes the producer wait."""
+    stream = EventStream(queue_size=1)
+    await stream.put(parse_event({"status": "ok"}))
+
+    blocked = asyncio.create_task(stream.put(parse_event({"status": "ok"})))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    await anext(stream)
+    await blocked
+    assert stream.queued == 1
+
+    stream.close()
+    assert [event async for event in stream] == [parse_event({"status": "ok"})]
+
+
+async def collect(ws):
+    """Return all events of a websocket until it is closed."""
+    return [event async for event in ws.events()]
+
+
+@pytest.mark.asyncio
+async def test_websocket_events():
+    """Test iterating over the events of a websocket."""
+    ws = Websocket("host", "token")
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
+    consumer = asyncio.create_task(collect(ws))
+    await asyncio.sleep(0)
+
+    await ws.on_message('{"load": {"id": 1, "state": {"bri": 100}}}')
+    await ws.on_message('{"sensor": {"id": 5, "value": 20}}')
+    await asyncio.sleep(0)
+    await ws.async_close()
+    received = await asyncio.wait_for(consumer, 1)
+
+    assert [type(event) for event in received] == [LoadEvent, SensorEvent]
+    assert received[0].state == {"bri": 100}
@@ -0,0 +1,173 @@
+"""aiowiserbyfeller websocket reconnect and resync tests."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from websockets.exceptions import ConnectionClosed
+from websockets.frames import Close
+
+from aiowiserbyfeller import StateResync, Websocket
+from aiowiserbyfeller.websocket.websocket import reconnect_delay
+
+from .conftest import BASE_URL, prepare_test_authenticated  # noqa: TID251
+
+SENSOR = {
+    "id": 5,
+    "type": "temperature",
+    "value": 21.5,
+    "unit": "℃",
+    "device": "00008a2f",
+    "channel": 0,
+}
+
+
+async def prepare_states(mock_aioresponse, load_states, hvac_group_states, sensors):
+    """Prepare the bulk state responses of one resync."""
+    for path, data in (
+        ("loads/state", load_states),
+        ("hvacgroups/state", hvac_group_states),
+        ("sensors", sensors),
+    ):
+        await prepare_test_authenticated(
+            mock_aioresponse,
+            f"{BASE_URL}/{path}",
+            "get",
+            {"status": "success", "data": data},
+        )
+
+
+class FakeWebSocket:
+    """Websocket connection yielding some messages, then closing."""
+
+    def __init__(self, messages):
+        """Initialize a fake websocket."""
+        self._messages = list(messages)
+
+    def __aiter__(self):
+        """Return the message iterator."""
+        return self
+
+    async def __anext__(self):
+        """Return the next message or close the connection."""
+        if self._messages:
+            return self._messages.pop(0)
+        raise ConnectionClosed(Close(1006, "gone"), None)
+
+
+def test_reconnect_delay():
+    """Test the exponential backoff with jitter."""
+    with patch("aiowiserbyfeller.websocket.websocket.random.uniform") as uniform:
+        uniform.side_effect = lambda low, high: high
+
+        assert reconnect_delay(1, 1, 60) == 1
+        assert reconnect_delay(2, 1, 60) == 2
+        assert reconnect_delay(4, 1, 60) == 8
+        assert reconnect_delay(10, 1, 60) == 60
+
+    for _ in range(20):
+        assert 2 <= reconnect_delay(3, 1, 60) <= 4
+
+
+@pytest.mark.asyncio
+async def test_resync_emits_changed_entities(client_api_auth, mock_aioresponse):
+    """Test that only entities with changed state are returned."""
+    resync = StateResync(client_api_auth)
+
+    await prepare_states(
+        mock_aioresponse,
+        [{"id": 1, "state": {"bri": 0}}, {"id": 2, "state": {"bri": 0}}],
+        [{"id": 7, "state": {"on": True}}],
+        [SENSOR],
+    )
+    await resync.async_seed()
+    assert resync.seeded
+
+    resync.track({"load": {"id": 2, "state": {"bri": 500}}})
+
+    await prepare_states(
+        mock_aioresponse,
+        [{"id": 1, "state": {"bri": 10000}}, {"id": 2, "state": {"bri": 500}}],
+        [{"id": 7, "state": {"on": True}}],
+        [SENSOR | {"value": 22.0}],
+    )
+    messages = await resync.async_resync()
+
+    assert messages == [
+        {"load": {"id": 1, "state": {"bri": 10000}}},
+        {"sensor": SENSOR | {"value": 22.0}},
+    ]
+
+    await prepare_states(
+        mock_aioresponse,
+        [{"id": 1, "state": {"bri": 10000}}, {"id": 2, "state": {"bri": 500}}],
+        [{"id": 7, "state": {"on": False}}],
+        [SENSOR | {"value": 22.0}],
+    )
+    messages = await resync.async_resync()
+
+    assert messages == [{"hvacgroup": {"id": 7, "state": {"on": False}}}]
+
+
+@pytest.mark.asyncio
+async def test_websocket_resyncs_after_reconnect(test_logger):
+    """Test that missed changes are delivered to subscribers after a reconnect."""
+    resync = Mock(seeded=False, async_seed=AsyncMock(), track=Mock())
+    resync.async_resync = AsyncMock(
+        return_value=[{"load": {"id": 1, "state": {"bri": 10000}}}]
+    )
+    ws = Websocket(
+        "host",
+        "token",
+        logger=test_logger,
+        resync=resync,
+        reconnect_delay=0,
+        max_reconnect_attempts=1,
+    )
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
+    callback = Mock()
+    ws.subscribe(callback)
+
+    def seed():
+        resync.seeded = True
+
+    resync.async_seed.side_effect = seed
+    live = '{"load": {"id": 1, "state": {"bri": 500}}}'
+
+    with patch(
+        "aiowiserbyfeller.websocket.websocket.websockets.client.connect"
+    ) as mock_connect:
+        mock_connect.return_value.__aiter__.return_value = [
+            FakeWebSocket([live]),
+            FakeWebSocket([]),
+        ]
+        await ws.connect()
+
+    resync.async_seed.assert_awaited_once()
+    resync.async_resync.assert_awaited_once()
+    assert [c.args[0] for c in callback.call_args_list] == [
+        {"load": {"id": 1, "state": {"bri": 500}}},
+        {"load": {"id": 1, "state": {"bri": 10000}}},
+    ]
+    assert resync.track.call_count == 2
+    assert ws.is_idle()
+
+
+@pytest.mark.asyncio
+async def test_websocket_resync_errors_do_not_stop_connection(test_logger):
+    """Test that a failing resync is logged and the connection continues."""
+    resync = Mock(seeded=False)
+    resync.async_seed = AsyncMock(side_effect=RuntimeError("gateway busy"))
+    ws = Websocket("host", "token", logger=test_logger, resync=resync)
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
+    callback = Mock()
+    ws.subscribe(callback)
+
+    with patch(
+        "aiowiserbyfeller.websocket.websocket.websockets.client.connect"
+    ) as mock_connect:
+        mock_ws = AsyncMock()
+        mock_ws.__aiter__.return_value = iter(['{"status": "ok"}'])
+        mock_connect.return_value.__aiter__.return_value = iter([mock_ws])
+        await ws.connect()
+
+    callback.assert_called_once_with({"status": "ok"})
@@ -0,0 +1,197 @@
+"""aiowiserbyfeller async websocket subscriber tests."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from aiowiserbyfeller import Websocket
+from aiowiserbyfeller.websocket import AsyncSubscriber, OverflowPolicy
+
+
+def load_message(load_id, bri):
+    """Return a load state message."""
+    return {"load": {"id": load_id, "state": {"bri": bri}}}
+
+
+def test_invalid_queue_size():
+    """Test that the queue must hold at least one message."""
+    with pytest.raises(ValueError):
+        AsyncSubscriber(AsyncMock(), queue_size=0)
+
+
+@pytest.mark.asyncio
+async def test_subscriber_delivers_in_order():
+    """Test that messages are delivered in order by the worker."""
+    callback = AsyncMock()
+    subscriber = AsyncSubscriber(callback)
+
+    for bri in range(3):
+        await subscriber.put(load_message(1, bri))
+
+    await subscriber.join()
+
+    assert [c.args[0] for c in callback.await_args_list] == [
+        load_message(1, 0),
+        load_message(1, 1),
+        load_message(1, 2),
+    ]
+    assert subscriber.stats.delivered == 3
+    subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscriber_ignores_messages_after_stop():
+    """Test that a stopped subscriber does not restart its worker."""
+    callback = AsyncMock()
+    subscriber = AsyncSubscriber(callback)
+    subscriber.stop()
+
+    await subscriber.put(load_message(1, 0))
+    await asyncio.sleep(0)
+
+    assert subscriber.queued == 0
+    callback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_subscriber_drop_oldest():
+    """Test the drop oldest overflow policy."""
+    release = asyncio.Event()
+    delivered = []
+
+    async def callback(data):
+        await release.wait()
+        delivered.append(data["load"]["state"]["bri"])
+
+    subscriber = AsyncSubscriber(
+        callback, queue_size=2, overflow=OverflowPolicy.DROP_OLDEST
+    )
+    await subscriber.put(load_message(1, 0))
+    await asyncio.sleep(0)  # worker picks up the first message
+
+    for bri in range(1, 5):
+        await subscriber.put(load_message(1, bri))
+
+    assert subscriber.queued == 2
+    assert subscriber.stats.dropped == 2
+
+    release.set()
+    await subscriber.join()
+
+    assert delivered == [0, 3, 4]
+    subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscriber_conflate():
+    """Test the conflate overflow policy."""
+    release = asyncio.Event()
+    delivered = []
+
+    async def callback(data):
+        await release.wait()
+        delivered.append(data)
+
+    subscriber = AsyncSubscriber(callback, overflow=OverflowPolicy.CONFLATE)
+    await subscriber.put(load_message(1, 0))
+    await asyncio.sleep(0)
+
+    await subscriber.put(load_message(1, 1))
+    await subscriber.put(load_message(2, 1))
+    await subscriber.put(load_message(1, 2))
+
+    assert subscriber.queued == 2
+    assert subscriber.stats.conflated == 1
+
+    release.set()
+    await subscriber.join()
+
+    assert delivered == [load_message(1, 0), load_message(1, 2), load_message(2, 1)]
+    subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscriber_block():
+    """Test that the block overflow policy waits for free space."""
+    release = asyncio.Event()
+
+    async def callback(data):
+        await release.wait()
+
+    subscriber = AsyncSubscriber(callback, queue_size=1)
+    await subscriber.put(load_message(1, 0))
+    await asyncio.sleep(0)
+    await subscriber.put(load_message(1, 1))
+
+    blocked = asyncio.create_task(subscriber.put(load_message(1, 2)))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await blocked
+    await subscriber.join()
+
+    assert subscriber.stats.delivered == 3
+    assert subscriber.stats.dropped == 0
+    subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_subscriber_isolates_errors(test_logger):
+    """Test that callback errors are reported and do not stop the worker."""
+    callback = AsyncMock(side_effect=[ValueError("boom"), None])
+    on_error = Mock()
+    subscriber = AsyncSubscriber(callback, on_error=on_error, logger=test_logger)
+
+    await subscriber.put(load_message(1, 0))
+    await subscriber.put(load_message(1, 1))
+    await subscriber.join()
+
+    assert subscriber.stats.errors == 1
+    assert subscriber.stats.delivered == 1
+    on_error.assert_called_once()
+    assert isinstance(on_error.call_args.args[0], ValueError)
+    subscriber.stop()
+
+
+@pytest.mark.asyncio
+async def test_websocket_slow_subscriber_does_not_block_others(test_logger):
+    """Test that a slow subscriber does not delay message intake."""
+    ws = Websocket("host", "token", logger=test_logger)
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
+    release = asyncio.Event()
+
+    async def slow(data):
+        await release.wait()
+
+    fast = AsyncMock()
+    ws.async_subscribe(slow)
+    ws.async_subscribe(fast)
+
+    for bri in range(5):
+        await ws.on_message(f'{{"load": {{"id": 1, "state": {{"bri": {bri}}}}}}}')
+
+    await asyncio.sleep(0.01)
+    assert fast.await_count == 5
+
+    release.set()
+    await ws.async_join()
+    await ws.async_close()
+
+
+@pytest.mark.asyncio
+async def test_websocket_sync_subscriber_errors_isolated(test_logger):
+    """Test that errors of sync subscribers do not escape on_message."""
+    on_error = Mock()
+    ws = Websocket("host", "token", logger=test_logger, on_subscriber_error=on_error)
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
+    failing = Mock(side_effect=RuntimeError("boom"))
+    working = Mock()
+    ws.subscribe(failing)
+    ws.subscribe(working)
+
+    await ws.on_message('{"status": "ok"}')
+
+    working.assert_called_once_with({"status": "ok"})
+    on_error.assert_called_once()
@@ -12,6 +12,7 @@ from websockets.exceptions import (
 from websockets.frames import Close
 
 from aiowiserbyfeller import Websocket, WebsocketWatchdog
+from aiowiserbyfeller.websocket import classify_message
 
 
 @pytest.mark.asyncio
@@ -57,6 +58,7 @@ async def test_on_message_triggers_subscribers():
 
     test_message = '{"status": "ok"}'
     await ws.on_message(test_message)
+    await ws.async_join()
 
     sync_cb.assert_called_once_with({"status": "ok"})
     async_cb.assert_awaited_once_with({"status": "ok"})
@@ -87,7 +89,7 @@ async def test_connect_receives_message(mock_connect):
     ws.subscribe(sync_cb)
 
     # Patch watchdog to prevent timeout complications
-    ws._watchdog = AsyncMock()  # noqa: SLF001
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
 
     await ws.connect()
 
@@ -96,21 +98,24 @@ async def test_connect_receives_message(mock_connect):
 
 
 @pytest.mark.asyncio
-async def test_watchdog_trigger_cancels_previous(test_logger):
-    """Test that watchdog cancels previous timeouts when triggered."""
+async def test_watchdog_trigger_postpones_expiration(test_logger):
+    """Test that activity postpones the expiration without a new timer."""
     action = AsyncMock()
-    watchdog = WebsocketWatchdog(logger=test_logger, action=action, timeout_seconds=0.5)
+    watchdog = WebsocketWatchdog(logger=test_logger, action=action, timeout_seconds=0.2)
 
     await watchdog.trigger()
     first_timer = watchdog._timer_task  # noqa: SLF001
 
     await asyncio.sleep(0.1)
-    await watchdog.trigger()  # This should cancel the first timer
-    second_timer = watchdog._timer_task  # noqa: SLF001
+    watchdog.touch()
+    assert watchdog._timer_task is first_timer  # noqa: SLF001
 
-    assert first_timer.cancelled(), "First timer should be cancelled"
-    assert second_timer is not None
-    assert first_timer is not second_timer
+    await asyncio.sleep(0.15)  # first deadline passed, re-armed for the rest
+    action.assert_not_called()
+    assert not first_timer.cancelled()
+
+    await asyncio.sleep(0.1)
+    action.assert_called_once()
 
 
 @patch("aiowiserbyfeller.websocket.websocket.websockets.client.connect")
@@ -122,14 +127,35 @@ async def test_connect_handles_connection_closed(mock_connect, test_logger):
     mock_ws.__aiter__.side_effect = ConnectionClosedOK(Close(1000, "closed"), None)
     mock_connect.return_value.__aiter__.return_value = iter([mock_ws])
 
-    ws = Websocket("host", "token", logger=test_logger)
-    ws._watchdog = AsyncMock()  # noqa: SLF001
+    ws = Websocket("host", "token", logger=test_logger, reconnect_delay=0)
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
 
     with patch.object(ws, "_logger") as mock_logger:
         await ws.connect()
         assert mock_logger.warning.called
 
 
+@patch("aiowiserbyfeller.websocket.websocket.websockets.client.connect")
+@pytest.mark.asyncio
+async def test_not_connected_while_reconnecting(mock_connect, test_logger):
+    """Test that the websocket is not connected during the reconnect delay."""
+    mock_ws = AsyncMock()
+    mock_ws.__aiter__.side_effect = ConnectionClosedOK(Close(1000, "closed"), None)
+    mock_connect.return_value.__aiter__.return_value = iter([mock_ws])
+
+    ws = Websocket("host", "token", logger=test_logger, reconnect_delay=10)
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
+    task = asyncio.create_task(ws.connect())
+    await asyncio.sleep(0.01)
+
+    assert not ws.is_idle()
+    assert not ws.connected
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
 @patch("aiowiserbyfeller.websocket.websocket.websockets.client.connect")
 @pytest.mark.asyncio
 async def test_connect_handles_websocket_exception(mock_connect, test_logger):
@@ -139,7 +165,7 @@ async def test_connect_handles_websocket_exception(mock_connect, test_logger):
     mock_connect.side_effect = WebSocketException("fail")
 
     ws = Websocket("host", "token", logger=test_logger)
-    ws._watchdog = AsyncMock()  # noqa: SLF001
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
 
     with patch.object(ws, "on_error") as mock_on_error:
         await ws.connect()
@@ -215,6 +241,44 @@ async def test_async_close_swallows_close_exception():
     ws._watchdog.cancel.assert_called_once()  # noqa: SLF001
 
 
+@patch("aiowiserbyfeller.websocket.websocket.websockets.client.connect")
+@pytest.mark.asyncio
+async def test_async_close_ends_connect_without_reconnect(mock_connect, test_logger):
+    """Test that closing ends the connect() task instead of reconnecting."""
+
+    class FakeConnection:
+        def __init__(self):
+            self.closed = asyncio.Event()
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            await self.closed.wait()
+            raise ConnectionClosedOK(Close(1000, "closed"), None)
+
+        async def close(self):
+            self.closed.set()
+
+    connections = [FakeConnection(), FakeConnection()]
+    mock_connect.return_value.__aiter__.return_value = iter(connections)
+
+    ws = Websocket("host", "token", logger=test_logger, reconnect_delay=0)
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
+    task = asyncio.create_task(ws.connect())
+    await asyncio.sleep(0)
+
+    assert ws.connected
+
+    await ws.async_close()
+    await asyncio.wait_for(task, 1)
+
+    assert not ws.connected
+    assert ws.is_idle()
+    assert ws._connections == 1  # noqa: SLF001
+    assert not connections[1].closed.is_set()
+
+
 @patch("aiowiserbyfeller.websocket.websocket.asyncio.create_task")
 def test_websocket_init_starts_connection(mock_create_task, test_logger):
     """Test that init() does start a connection."""
@@ -242,8 +306,8 @@ async def test_websocket_stops_after_10_failures(mock_connect, test_logger):
     # Simulate 11 websocket instances (each closes immediately)
     mock_connect.return_value.__aiter__.return_value = [FakeWebSocket()] * 11
 
-    ws = Websocket("host", "token", logger=test_logger)
-    ws._watchdog = AsyncMock()  # noqa: SLF001
+    ws = Websocket("host", "token", logger=test_logger, reconnect_delay=0)
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
 
     with patch.object(ws._logger, "error") as mock_log_error:  # noqa: SLF001
         await ws.connect()
@@ -266,8 +330,95 @@ async def test_websocket_exception_triggers_on_error(mock_connect, test_logger):
     mock_connect.return_value = FailingAsyncIterable()
 
     ws = Websocket("host", "token", logger=test_logger)
-    ws._watchdog = AsyncMock()  # noqa: SLF001
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
 
     with patch.object(ws, "on_error", return_value=None) as mock_on_error:
         await ws.connect()
         mock_on_error.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ({"load": {"id": 3, "state": {"bri": 0}}}, ("load", 3)),
+        ({"sensor": {"id": 5, "value": 21.5}}, ("sensor", 5)),
+        ({"hvacgroup": {"id": 7, "state": {}}}, ("hvacgroup", 7)),
+        ({"findme": {"load": 345}}, ("findme", 345)),
+        (
+            {"findme": {"button": {"device": "00abc", "channel": 0}}},
+            ("findme", "00abc"),
+        ),
+        ({"button": {"device": "00abc", "channel": 0}}, ("button", "00abc")),
+        ({"button": {"id": 12, "device": "00abc"}}, ("button", 12)),
+        ({"status": "ok"}, (None, None)),
+        ([], (None, None)),
+    ],
+)
+def test_classify_message(data, expected):
+    """Test websocket message classification."""
+    assert classify_message(data) == expected
+
+
+@pytest.mark.asyncio
+async def test_on_message_topic_dispatch():
+    """Test that topic subscribers only receive matching messages."""
+    ws = Websocket("host", "token")
+    ws._watchdog = Mock(trigger=AsyncMock())  # noqa: SLF001
+
+    all_loads = Mock()
+    load_3 = AsyncMock()
+    sensors = Mock()
+    broadcast = Mock()
+
+    ws.subscribe(broadcast)
+    ws.subscribe_topic("load", all_loads)
+    unsubscribe = ws.async_subscribe_topic("load", load_3, entity_id=3)
+    ws.subscribe_topic("sensor", sensors)
+
+    await ws.on_message('{"load": {"id": 3, "state": {"bri": 0}}}')
+    await ws.on_message('{"load": {"id": 4, "state": {"bri": 0}}}')
+    await ws.async_join()
+
+    assert all_loads.call_count == 2
+    load_3.assert_awaited_once_with({"load": {"id": 3, "state": {"bri": 0}}})
+    sensors.assert_not_called()
+    assert broadcast.call_count == 2
+
+    unsubscribe()
+    unsubscribe()
+    await ws.on_message('{"load": {"id": 3, "state": {"bri": 1}}}')
+    await ws.async_join()
+
+    load_3.assert_awaited_once()
+    assert all_loads.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_ping_measures_round_trip_time(test_logger):
+    """Test that pings measure the round-trip time and count as activity."""
+    ws = Websocket("host", "token", logger=test_logger, ping_interval=0.01)
+    ws._watchdog = Mock()  # noqa: SLF001
+    connection = Mock()
+
+    async def ping():
+        pong = asyncio.get_running_loop().create_future()
+        pong.set_result(None)
+        return pong
+
+    connection.ping = ping
+    assert ws.ping_rtt is None
+
+    pinger = ws._start_pinger(connection)  # noqa: SLF001
+    await asyncio.sleep(0.05)
+    pinger.cancel()
+
+    assert ws.ping_rtt is not None
+    assert ws.ping_rtt >= 0
+    ws._watchdog.touch.assert_called()  # noqa: SLF001
+
+
+def test_pinger_disabled_by_default():
+    """Test that no ping task is started without ping interval."""
+    ws = Websocket("host", "token")
+
+    assert ws._start_pinger(Mock()) is None  # noqa: SLF001
@@ -0,0 +1,138 @@
+"""aiowiserbyfeller write coalescer tests."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+
+from aiowiserbyfeller import Auth, Dim, Motor, WriteCoalescer
+
+from .conftest import BASE_URL, TEST_API_TOKEN, prepare_test_authenticated  # noqa: TID251
+
+
+@pytest.mark.asyncio
+async def test_writes_within_window_are_merged():
+    """Test that writes to the same key are merged into one send."""
+    coalescer = WriteCoalescer(window=0.01)
+    send = AsyncMock(side_effect=lambda data: {"sent": data})
+
+    results = await asyncio.gather(
+        coalescer.write("a", {"level": 100}, send),
+        coalescer.write("a", {"tilt": 3}, send),
+        coalescer.write("a", {"level": 200}, send),
+        coalescer.write("b", {"bri": 1}, send),
+    )
+
+    assert send.await_count == 2
+    assert results[0] == results[1] == results[2]
+    assert results[0] == {"sent": {"level": 200, "tilt": 3}}
+    assert results[0] is not results[1]
+    assert results[3] == {"sent": {"bri": 1}}
+    assert coalescer.received == 4
+    assert coalescer.sent == 2
+
+
+@pytest.mark.asyncio
+async def test_write_errors_are_passed_to_all_callers():
+    """Test that a failed send raises in every waiting caller."""
+    coalescer = WriteCoalescer(window=0.01)
+    send = AsyncMock(side_effect=RuntimeError("boom"))
+
+    results = await asyncio.gather(
+        coalescer.write("a", {"bri": 1}, send),
+        coalescer.write("a", {"bri": 2}, send),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    send.assert_awaited_once_with({"bri": 2})
+
+
+@pytest.mark.asyncio
+async def test_writes_to_same_key_are_sent_in_order():
+    """Test that a new window waits for the previous write in flight."""
+    coalescer = WriteCoalescer(window=0.001)
+    release = asyncio.Event()
+    sent = []
+
+    async def send(data):
+        sent.append(("start", data["bri"]))
+        if data["bri"] == 1:
+            await release.wait()
+        sent.append(("end", data["bri"]))
+        return data
+
+    first = asyncio.create_task(coalescer.write("a", {"bri": 1}, send))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(coalescer.write("a", {"bri": 2}, send))
+    await asyncio.sleep(0.01)
+    assert sent == [("start", 1)]
+
+    release.set()
+    await asyncio.gather(first, second)
+    assert sent == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+
+
+@pytest.mark.asyncio
+async def test_async_flush():
+    """Test that pending writes can be sent without waiting for the window."""
+    coalescer = WriteCoalescer(window=10)
+    send = AsyncMock(return_value={})
+
+    write = asyncio.create_task(coalescer.write("a", {"bri": 1}, send))
+    await asyncio.sleep(0)
+    assert coalescer.pending == 1
+
+    await coalescer.async_flush()
+
+    assert await write == {}
+    assert coalescer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_load_target_state_coalescing(mock_aioresponse):
+    """Test that rapid load writes result in one request."""
+    async with aiohttp.ClientSession() as http:
+        auth = Auth(
+            http, "192.168.0.1", token=TEST_API_TOKEN, write_coalescing_window=0.01
+        )
+        await prepare_test_authenticated(
+            mock_aioresponse,
+            f"{BASE_URL}/loads/3/target_state",
+            "put",
+            {
+                "status": "success",
+                "data": {"id": 3, "target_state": {"level": 5000, "tilt": 4}},
+            },
+            {"level": 5000, "tilt": 4},
+        )
+
+        motor = Motor({"id": 3}, auth)
+        other = Motor({"id": 3}, auth)
+        await asyncio.gather(
+            motor.async_set_level(1000),
+            motor.async_set_level(5000),
+            other.async_set_tilt(4),
+        )
+
+        assert motor.raw_state == {"level": 5000, "tilt": 4}
+        assert other.raw_state == {"level": 5000, "tilt": 4}
+        assert auth.write_coalescer.sent == 1
+
+
+@pytest.mark.asyncio
+async def test_load_without_coalescing(client_api_auth, mock_aioresponse):
+    """Test that writes are sent directly without coalescing window."""
+    assert client_api_auth.auth.write_coalescer is None
+
+    await prepare_test_authenticated(
+        mock_aioresponse,
+        f"{BASE_URL}/loads/2/target_state",
+        "put",
+        {"status": "success", "data": {"id": 2, "target_state": {"bri": 5}}},
+        {"bri": 5},
+    )
+
+    load = Dim({"id": 2}, client_api_auth.auth)
+    assert await load.async_set_bri(5) == {"bri": 5}